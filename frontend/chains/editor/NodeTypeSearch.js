@@ -146,6 +146,12 @@ const NodeTypeSearchBadge = ({ type, onRemove }) => {
   );
 };
 
+// Typing searches with full text search. Hybrid search (full text + vector
+// similarity) embeds the search text so it's only used when the search is
+// submitted with enter. See get_node_types.
+const SEARCH_MODE = "text";
+const SUBMIT_SEARCH_MODE = "hybrid";
+
 /**
  * Provides a search widget including a search bar and a list of components.
  * Searching queries SearchNodeTypeQuery
@@ -172,11 +178,11 @@ export const NodeTypeSearch = ({ initialFocusRef }) => {
       if (selectedConnector && query.search === "") {
         // load immediately if there is a selected connector
         // since it indicates the user is not typing
-        load(query);
+        load({ ...query, mode: SEARCH_MODE });
       } else {
         // typing should always be debounced even
         // if there is a selected connector
-        debouncedLoad(query);
+        debouncedLoad({ ...query, mode: SEARCH_MODE });
       }
     } else {
       clearLoad();
@@ -203,6 +209,17 @@ export const NodeTypeSearch = ({ initialFocusRef }) => {
     setQuery((prev) => ({ ...prev, search: event.target.value }));
   }, []);
 
+  // submitting the search replaces the pending text search with hybrid search
+  const onSearchKeyDown = useCallback(
+    (event) => {
+      if (event.key === "Enter" && query.search) {
+        clearLoad();
+        load({ ...query, mode: SUBMIT_SEARCH_MODE });
+      }
+    },
+    [query, load, clearLoad]
+  );
+
   const handleTypeChange = useCallback(
     (types) => {
       setQuery((prev) => ({ ...prev, types }));
@@ -234,6 +251,7 @@ export const NodeTypeSearch = ({ initialFocusRef }) => {
         <InputGroup>
           <Input
             onChange={onSearchChange}
+            onKeyDown={onSearchKeyDown}
             placeholder="search components"
             mt={2}
             mb={2}
@@ -15,6 +15,18 @@ export const RunEventSubscription = graphql`
           outputs
           message
         }
+        ... on ExecutionBatchType {
+          executions {
+            id
+            nodeId
+            startedAt
+            finishedAt
+            completed
+            inputs
+            outputs
+            message
+          }
+        }
         ... on RunStartType {
           taskId
         }
@@ -3,6 +3,17 @@ import { RunEventSubscription } from "chains/editor/run_log/RunEventSubscription
 import { requestSubscription } from "react-relay";
 import environment from "relay-environment";
 
+const formatExecution = (execution) => ({
+  id: execution.id,
+  node_id: execution.nodeId,
+  started_at: execution.startedAt,
+  finished_at: execution.finishedAt,
+  completed: execution.completed,
+  inputs: execution.inputs,
+  outputs: execution.outputs,
+  message: execution.message,
+});
+
 export const useRunEventStream = (
   chain_id,
   { onRunStart, onExecutionUpdate } = {}
@@ -28,17 +39,14 @@ export const useRunEventStream = (
             const eventType = event.getType();
             const eventData = data.runEventSubscription.event;
             if (eventType === "ExecutionType" && onExecutionUpdate) {
-              const formatted = {
-                id: eventData.id,
-                node_id: eventData.nodeId,
-                started_at: eventData.startedAt,
-                finished_at: eventData.finishedAt,
-                completed: eventData.completed,
-                inputs: eventData.inputs,
-                outputs: eventData.outputs,
-                message: eventData.message,
-              };
-              onExecutionUpdate(formatted);
+              onExecutionUpdate(formatExecution(eventData));
+            } else if (
+              eventType === "ExecutionBatchType" &&
+              onExecutionUpdate
+            ) {
+              eventData.executions.forEach((execution) =>
+                onExecutionUpdate(formatExecution(execution))
+              );
             } else if (eventType === "RunStartType" && onRunStart) {
               onRunStart({ task_id: eventData.taskId });
             }
@@ -20,6 +20,7 @@ const chatMessageTokenSubscription = graphql`
     chatMessageTokenSubscription(chatId: $chatId) {
       msgId
       index
+      endIndex
       text
     }
   }
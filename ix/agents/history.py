@@ -3,6 +3,7 @@ from functools import cached_property
 from typing import Dict, Any, Optional, Union
 from uuid import UUID
 
+from ix.task_log.history import EXCLUDED_MSG_TYPES, message_history_cache
 from ix.task_log.models import Task, TaskLogMessage
 
 logger = logging.getLogger(__name__)
@@ -19,14 +20,7 @@ class TaskHistory:
     ALLOWS_AUTONOMOUS = True
 
     # Messages useful for humans and debugging, but aren't included in the prompt context
-    EXCLUDED_MSG_TYPES = {
-        "AUTH_REQUEST",
-        "AUTHORIZE",
-        "AUTONOMOUS",
-        "FEEDBACK_REQUEST",
-        "THOUGHT",
-        "SYSTEM",
-    }
+    EXCLUDED_MSG_TYPES = EXCLUDED_MSG_TYPES
 
     def __init__(self, task_id: str) -> None:
         self.task_id = task_id
@@ -43,64 +37,28 @@ class TaskHistory:
     def task(self):
         return Task.objects.get(pk=self.task_id)
 
-    def query_message_history(self, since=None):
-        """Fetch message history from persistent store for context relevant messages"""
-
-        # base query, selects messages relevant for chat context
-        query = TaskLogMessage.objects.filter(task_id=self.task_id).order_by(
-            "created_at"
-        )
-
-        # filter to only new messages
-        if since:
-            query = query.filter(created_at__gt=since)
-
-        return query
-
     def update_message_history(self):
         """
         Update message history with the most recent messages since the last update.
-        Initial startup will load all history into memory. Subsequent updates will
-        only load new messages.
+        History is served from the task's window in `message_history_cache`, which
+        only reads messages written since it was last updated and is limited to
+        MESSAGE_HISTORY_TOKEN_BUDGET.
         """
-
-        last_message_at = self.last_message.created_at if self.last_message else None
+        window = message_history_cache.update(self.task_id)
+        self.history = list(window.messages)
         logger.debug(
-            f"AgentProcess updating message history, last_message_at={last_message_at}"
+            f"AgentProcess loaded n={len(self.history)} chat messages "
+            f"tokens={window.total_tokens}"
         )
 
-        # fetch unseen messages and save the last timestamp for the next iteration
-        messages = list(self.query_message_history(last_message_at))
-        if messages:
-            self.last_message = messages[-1]
-        logger.debug(
-            f"AgentProcess fetched n={len(messages)} messages from persistence"
-        )
-
-        # process AUTONOMOUS messages if supported by the agent
         # toggle autonomous mode based on latest AUTONOMOUS message
-        if self.ALLOWS_AUTONOMOUS:
-            for message in reversed(messages):
-                if message.content["type"] == "AUTONOMOUS":
-                    autonomous = message.content["enabled"]
-                    if autonomous != self.autonomous:
-                        self.autonomous = autonomous
-                        logger.info(
-                            f"AgentProcess toggled autonomous mode to {autonomous}"
-                        )
-                    break
-
-        # format all message instance for use in the prompt
-        formatted_messages = [
-            message.as_message()
-            for message in messages
-            if message.content["type"] not in self.EXCLUDED_MSG_TYPES
-        ]
-        self.add_history(*formatted_messages)
-
-        logger.info(
-            f"AgentProcess loaded n={len(messages)} chat messages from persistence"
-        )
+        # if supported by the agent
+        if self.ALLOWS_AUTONOMOUS and window.autonomous is not None:
+            if window.autonomous != self.autonomous:
+                self.autonomous = window.autonomous
+                logger.info(
+                    f"AgentProcess toggled autonomous mode to {self.autonomous}"
+                )
 
     def get_input(self, input_id: Optional[UUID] = None) -> Union[Dict[str, Any], bool]:
         """get input for chain"""
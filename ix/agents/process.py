@@ -1,7 +1,6 @@
 import logging
 from typing import TypedDict, Optional, Any, Dict
 
-from asgiref.sync import sync_to_async
 from langchain.schema.runnable import RunnableConfig
 
 from ix.agents.models import Agent
@@ -9,6 +8,7 @@ from ix.chains.callbacks import IxHandler
 from ix.chains.loaders.context import IxContext
 from ix.chains.models import Chain as ChainModel
 from ix.runnable_log.subscription import RunEventSubscription
+from ix.runnable_log.writer import aflush_log
 from ix.task_log.models import Task
 
 
@@ -56,8 +56,7 @@ class AgentProcess:
         RunEventSubscription.on_run(chain_id=self.chain.id, task_id=handler.root_id)
 
         try:
-            # TODO: chain loading needs to be made async
-            chain = await sync_to_async(self.chain.load_chain)(context=context)
+            chain = await self.chain.aload_chain(context=context)
 
             logger.info(
                 f"Sending request to chain={self.chain.name} prompt={user_input}"
@@ -76,3 +75,6 @@ class AgentProcess:
             # validation errors aren't caught by callbacks.
             await handler.send_error_msg(e)
             return None
+        finally:
+            # write any buffered execution logs for this run
+            await aflush_log()
@@ -39,26 +39,6 @@ class TestAgentProcessHistory(MessageTeardown):
         assert len(agent_process.history) >= 1
         assert agent_process.history[-1] == msg.as_message()
 
-    def test_query_message_history_without_since(self, task):
-        """Test querying all messages"""
-        msg1 = fake_task_log_msg(task=task)
-        msg2 = fake_task_log_msg(task=task)
-        agent_process = TaskHistory(task_id=task.id)
-        messages = agent_process.query_message_history()
-        assert messages.count() == 2
-        assert messages.filter(id=msg1.id).exists()
-        assert messages.filter(id=msg2.id).exists()
-
-    def test_query_message_history_with_since(self, task):
-        """Test querying new messages"""
-        msg1 = fake_task_log_msg(task=task)
-        msg2 = fake_task_log_msg(task=task)
-        agent_process = TaskHistory(task_id=task.id)
-        messages = agent_process.query_message_history(since=msg1.created_at)
-        assert messages.count() == 1
-        assert not messages.filter(id=msg1.id).exists()
-        assert messages.filter(id=msg2.id).exists()
-
     def test_update_message_history_no_messages(self, task):
         """initializing history before there are messages"""
         agent_process = TaskHistory(task_id=task.id)
@@ -2,17 +2,19 @@ from uuid import UUID
 
 from asgiref.sync import sync_to_async
 from django.db.models import Q
-from fastapi import HTTPException, APIRouter, Depends
-from fastapi.responses import FileResponse
-from typing import Optional
+from fastapi import HTTPException, APIRouter, Depends, Request
+from typing import Optional, Union
 from ix.api.artifacts.types import (
     Artifact as ArtifactPydantic,
     ArtifactCreate,
     ArtifactUpdate,
     ArtifactPage,
+    ArtifactCursorPage,
 )
 from ix.task_log.models import Artifact
 from ix.api.auth import get_request_user
+from ix.api.files import file_response
+from ix.utils.graphene.pagination import CountMode
 
 
 router = APIRouter()
@@ -38,14 +40,24 @@ async def get_artifact(artifact_id: str, user=Depends(get_request_user)):
     return ArtifactPydantic.model_validate(artifact)
 
 
-@router.get("/artifacts/", response_model=ArtifactPage, tags=["Artifacts"])
+@router.get(
+    "/artifacts/",
+    response_model=Union[ArtifactPage, ArtifactCursorPage],
+    tags=["Artifacts"],
+)
 async def get_artifacts(
     chat_id: Optional[UUID] = None,
     search: Optional[str] = None,
     limit: int = 10,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    count: CountMode = "none",
     user=Depends(get_request_user),
 ):
+    """
+    List artifacts. Pages are read by offset unless `cursor` is set, newest first.
+    Pass an empty cursor for the first page and `next_cursor` after that.
+    """
     query = (
         Artifact.objects.filter(Q(name__icontains=search) | Q(key__icontains=search))
         if search
@@ -55,6 +67,16 @@ async def get_artifacts(
     if chat_id:
         query = query.filter(task__leading_chats__id=chat_id)
 
+    if cursor is not None:
+        return await ArtifactCursorPage.apaginate(
+            output_model=ArtifactPydantic,
+            queryset=query,
+            ordering=("-created_at", "-id"),
+            limit=limit,
+            cursor=cursor,
+            count=count,
+        )
+
     # punting on async implementation of pagination until later
     return await sync_to_async(ArtifactPage.paginate)(
         output_model=ArtifactPydantic, queryset=query, limit=limit, offset=offset
@@ -86,10 +108,17 @@ async def update_artifact(
             "content": {"application/octet-stream": {}},
             "description": "Download the artifact",
         },
+        206: {
+            "content": {"application/octet-stream": {}},
+            "description": "Download the requested range of the artifact",
+        },
         404: {"description": "Artifact not found"},
+        416: {"description": "Requested range not satisfiable"},
     },
 )
-async def download_artifact(artifact_id: str, user=Depends(get_request_user)):
+async def download_artifact(
+    artifact_id: str, request: Request, user=Depends(get_request_user)
+):
     try:
         query = Artifact.objects.filter(pk=artifact_id)
         artifact = await Artifact.filter_owners(user, query).aget()
@@ -99,6 +128,4 @@ async def download_artifact(artifact_id: str, user=Depends(get_request_user)):
     file_path = artifact.storage["id"]
     file_name = file_path.split("/")[-1]
 
-    return FileResponse(
-        file_path, media_type="application/octet-stream", filename=file_name
-    )
+    return await file_response(request, file_path, filename=file_name)
@@ -2,7 +2,7 @@ from pydantic import BaseModel, UUID4
 from typing import Dict, Any, List
 from datetime import datetime
 
-from ix.utils.graphene.pagination import QueryPage
+from ix.utils.graphene.pagination import CursorPage, QueryPage
 
 
 class ArtifactBase(BaseModel):
@@ -37,3 +37,8 @@ class ArtifactContent(Artifact):
 class ArtifactPage(QueryPage[Artifact]):
     # override objects, FastAPI isn't detecting QueryPage type
     objects: List[Artifact]
+
+
+class ArtifactCursorPage(CursorPage[Artifact]):
+    # override objects, FastAPI isn't detecting CursorPage type
+    objects: List[Artifact]
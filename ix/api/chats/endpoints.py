@@ -3,7 +3,7 @@ import re
 from asgiref.sync import sync_to_async
 from django.contrib.auth.models import AbstractUser
 from fastapi import APIRouter, HTTPException
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from uuid import UUID
 
 from django.db.models import Q
@@ -29,12 +29,16 @@ from ix.api.chats.types import (
     ChatInput,
     ChatInList,
     ChatQueryPage,
+    ChatCursorPage,
     ChatMessageQueryPage,
+    ChatMessageCursorPage,
 )
+from ix.task_log.history import message_history_cache
 from ix.task_log.models import UserFeedback, TaskLogMessage
 from ix.task_log.tasks.agent_runner import (
     start_agent_loop,
 )
+from ix.utils.graphene.pagination import CountMode
 
 
 logger = logging.getLogger(__name__)
@@ -92,18 +96,36 @@ async def get_chat(chat_id: UUID, user: AbstractUser = Depends(get_request_user)
     return ChatPydantic.model_validate(chat)
 
 
-@router.get("/chats/", response_model=ChatQueryPage, tags=["Chats"])
+@router.get(
+    "/chats/", response_model=Union[ChatQueryPage, ChatCursorPage], tags=["Chats"]
+)
 async def get_chats(
     user: AbstractUser = Depends(get_request_user),
     search: Optional[str] = None,
     limit: int = 10,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    count: CountMode = "none",
 ):
+    """
+    List chats, newest first. Pages are read by offset unless `cursor` is set.
+    Pass an empty cursor for the first page and `next_cursor` after that.
+    """
     query = Chat.filtered_owners(user)
     if search:
         query = query.filter(Q(name__icontains=search))
     query = query.order_by("-created_at")
 
+    if cursor is not None:
+        return await ChatCursorPage.apaginate(
+            output_model=ChatInList,
+            queryset=query.prefetch_related("agents"),
+            ordering=("-created_at", "-id"),
+            limit=limit,
+            cursor=cursor,
+            count=count,
+        )
+
     # punting on async implementation of pagination until later
     return await sync_to_async(ChatQueryPage.paginate)(
         output_model=ChatInList, queryset=query, limit=limit, offset=offset
@@ -225,14 +247,23 @@ def get_artifacts(user_input):
 
 
 @router.get(
-    "/chats/{chat_id}/messages", response_model=ChatMessageQueryPage, tags=["Chats"]
+    "/chats/{chat_id}/messages",
+    response_model=Union[ChatMessageQueryPage, ChatMessageCursorPage],
+    tags=["Chats"],
 )
 async def get_messages(
     chat_id,
     limit: int = 10,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    count: CountMode = "none",
     user: AbstractUser = Depends(get_request_user),
 ):
+    """
+    List messages in a chat, oldest first. Pages are read by offset unless
+    `cursor` is set. Pass an empty cursor for the first page and `next_cursor`
+    after that.
+    """
     try:
         chat = await Chat.filtered_owners(user).aget(pk=chat_id)
     except Chat.DoesNotExist:
@@ -242,6 +273,16 @@ async def get_messages(
         Q(task__root_id=task_id) | Q(task__id=task_id)
     ).order_by("created_at")
 
+    if cursor is not None:
+        return await ChatMessageCursorPage.apaginate(
+            output_model=ChatMessage,
+            queryset=query,
+            ordering=("created_at", "id"),
+            limit=limit,
+            cursor=cursor,
+            count=count,
+        )
+
     # punting on async implementation of pagination until later
     return await sync_to_async(ChatMessageQueryPage.paginate)(
         output_model=ChatMessage, queryset=query, limit=limit, offset=offset
@@ -326,6 +367,7 @@ async def clear_messages(chat_id: str, user: AbstractUser = Depends(get_request_
     await TaskLogMessage.objects.filter(
         Q(task__root_id=chat.task_id) | Q(task_id=chat.task_id)
     ).adelete()
+    await message_history_cache.ainvalidate(chat.task_id)
     return DeletedItem(id=chat_id)
 
 
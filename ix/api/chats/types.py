@@ -7,7 +7,7 @@ from datetime import datetime
 from ix.api.agents.types import Agent
 from ix.api.artifacts.types import Artifact
 from ix.agents.models import Agent as AgentModel
-from ix.utils.graphene.pagination import QueryPage
+from ix.utils.graphene.pagination import CursorPage, QueryPage
 
 
 class ChatNew(BaseModel):
@@ -43,6 +43,11 @@ class ChatQueryPage(QueryPage[Chat]):
     objects: List[Chat]
 
 
+class ChatCursorPage(CursorPage[Chat]):
+    # override objects, FastAPI isn't detecting CursorPage type
+    objects: List[Chat]
+
+
 class ChatInList(Chat):
     agents: List[Agent]
 
@@ -124,3 +129,8 @@ class ChatMessage(BaseModel):
 class ChatMessageQueryPage(QueryPage[ChatMessage]):
     # override objects, FastAPI isn't detecting QueryPage type
     objects: List[ChatMessage]
+
+
+class ChatMessageCursorPage(CursorPage[ChatMessage]):
+    # override objects, FastAPI isn't detecting CursorPage type
+    objects: List[ChatMessage]
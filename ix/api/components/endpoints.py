@@ -1,5 +1,5 @@
 import logging
-from typing import Optional, List
+from typing import Literal, Optional, List, Union
 from uuid import UUID
 
 from asgiref.sync import sync_to_async
@@ -10,23 +10,57 @@ from fastapi import APIRouter, HTTPException, Query, Depends
 from ix.api.auth import get_request_user
 from ix.api.chains.endpoints import DeletedItem
 from ix.chains.models import NodeType
-from ix.api.components.types import NodeType as NodeTypePydantic, NodeTypePage
+from ix.api.components.types import (
+    NodeType as NodeTypePydantic,
+    NodeTypeCursorPage,
+    NodeTypePage,
+)
+from ix.utils.graphene.pagination import CountMode
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.get("/node_types/", response_model=NodeTypePage, tags=["Components"])
+@router.get(
+    "/node_types/",
+    response_model=Union[NodeTypePage, NodeTypeCursorPage],
+    tags=["Components"],
+)
 async def get_node_types(
     search: Optional[str] = None,
     types: Optional[List[str]] = Query(None, alias="types"),
+    mode: Literal["substring", "text", "hybrid"] = "substring",
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    count: CountMode = "none",
     user: AbstractUser = Depends(get_request_user),
 ):
-    query = NodeType.filtered_owners(user).order_by("name")
+    """
+    List node types. `mode` selects how `search` is matched:
+    - substring: case-insensitive substring of name, description, type or class_path
+    - text: full text search ranked by relevance
+    - hybrid: full text and vector similarity combined with reciprocal rank fusion
+
+    Pages are read by offset unless `cursor` is set. Pass an empty cursor for the
+    first page and `next_cursor` after that. Cursors require the substring mode
+    since text and hybrid results are ordered by relevance.
+    """
+    if cursor is not None and search and mode != "substring":
+        raise HTTPException(
+            status_code=400, detail="cursor pagination requires mode=substring"
+        )
+
+    query = NodeType.filtered_owners(user).defer("embedding").order_by("name")
 
-    if search:
+    if types:
+        query = query.filter(type__in=types)
+
+    if search and mode == "hybrid":
+        query = await sync_to_async(query.hybrid_search)(search)
+    elif search and mode == "text":
+        query = query.text_search(search)
+    elif search:
         query = query.filter(
             Q(name__icontains=search)
             | Q(description__icontains=search)
@@ -34,8 +68,15 @@ async def get_node_types(
             | Q(class_path__icontains=search)
         )
 
-    if types:
-        query = query.filter(type__in=types)
+    if cursor is not None:
+        return await NodeTypeCursorPage.apaginate(
+            output_model=NodeTypePydantic,
+            queryset=query,
+            ordering=("name", "id"),
+            limit=limit,
+            cursor=cursor,
+            count=count,
+        )
 
     # punting on async implementation of pagination until later
     return await sync_to_async(NodeTypePage.paginate)(
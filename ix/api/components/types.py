@@ -23,7 +23,7 @@ from pydantic.v1 import SecretStr as SecretStrV1
 from pydantic_core import PydanticUndefined
 
 from ix.utils.pydantic import get_model_fields, create_args_model
-from ix.utils.graphene.pagination import QueryPage
+from ix.utils.graphene.pagination import CursorPage, QueryPage
 
 
 class InputType(str, Enum):
@@ -703,3 +703,8 @@ class NodeType(BaseModel):
 class NodeTypePage(QueryPage[NodeType]):
     # override objects, FastAPI isn't detecting QueryPage type
     objects: List[NodeType]
+
+
+class NodeTypeCursorPage(CursorPage[NodeType]):
+    # override objects, FastAPI isn't detecting CursorPage type
+    objects: List[NodeType]
@@ -2,14 +2,19 @@ from asgiref.sync import sync_to_async
 from django.contrib.auth.models import AbstractUser
 from django.db.models import Q
 from fastapi import HTTPException, APIRouter, Depends
-from typing import Optional
+from typing import Optional, Union
 from uuid import UUID
 
 from ix.api.auth import get_request_user
 from ix.datasources.models import DataSource
 from ix.api.chains.endpoints import DeletedItem
 from pydantic import BaseModel
-from ix.api.datasources.types import DataSource as DataSourcePydantic, DataSourcePage
+from ix.api.datasources.types import (
+    DataSource as DataSourcePydantic,
+    DataSourceCursorPage,
+    DataSourcePage,
+)
+from ix.utils.graphene.pagination import CountMode
 
 
 router = APIRouter()
@@ -54,19 +59,39 @@ async def get_datasource(
     return DataSourcePydantic.from_orm(datasource)
 
 
-@router.get("/datasources/", response_model=DataSourcePage, tags=["DataSources"])
+@router.get(
+    "/datasources/",
+    response_model=Union[DataSourcePage, DataSourceCursorPage],
+    tags=["DataSources"],
+)
 async def get_datasources(
     search: Optional[str] = None,
     limit: int = 10,
     offset: int = 0,
+    cursor: Optional[str] = None,
+    count: CountMode = "none",
     current_user: AbstractUser = Depends(get_request_user),  # Get the current user
 ):
+    """
+    List datasources. Pages are read by offset unless `cursor` is set, ordered by
+    name. Pass an empty cursor for the first page and `next_cursor` after that.
+    """
     query = DataSource.objects.filter(user_id=current_user.id)
     if search:
         query = query.filter(
             Q(name__icontains=search) | Q(description__icontains=search)
         )
 
+    if cursor is not None:
+        return await DataSourceCursorPage.apaginate(
+            output_model=DataSourcePydantic,
+            queryset=query,
+            ordering=("name", "id"),
+            limit=limit,
+            cursor=cursor,
+            count=count,
+        )
+
     # punting on async implementation of pagination until later
     return await sync_to_async(DataSourcePage.paginate)(
         output_model=DataSourcePydantic, queryset=query, limit=limit, offset=offset
@@ -2,7 +2,7 @@ from uuid import UUID
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel
 
-from ix.utils.graphene.pagination import QueryPage
+from ix.utils.graphene.pagination import CursorPage, QueryPage
 
 
 class DataSourceBase(BaseModel):
@@ -27,3 +27,8 @@ class DataSource(DataSourceBase):
 class DataSourcePage(QueryPage[DataSource]):
     # override objects, FastAPI isn't detecting QueryPage type
     objects: List[DataSource]
+
+
+class DataSourceCursorPage(CursorPage[DataSource]):
+    # override objects, FastAPI isn't detecting CursorPage type
+    objects: List[DataSource]
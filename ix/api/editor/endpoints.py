@@ -53,6 +53,7 @@ async def set_chain_root(chain_id: UUID, update_root: UpdateRoot):
         id__in=update_root.node_ids, root=False
     ).aupdate(root=True)
     await asyncio.gather(remove_roots, add_roots)
+    await Chain.abump_revision(chain_id)
     return UpdatedRoot(old_roots=old_root_ids, roots=update_root.node_ids)
 
 
@@ -91,6 +92,7 @@ async def add_chain_node(node: AddNode):
         if node_edges:
             await ChainEdge.objects.abulk_create(node_edges)
 
+    await Chain.abump_revision(new_node.chain_id)
     return NodePydantic.from_orm(new_node)
 
 
@@ -106,6 +108,7 @@ async def update_chain_node(node_id: UUID, data: UpdateNode):
     for field, value in as_dict.items():
         setattr(existing_node, field, value)
     await existing_node.asave(update_fields=as_dict.keys())
+    await Chain.abump_revision(existing_node.chain_id)
     return NodePydantic.from_orm(existing_node)
 
 
@@ -130,6 +133,7 @@ async def delete_chain_node(node_id: UUID):
         edges = ChainEdge.objects.filter(Q(source_id=node_id) | Q(target_id=node_id))
         await edges.adelete()
         await node.adelete()
+        await Chain.abump_revision(node.chain_id)
     return DeletedItem(id=node_id)
 
 
@@ -137,6 +141,7 @@ async def delete_chain_node(node_id: UUID):
 async def add_chain_edge(data: EdgePydantic):
     new_edge = ChainEdge(**data.dict())
     await new_edge.asave()
+    await Chain.abump_revision(new_edge.chain_id)
     return EdgePydantic.from_orm(new_edge)
 
 
@@ -152,6 +157,7 @@ async def update_chain_edge(edge_id, data: UpdateEdge):
     for field, value in as_dict.items():
         setattr(existing_edge, field, value)
     await existing_edge.asave(update_fields=as_dict.keys())
+    await Chain.abump_revision(existing_edge.chain_id)
     return EdgePydantic.from_orm(existing_edge)
 
 
@@ -162,6 +168,7 @@ async def delete_chain_edge(edge_id: UUID):
     edge = await ChainEdge.objects.aget(id=edge_id)
     if edge:
         await edge.adelete()
+        await Chain.abump_revision(edge.chain_id)
     return DeletedItem(id=edge_id)
 
 
@@ -0,0 +1,226 @@
+import hashlib
+import logging
+import os
+import re
+import stat
+from pathlib import Path
+from typing import Optional, Tuple, Union
+from uuid import uuid4
+
+import aiofiles
+import aiofiles.os
+from django.conf import settings
+from fastapi import HTTPException, Request, Response, UploadFile
+from fastapi.responses import FileResponse
+from starlette.types import Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# ASGI extension for sending a file from its descriptor (e.g. with sendfile)
+ZEROCOPY_EXTENSION = "http.response.zerocopy"
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+async def save_upload(
+    file: UploadFile, path: Union[str, Path], chunk_size: Optional[int] = None
+) -> Tuple[int, str]:
+    """
+    Stream an upload to `path` in chunks, hashing it as it's written. The file
+    is written to a temporary file next to `path` and moved into place once
+    complete, so a failed upload never leaves a partial file behind.
+
+    Returns the size and sha256 hex digest of the file.
+    """
+    chunk_size = chunk_size or settings.ARTIFACT_UPLOAD_CHUNK_SIZE
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.part")
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        async with aiofiles.open(tmp_path, "wb") as buffer:
+            while chunk := await file.read(chunk_size):
+                digest.update(chunk)
+                size += len(chunk)
+                await buffer.write(chunk)
+        await aiofiles.os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            await aiofiles.os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return size, digest.hexdigest()
+
+
+class RangeNotSatisfiable(HTTPException):
+    def __init__(self, size: int):
+        super().__init__(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"content-range": f"bytes */{size}"},
+        )
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a Range header into an inclusive (start, end) byte range. Returns None
+    when the whole file should be sent: no header, or a header this server
+    doesn't handle (multiple ranges, other units), which RFC 9110 allows to be
+    ignored. Unsatisfiable ranges raise a 416.
+    """
+    if not header:
+        return None
+    match = RANGE_PATTERN.match(header.strip())
+    if not match:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable(size)
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or (last and int(last) < start):
+        raise RangeNotSatisfiable(size)
+    return start, end
+
+
+class RangeFileResponse(FileResponse):
+    """
+    FileResponse that can send a byte range of the file as a 206 response.
+
+    The body is sent with the ASGI zerocopy extension when the server supports
+    it, so the file is copied by the kernel with sendfile. Otherwise it's read
+    and sent in bounded chunks.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        stat_result: os.stat_result,
+        byte_range: Optional[Tuple[int, int]] = None,
+        chunk_size: Optional[int] = None,
+        **kwargs,
+    ):
+        super().__init__(path, stat_result=stat_result, **kwargs)
+        self.chunk_size = chunk_size or settings.ARTIFACT_DOWNLOAD_CHUNK_SIZE
+        self.headers["accept-ranges"] = "bytes"
+        size = stat_result.st_size
+        if byte_range is None:
+            self.offset, self.count = 0, size
+        else:
+            start, end = byte_range
+            self.offset, self.count = start, end - start + 1
+            self.status_code = 206
+            self.headers["content-range"] = f"bytes {start}-{end}/{size}"
+            self.headers["content-length"] = str(self.count)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        if self.send_header_only or not self.count:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif ZEROCOPY_EXTENSION in scope.get("extensions", {}):
+            with open(self.path, "rb") as file:
+                await send(
+                    {
+                        "type": ZEROCOPY_EXTENSION,
+                        "file": file,
+                        "offset": self.offset,
+                        "count": self.count,
+                        "more_body": False,
+                    }
+                )
+        else:
+            await self.send_chunks(send)
+        if self.background is not None:
+            await self.background()
+
+    async def send_chunks(self, send: Send) -> None:
+        remaining = self.count
+        async with aiofiles.open(self.path, "rb") as file:
+            await file.seek(self.offset)
+            while remaining > 0:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    # file was truncated while it was being sent
+                    logger.warning(f"File ended before response was sent: {self.path}")
+                    break
+                remaining -= len(chunk)
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": remaining > 0,
+                    }
+                )
+        if remaining > 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def get_accel_redirect(path: Union[str, Path]) -> Optional[str]:
+    """
+    Internal URI nginx serves `path` from when ARTIFACT_ACCEL_REDIRECT_PREFIX is
+    set and the file is in the workspace. None when the app must send it.
+    """
+    prefix = settings.ARTIFACT_ACCEL_REDIRECT_PREFIX
+    if not prefix:
+        return None
+    workspace = Path(settings.WORKSPACE_DIR).resolve()
+    try:
+        relative = Path(path).resolve().relative_to(workspace)
+    except ValueError:
+        return None
+    return f"{prefix.rstrip('/')}/{relative.as_posix()}"
+
+
+async def file_response(
+    request: Request,
+    path: Union[str, Path],
+    filename: Optional[str] = None,
+    media_type: str = "application/octet-stream",
+) -> Response:
+    """
+    Response for downloading a file. Range requests are supported. Workspace
+    files are handed off to nginx with X-Accel-Redirect when configured, so it
+    can send them with sendfile instead of proxying them through the app.
+    """
+    try:
+        stat_result = await aiofiles.os.stat(path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File not found")
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise HTTPException(status_code=404, detail="File not found")
+
+    kwargs = dict(media_type=media_type, filename=filename, method=request.method)
+    accel_redirect = get_accel_redirect(path)
+    if accel_redirect:
+        # nginx sends the file, or the requested range, in place of the body
+        response = RangeFileResponse(path, stat_result, **{**kwargs, "method": "HEAD"})
+        response.headers["x-accel-redirect"] = accel_redirect
+        return response
+
+    response = RangeFileResponse(path, stat_result, **kwargs)
+    byte_range = parse_range(request.headers.get("range"), stat_result.st_size)
+    if byte_range is None:
+        return response
+
+    # a client resuming a partial copy only wants a range if the file hasn't
+    # changed since, otherwise it gets the whole file
+    if_range = request.headers.get("if-range")
+    validators = (response.headers["etag"], response.headers["last-modified"])
+    if if_range and if_range not in validators:
+        return response
+    return RangeFileResponse(path, stat_result, byte_range=byte_range, **kwargs)
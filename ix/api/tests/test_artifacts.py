@@ -1,3 +1,4 @@
+import hashlib
 import tempfile
 
 from fastapi.exceptions import HTTPException
@@ -168,6 +169,61 @@ class TestArtifact:
             == f'attachment; filename="{artifact.storage["id"].split("/")[-1]}"'
         )
         assert response.content == b"test content"
+        assert response.headers["accept-ranges"] == "bytes"
+
+    async def test_download_artifact_range(self, mock_file, anode_types):
+        task = await afake_task()
+        artifact = await afake_artifact(task_id=task.id, storage={"id": mock_file.name})
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get(
+                f"/artifacts/{artifact.id}/download", headers={"Range": "bytes=5-"}
+            )
+        assert response.status_code == 206
+        assert response.headers["content-range"] == "bytes 5-11/12"
+        assert response.headers["content-length"] == "7"
+        assert response.content == b"content"
+
+    async def test_download_artifact_range_not_satisfiable(
+        self, mock_file, anode_types
+    ):
+        task = await afake_task()
+        artifact = await afake_artifact(task_id=task.id, storage={"id": mock_file.name})
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get(
+                f"/artifacts/{artifact.id}/download", headers={"Range": "bytes=12-"}
+            )
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */12"
+
+    async def test_download_artifact_missing_file(self, anode_types):
+        task = await afake_task()
+        artifact = await afake_artifact(
+            task_id=task.id, storage={"id": "/this/is/a/mock/path"}
+        )
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get(f"/artifacts/{artifact.id}/download")
+        assert response.status_code == 404
+
+    async def test_upload_file(self, anode_types, settings, tmp_path):
+        settings.WORKSPACE_DIR = str(tmp_path)
+        settings.ARTIFACT_UPLOAD_CHUNK_SIZE = 4
+        task = await afake_task()
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.post(
+                "/upload/",
+                files={"file": ("../test.txt", b"test content")},
+                data={"task_id": str(task.id)},
+            )
+        assert response.status_code == 200
+        result = response.json()
+        assert result["name"] == "test.txt"
+        assert result["storage"] == {
+            "type": "write_file",
+            "id": str(tmp_path / "test.txt"),
+            "size": 12,
+            "sha256": hashlib.sha256(b"test content").hexdigest(),
+        }
+        assert (tmp_path / "test.txt").read_bytes() == b"test content"
 
 
 @pytest.mark.django_db
@@ -1,3 +1,4 @@
+import logging
 from uuid import uuid4
 from faker import Faker
 from pydantic import BaseModel
@@ -91,6 +92,77 @@ class TestNodeType:
         # assert that filter excluded types that don't match
         assert GENERIC_LOADER_CLASS_PATH not in class_paths, class_paths
 
+    async def test_search_node_types_text(self, anode_types):
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get("/node_types/?search=opena&mode=text")
+
+        assert response.status_code == 200, response.content
+        class_paths = [o["class_path"] for o in response.json()["objects"]]
+        assert OPENAI_LLM_CLASS_PATH in class_paths, class_paths
+        assert GENERIC_LOADER_CLASS_PATH not in class_paths, class_paths
+
+    async def test_search_node_types_hybrid(self, anode_types, mocker):
+        # rank a node type that doesn't match the text first by similarity
+        node_type = await NodeType.objects.aget(class_path=GENERIC_LOADER_CLASS_PATH)
+        mocker.patch(
+            "ix.chains.models.NodeTypeQuery.vector_search",
+            return_value=NodeType.objects.filter(id=node_type.id),
+        )
+
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get("/node_types/?search=opena&mode=hybrid")
+
+        assert response.status_code == 200, response.content
+        class_paths = [o["class_path"] for o in response.json()["objects"]]
+        assert OPENAI_LLM_CLASS_PATH in class_paths, class_paths
+        assert GENERIC_LOADER_CLASS_PATH in class_paths, class_paths
+
+    async def test_search_node_types_hybrid_without_embeddings(
+        self, anode_types, mocker
+    ):
+        """hybrid search falls back to text search when text can't be embedded"""
+        mocker.patch(
+            "ix.chains.models.get_embedding", side_effect=ValueError("no api key")
+        )
+
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get("/node_types/?search=opena&mode=hybrid")
+
+        assert response.status_code == 200, response.content
+        class_paths = [o["class_path"] for o in response.json()["objects"]]
+        assert OPENAI_LLM_CLASS_PATH in class_paths, class_paths
+
+    async def test_search_node_types_hybrid_embedding_timeout(
+        self, anode_types, mocker, settings
+    ):
+        settings.NODE_TYPE_SEARCH_EMBEDDING_TIMEOUT = 0.5
+        get_embedding = mocker.patch(
+            "ix.chains.models.get_embedding", side_effect=TimeoutError()
+        )
+
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get("/node_types/?search=opena&mode=hybrid")
+
+        assert response.status_code == 200, response.content
+        assert get_embedding.call_args.kwargs["timeout"] == 0.5
+
+    async def test_search_node_types_hybrid_fallback_warning(
+        self, anode_types, mocker, caplog
+    ):
+        """falling back to text search is only warned about once per interval"""
+        mocker.patch("ix.chains.models._vector_search_warned_at", None)
+        mocker.patch(
+            "ix.chains.models.get_embedding", side_effect=ValueError("no api key")
+        )
+
+        with caplog.at_level(logging.WARNING, logger="ix.chains.models"):
+            async with AsyncClient(app=app, base_url="http://test") as ac:
+                for search in ["o", "op", "ope"]:
+                    response = await ac.get(f"/node_types/?search={search}&mode=hybrid")
+                    assert response.status_code == 200, response.content
+
+        assert len(caplog.records) == 1
+
     async def test_get_node_type_detail(self, amock_node_type):
         # Create a node type
         node_type = amock_node_type
@@ -607,6 +679,8 @@ class TestNode:
     async def test_update_node(self, anode_types):
         # Create a chain node to update
         node = await afake_chain_node()
+        chain = await Chain.objects.aget(id=node.chain_id)
+        revision = chain.revision
 
         # Prepare data for the API request
         data = {
@@ -633,6 +707,10 @@ class TestNode:
             "y": 20,
         }
 
+        # graph edits bump the revision used to cache compiled flows
+        await chain.arefresh_from_db()
+        assert chain.revision == revision + 1
+
     async def test_update_non_existent_chain_node(self):
         non_existent_node_id = uuid4()
         update_data = {
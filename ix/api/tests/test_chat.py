@@ -600,6 +600,42 @@ class TestChatMessage:
         )
 
 
+@pytest.mark.django_db
+class TestChatMessagePagination:
+    async def test_cursor_pages(self, anode_types):
+        chat = await afake_chat()
+        await TaskLogMessage.objects.filter(task_id=chat.task_id).adelete()
+        task = await Task.objects.aget(id=chat.task_id)
+        messages = [await afake_system(f"message {i}", task=task) for i in range(5)]
+
+        pages = []
+        cursor = ""
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            while cursor is not None:
+                response = await ac.get(
+                    f"/chats/{chat.id}/messages",
+                    params={"cursor": cursor, "limit": 2, "count": "exact"},
+                )
+                assert response.status_code == 200, response.content
+                result = response.json()
+                assert result["count"] == 5
+                pages.append([message["id"] for message in result["objects"]])
+                cursor = result["next_cursor"]
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [id for page in pages for id in page] == [
+            str(message.id) for message in messages
+        ]
+
+    async def test_invalid_cursor(self, anode_types):
+        chat = await afake_chat()
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            response = await ac.get(
+                f"/chats/{chat.id}/messages", params={"cursor": "invalid"}
+            )
+        assert response.status_code == 400
+
+
 @pytest.mark.django_db
 @pytest.mark.usefixtures("owner_filtering")
 class TestChatMessageAccess:
@@ -0,0 +1,177 @@
+import hashlib
+import io
+import os
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from starlette.requests import Request
+
+from ix.api.files import (
+    RangeFileResponse,
+    RangeNotSatisfiable,
+    file_response,
+    get_accel_redirect,
+    parse_range,
+    save_upload,
+)
+
+
+def make_request(headers: dict = None, method: str = "GET") -> Request:
+    raw_headers = [
+        (key.lower().encode(), value.encode()) for key, value in (headers or {}).items()
+    ]
+    return Request({"type": "http", "method": method, "headers": raw_headers})
+
+
+async def send_response(response, extensions: dict = None) -> list:
+    """Run a response and return the ASGI messages it sent"""
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "extensions": extensions or {}}
+    await response(scope, None, send)
+    return messages
+
+
+def body(messages: list) -> bytes:
+    return b"".join(m["body"] for m in messages if m["type"] == "http.response.body")
+
+
+@pytest.fixture
+def test_file(tmp_path):
+    path = tmp_path / "test.txt"
+    path.write_bytes(b"0123456789")
+    yield path
+
+
+class TestParseRange:
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            (None, None),
+            ("", None),
+            ("bytes=0-4", (0, 4)),
+            ("bytes=5-", (5, 9)),
+            ("bytes=5-100", (5, 9)),
+            ("bytes=-3", (7, 9)),
+            ("bytes=-100", (0, 9)),
+            # ignored, the whole file is sent
+            ("bytes=0-1,3-4", None),
+            ("items=0-1", None),
+            ("bytes=-", None),
+        ],
+    )
+    def test_parse_range(self, header, expected):
+        assert parse_range(header, 10) == expected
+
+    @pytest.mark.parametrize("header", ["bytes=10-", "bytes=5-4", "bytes=-0"])
+    def test_not_satisfiable(self, header):
+        with pytest.raises(RangeNotSatisfiable) as excinfo:
+            parse_range(header, 10)
+        assert excinfo.value.status_code == 416
+        assert excinfo.value.headers == {"content-range": "bytes */10"}
+
+
+class TestRangeFileResponse:
+    async def test_chunks(self, test_file):
+        response = RangeFileResponse(
+            test_file, os.stat(test_file), byte_range=(1, 7), chunk_size=3
+        )
+        messages = await send_response(response)
+        assert messages[0]["status"] == 206
+        assert [m["body"] for m in messages[1:]] == [b"123", b"456", b"7"]
+        assert [m["more_body"] for m in messages[1:]] == [True, True, False]
+
+    async def test_whole_file(self, test_file):
+        response = RangeFileResponse(test_file, os.stat(test_file), chunk_size=4)
+        messages = await send_response(response)
+        assert messages[0]["status"] == 200
+        assert body(messages) == b"0123456789"
+
+    async def test_zerocopy(self, test_file):
+        response = RangeFileResponse(test_file, os.stat(test_file), byte_range=(2, 5))
+        messages = await send_response(
+            response, extensions={"http.response.zerocopy": {}}
+        )
+        assert len(messages) == 2
+        assert messages[1]["type"] == "http.response.zerocopy"
+        assert messages[1]["offset"] == 2
+        assert messages[1]["count"] == 4
+
+    async def test_head(self, test_file):
+        response = RangeFileResponse(test_file, os.stat(test_file), method="HEAD")
+        messages = await send_response(response)
+        assert dict(messages[0]["headers"])[b"content-length"] == b"10"
+        assert body(messages) == b""
+
+
+class TestFileResponse:
+    async def test_range(self, test_file):
+        request = make_request({"Range": "bytes=-2"})
+        response = await file_response(request, test_file)
+        assert response.headers["content-range"] == "bytes 8-9/10"
+        assert body(await send_response(response)) == b"89"
+
+    async def test_if_range(self, test_file):
+        response = await file_response(make_request(), test_file)
+        etag = response.headers["etag"]
+
+        request = make_request({"Range": "bytes=0-1", "If-Range": etag})
+        response = await file_response(request, test_file)
+        assert response.status_code == 206
+
+        # changed file, send all of it
+        request = make_request({"Range": "bytes=0-1", "If-Range": "stale"})
+        response = await file_response(request, test_file)
+        assert response.status_code == 200
+        assert "content-range" not in response.headers
+
+    async def test_not_a_file(self, tmp_path):
+        with pytest.raises(HTTPException) as excinfo:
+            await file_response(make_request(), tmp_path)
+        assert excinfo.value.status_code == 404
+
+    async def test_accel_redirect(self, test_file, settings):
+        settings.WORKSPACE_DIR = str(test_file.parent)
+        settings.ARTIFACT_ACCEL_REDIRECT_PREFIX = "/workdir/"
+        response = await file_response(make_request(), test_file, filename="a.txt")
+        assert response.headers["x-accel-redirect"] == "/workdir/test.txt"
+        assert response.headers["content-disposition"] == 'attachment; filename="a.txt"'
+        assert body(await send_response(response)) == b""
+
+
+class TestGetAccelRedirect:
+    def test_disabled(self, test_file, settings):
+        settings.WORKSPACE_DIR = str(test_file.parent)
+        settings.ARTIFACT_ACCEL_REDIRECT_PREFIX = ""
+        assert get_accel_redirect(test_file) is None
+
+    def test_outside_workspace(self, test_file, settings):
+        settings.WORKSPACE_DIR = str(test_file.parent / "workdir")
+        settings.ARTIFACT_ACCEL_REDIRECT_PREFIX = "/workdir"
+        assert get_accel_redirect(test_file) is None
+        assert get_accel_redirect(test_file.parent / "workdir" / ".." / "x") is None
+
+
+class TestSaveUpload:
+    async def test_save_upload(self, tmp_path):
+        content = os.urandom(1000)
+        upload = UploadFile(io.BytesIO(content), filename="test.bin")
+        path = tmp_path / "test.bin"
+
+        size, sha256 = await save_upload(upload, path, chunk_size=64)
+        assert size == 1000
+        assert sha256 == hashlib.sha256(content).hexdigest()
+        assert path.read_bytes() == content
+        assert list(tmp_path.iterdir()) == [path]
+
+    async def test_error(self, tmp_path, mocker):
+        upload = UploadFile(io.BytesIO(b"test content"), filename="test.txt")
+        mocker.patch.object(upload, "read", side_effect=OSError("disconnected"))
+        with pytest.raises(OSError):
+            await save_upload(upload, tmp_path / "test.txt")
+
+        # no partial file is left behind
+        assert list(tmp_path.iterdir()) == []
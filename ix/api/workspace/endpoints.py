@@ -2,12 +2,13 @@ import logging
 from pathlib import Path
 
 from django.conf import settings
-from fastapi import APIRouter, UploadFile, File, Form
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException
 
 from ix.task_log.models import Artifact
 from ix.api.artifacts.types import (
     Artifact as ArtifactPydantic
 )
+from ix.api.files import save_upload
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -15,19 +16,24 @@ router = APIRouter()
 
 @router.post("/upload/", response_model=ArtifactPydantic)
 async def upload_file(file: UploadFile = File(...), task_id: str = Form(None)):
-    file_location = Path(settings.WORKSPACE_DIR) / file.filename
-    with file_location.open("wb+") as buffer:
-        buffer.write(file.file.read())
+    # drop any directories from the client's filename
+    filename = Path(file.filename).name
+    if not filename:
+        raise HTTPException(status_code=400, detail="Invalid filename")
+    file_location = Path(settings.WORKSPACE_DIR) / filename
+    size, sha256 = await save_upload(file, file_location)
 
     artifact = await Artifact.objects.acreate(
         task_id=task_id,
         artifact_type="file",
-        name=file.filename,
-        key=file.filename,
+        name=filename,
+        key=filename,
         description="",
         storage={
             "type": "write_file",
             "id": str(file_location),
+            "size": size,
+            "sha256": sha256,
         }
     )
 
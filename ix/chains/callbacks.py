@@ -1,3 +1,4 @@
+import asyncio
 import functools
 import json
 import logging
@@ -10,6 +11,7 @@ from typing import Dict, Union, Any, List, Optional
 from uuid import UUID
 
 from channels.layers import get_channel_layer
+from django.conf import settings
 from langchain.schema.runnable import RunnableConfig
 
 from ix.schema.subscriptions import ChatMessageTokenSubscription
@@ -21,6 +23,7 @@ from langchain.schema import AgentAction, BaseMessage
 
 from ix.agents.models import Agent
 from ix.chains.models import Chain
+from ix.task_log.history import message_history_cache
 from ix.task_log.models import Task, TaskLogMessage
 
 
@@ -56,17 +59,77 @@ class RunContext:
     # cache of tokens
     tokens: list = dataclasses.field(default_factory=list)
 
-    async def finalize_stream(self):
+    # tokens received but not yet sent to clients
+    pending_tokens: list = dataclasses.field(default_factory=list)
+    flush_task: Optional[asyncio.Task] = None
+
+    async def add_token(self, task: Task, token: str):
+        """
+        Add a token to the stream. Consecutive tokens are coalesced into a single
+        frame that is sent when CHAT_STREAM_COALESCE_TOKENS tokens are pending or
+        CHAT_STREAM_COALESCE_INTERVAL seconds after the first pending token.
+        """
+        self.tokens.append(token)
+        self.pending_tokens.append(token)
+        if len(self.pending_tokens) >= settings.CHAT_STREAM_COALESCE_TOKENS:
+            await self.flush_tokens(task)
+        elif self.flush_task is None:
+            self.flush_task = asyncio.create_task(self._flush_later(task))
+
+    async def _flush_later(self, task: Task):
+        await asyncio.sleep(settings.CHAT_STREAM_COALESCE_INTERVAL)
+        self.flush_task = None
+        await self.flush_tokens(task)
+
+    async def flush_tokens(self, task: Task):
+        """Send pending tokens to clients as a single frame.
+
+        The frame carries the 1-based index range of the tokens it contains.
+        """
+        if self.flush_task is not None:
+            self.flush_task.cancel()
+            self.flush_task = None
+        if not self.pending_tokens or self.message is None:
+            return
+
+        end_index = len(self.tokens)
+        index = end_index - len(self.pending_tokens) + 1
+        text = "".join(self.pending_tokens)
+        self.pending_tokens = []
+        await ChatMessageTokenSubscription.on_new_token(
+            task=task,
+            message_id=self.message.id,
+            index=index,
+            end_index=end_index,
+            text=text,
+        )
+
+    async def finalize_stream(self, task: Task = None):
         """
         Write the completed stream to the message.
         Updating the message notifies clients via django-channels.
         """
         if self.message is None:
             return
+        if task is not None:
+            await self.flush_tokens(task)
         self.message.content["stream"] = False
         self.message.content["text"] = "".join(self.tokens)
         await self.message.asave(update_fields=["content"])
 
+        # cached history windows hold the message as it was before the stream ended.
+        # The root task's window includes messages written by its subtasks.
+        task_ids = {self.message.task_id}
+        root_id = (
+            await Task.objects.filter(pk=self.message.task_id)
+            .values_list("root_id", flat=True)
+            .afirst()
+        )
+        if root_id is not None:
+            task_ids.add(root_id)
+        for task_id in task_ids:
+            await message_history_cache.ainvalidate(task_id)
+
 
 def exception_to_string(excp: Exception) -> str:
     """Print a traceback to a string and return it"""
@@ -175,13 +238,7 @@ class IxHandler(AsyncCallbackHandler):
         context = self.contexts[parent_run_id]
         # sometimes the first token is None
         if isinstance(token, str):
-            context.tokens.append(token)
-        await ChatMessageTokenSubscription.on_new_token(
-            task=self.task,
-            message_id=context.message.id,
-            index=len(context.tokens),
-            text=token,
-        )
+            await context.add_token(self.task, token)
 
     async def on_llm_error(
         self, error: Union[Exception, KeyboardInterrupt], **kwargs: Any
@@ -227,7 +284,7 @@ class IxHandler(AsyncCallbackHandler):
     async def finalize_stream(self, run_id):
         # finalize stream if necessary
         context = self.contexts[run_id]
-        await context.finalize_stream()
+        await context.finalize_stream(self.task)
 
     @log_error
     async def on_chain_end(
@@ -1,6 +1,6 @@
 from functools import reduce
 from operator import or_
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 
 from langchain.schema.runnable import (
     Runnable,
@@ -38,8 +38,27 @@ def init_parallel(steps: Dict[str, Any | Runnable[Input, Output]]) -> RunnablePa
 
 
 def init_each(
-    workflow: RunnableSerializable[List[Input], List[Output]]
-) -> RunnableEach:
+    workflow: RunnableSerializable[List[Input], List[Output]],
+    sequential: bool = False,
+    max_concurrency: Optional[int] = None,
+    return_exceptions: bool = False,
+) -> RunnableSerializable[List[Input], List[Output]]:
+    """
+    Run the workflow for each item in a list. Items run concurrently by default,
+    one at a time with `sequential`, or up to `max_concurrency` at a time.
+    `return_exceptions` returns an item's exception as its output instead of
+    failing every item.
+    """
+    from ix.runnable.flow import RunnableEachConcurrent, RunnableEachSequential
+
+    if sequential:
+        return RunnableEachSequential(workflow=workflow)
+    if max_concurrency or return_exceptions:
+        return RunnableEachConcurrent(
+            workflow=workflow,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
     return RunnableEach(bound=workflow)
 
 
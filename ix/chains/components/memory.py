@@ -4,6 +4,8 @@ from langchain.schema import BaseMemory, BaseMessage
 from langchain.schema.runnable import RunnableSerializable, RunnableConfig
 from langchain.schema.runnable.utils import Input, Output
 
+from ix.memory.utils import aload_memory_variables
+
 
 class LoadMemory(RunnableSerializable[Input, Output]):
     output_key: str = "memories"
@@ -35,6 +37,20 @@ class LoadMemory(RunnableSerializable[Input, Output]):
         memories = self.memory.load_memory_variables(memory_input)
         return memories[self.output_key]
 
+    async def ainvoke(
+        self,
+        input: Dict[str, Any],
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ):
+        memory_input = (
+            {key: input.get(key, None) for key in self.memory_inputs}
+            if self.memory_inputs
+            else input
+        )
+        memories = await aload_memory_variables(self.memory, memory_input)
+        return memories[self.output_key]
+
 
 class SaveMemory(RunnableSerializable[Input, Output]):
     input_keys: List[str] = ["input"]
@@ -71,8 +71,21 @@ POSTGRES_CHAT_HISTORY = {
     + SCOPED_MEMORY_FIELDS,
 }
 
+TASK_LOG_MEMORY_BACKEND = {
+    "class_path": "ix.memory.task_log.TaskLogMessageHistory",
+    "type": "memory_backend",
+    "name": "Chat History",
+    "description": "Reads chat history from the chat's message log. Recent messages "
+    "are cached and limited to a token budget.",
+    "display_groups": [
+        SCOPED_MEMORY_FIELD_GROUP,
+    ],
+    "fields": SCOPED_MEMORY_FIELDS,
+}
+
 MEMORY_BACKEND = [
     REDIS_MEMORY_BACKEND,
     FILESYSTEM_MEMORY_BACKEND,
     POSTGRES_CHAT_HISTORY,
+    TASK_LOG_MEMORY_BACKEND,
 ]
@@ -29,3 +29,11 @@ INPUT_VARIABLES = {
 }
 
 CHAIN_BASE_FIELDS = [VERBOSE, TAGS]
+
+RETURN_DIRECT = {
+    "name": "return_direct",
+    "type": "boolean",
+    "default": False,
+}
+
+TOOL_BASE_FIELDS = [RETURN_DIRECT, VERBOSE]
@@ -95,6 +95,28 @@ RUNNABLE_EACH = {
     "description": "Executes a sub-workflow for each input in a list of inputs",
     "type": "flow",
     "connectors": [WORKFLOW_SOURCE],
+    "fields": [
+        {
+            "name": "sequential",
+            "type": "boolean",
+            "default": False,
+            "description": "Run items one at a time.",
+        },
+        {
+            "name": "max_concurrency",
+            "label": "Max Concurrency",
+            "type": "number",
+            "default": None,
+            "description": "Run up to this many items at once. Unlimited if empty.",
+        },
+        {
+            "name": "return_exceptions",
+            "type": "boolean",
+            "default": False,
+            "description": "Return errors as item outputs instead of failing "
+            "every item.",
+        },
+    ],
 }
 
 
@@ -55,6 +55,14 @@ MAP_SUBCHAIN = {
             "name": "output_key",
             "type": "string",
         },
+        {
+            "name": "max_concurrency",
+            "label": "Max Concurrency",
+            "type": "number",
+            "default": None,
+            "description": "Run up to this many items at once. Concurrent items "
+            "don't receive the outputs of previous items.",
+        },
     ],
 }
 
@@ -13,6 +13,26 @@ DOCUMENT_TRANSFORMER_CONNECTORS = [
     DOCUMENTS_OUTPUT,
 ]
 
+# options for RunTransformer, the shim that runs text splitters in a flow
+PARALLEL_TRANSFORM_FIELDS = [
+    {
+        "name": "parallel",
+        "label": "Parallel",
+        "type": "boolean",
+        "default": False,
+        "description": "Split documents in a pool of worker processes. Only "
+        "faster for large inputs on multi-core workers.",
+    },
+    {
+        "name": "parallel_chunk_size",
+        "label": "Parallel Chunk Size",
+        "type": "number",
+        "default": None,
+        "description": "Documents sent to each worker at a time. Uses "
+        "DOCUMENT_TRANSFORM_CHUNK_SIZE if empty.",
+    },
+]
+
 
 CHARACTER_SPLITTER_CLASS_PATH = "langchain.text_splitter.CharacterTextSplitter"
 CHARACTER_SPLITTER = {
@@ -30,7 +50,8 @@ CHARACTER_SPLITTER = {
             "keep_separator",
             "add_start_index",
         ],
-    ),
+    )
+    + PARALLEL_TRANSFORM_FIELDS,
 }
 
 
@@ -53,7 +74,8 @@ RECURSIVE_CHARACTER_SPLITTER = {
             "keep_separator",
             "add_start_index",
         ],
-    ),
+    )
+    + PARALLEL_TRANSFORM_FIELDS,
 }
 
 TEXT_SPLITTERS = [RECURSIVE_CHARACTER_SPLITTER, CHARACTER_SPLITTER]
@@ -15,7 +15,7 @@ from langchain.utilities import (
 )
 
 from ix.api.components.types import NodeTypeField
-from ix.chains.fixture_src.common import VERBOSE
+from ix.chains.fixture_src.common import TOOL_BASE_FIELDS
 
 NAME = {
     "name": "name",
@@ -32,13 +32,6 @@ DESCRIPTION = {
     "style": {"width": "100%"},
 }
 
-RETURN_DIRECT = {
-    "name": "return_direct",
-    "type": "boolean",
-    "default": False,
-}
-
-TOOL_BASE_FIELDS = [RETURN_DIRECT, VERBOSE]
 
 ARXIV_SEARCH = {
     "class_path": "ix.tools.arxiv.get_arxiv",
@@ -15,6 +15,7 @@ from langchain.prompts.chat import (
 from langchain.tools import Tool, format_tool_to_openai_function
 
 from ix.chains.functions import FunctionSchema
+from ix.memory.utils import aload_memory_variables
 from ix.task_log.models import TaskLogMessage
 
 logger = logging.getLogger(__name__)
@@ -85,6 +86,31 @@ class LLMChain(LangchainLLMChain):
             as_set -= set(self.memory.memory_variables)
         return list(as_set)
 
+    def prep_inputs(self, inputs: Dict[str, Any] | Any) -> Dict[str, str]:
+        """
+        Overridden to skip loading memory when `acall` already loaded it into the
+        inputs.
+        """
+        if (
+            self.memory is not None
+            and isinstance(inputs, dict)
+            and set(self.memory.memory_variables).issubset(inputs)
+        ):
+            self._validate_inputs(inputs)
+            return inputs
+        return super().prep_inputs(inputs)
+
+    async def acall(self, inputs: Dict[str, Any] | Any, *args, **kwargs):
+        """
+        Overridden to load memory with `aload_memory_variables`. Langchain's acall
+        loads memory synchronously, blocking the event loop while the memory
+        queries.
+        """
+        if self.memory is not None and isinstance(inputs, dict):
+            memories = await aload_memory_variables(self.memory, inputs)
+            inputs = dict(inputs, **memories)
+        return await super().acall(inputs, *args, **kwargs)
+
 
 class LLMReply(LLMChain):
     """
@@ -0,0 +1,86 @@
+import dataclasses
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Type
+from uuid import UUID
+
+from django.conf import settings
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class CompiledFlow:
+    """
+    The context independent result of loading a chain's graph. Contains the
+    placeholder tree produced by `load_chain_flow` and the ChainGraph snapshot it
+    was loaded from. The ChainNode instances hold their NodeType, which memoizes
+    resolved metadata (pydantic type, config model) for as long as the flow is
+    cached.
+
+    Runnables are not cached since they are bound to the IxContext of a request.
+    """
+
+    chain_id: UUID
+    revision: int
+    input_type: Type[BaseModel]
+    flow_root: Any
+    graph: Any = None
+
+
+class FlowCache:
+    """
+    Per-process LRU cache of compiled flows keyed by chain_id. Entries are only
+    valid for the chain revision they were compiled from. Editing a chain's graph,
+    or saving a NodeType it uses, bumps `Chain.revision` which causes the next
+    load to recompile.
+    """
+
+    def __init__(self, max_size: int = None):
+        self._max_size = max_size
+        self._flows: OrderedDict[str, CompiledFlow] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return settings.CHAIN_FLOW_CACHE_SIZE
+
+    def get(self, chain_id: UUID, revision: int) -> Optional[CompiledFlow]:
+        key = str(chain_id)
+        with self._lock:
+            compiled = self._flows.get(key)
+            if compiled is None:
+                return None
+            if compiled.revision != revision:
+                del self._flows[key]
+                return None
+            self._flows.move_to_end(key)
+            return compiled
+
+    def set(self, compiled: CompiledFlow) -> None:
+        if self.max_size <= 0:
+            return
+        key = str(compiled.chain_id)
+        with self._lock:
+            self._flows[key] = compiled
+            self._flows.move_to_end(key)
+            while len(self._flows) > self.max_size:
+                self._flows.popitem(last=False)
+
+    def invalidate(self, chain_id: UUID) -> None:
+        with self._lock:
+            self._flows.pop(str(chain_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._flows.clear()
+
+    def __len__(self) -> int:
+        return len(self._flows)
+
+
+flow_cache = FlowCache()
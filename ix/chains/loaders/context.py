@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from datetime import datetime
 from typing import Callable, Dict, Optional
@@ -11,8 +10,7 @@ from langchain.schema.runnable.utils import Input
 from pydantic import BaseModel
 
 from ix.chat.models import Chat
-from ix.runnable_log.models import RunnableExecution
-from ix.runnable_log.subscription import RunEventSubscription
+from ix.runnable_log.writer import get_log_writer
 from ix.task_log.models import Task
 from ix.utils.json import to_json_serializable
 
@@ -44,7 +42,7 @@ class Listener:
             "completed": False,
         }
 
-        RunEventSubscription.on_execution(
+        get_log_writer().on_start(
             chain_id=self.context.chain_id,
             event=self.run,
         )
@@ -72,13 +70,7 @@ class Listener:
                 finished_at=datetime.now(tz=ZoneInfo("America/Los_Angeles")),
             )
         )
-        await asyncio.gather(
-            RunEventSubscription.aon_execution(
-                chain_id=self.context.chain_id,
-                event=self.run,
-            ),
-            RunnableExecution.objects.acreate(**self.run),
-        )
+        await get_log_writer().alog(chain_id=self.context.chain_id, record=self.run)
 
     @property
     def callbacks(self) -> Dict[str, Callable]:
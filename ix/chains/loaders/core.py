@@ -1,12 +1,18 @@
+import asyncio
+import contextvars
 import dataclasses
 import itertools
 import logging
+import threading
 import time
 from collections import defaultdict
-from typing import Callable, Any, List, Tuple, Dict, Set, Union, Type
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Any, List, Optional, Tuple, Dict, Set, Union, Type
 from uuid import UUID
 
-from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+
 from langchain.schema.runnable import (
     RunnableSerializable,
     RunnableParallel,
@@ -19,10 +25,19 @@ from pydantic import BaseModel
 from ix.api.components.types import NodeType as NodeTypePydantic
 from ix.api.chains.types import Node as NodePydantic, InputConfig
 from ix.chains.components.lcel import init_sequence, init_branch
-from ix.chains.fixture_src.flow import ROOT_CLASS_PATH
+from ix.chains.fixture_src.flow import ROOT_CLASS_PATH, CHAIN_REF_CLASS_PATH
+from ix.chains.loaders.cache import flow_cache, CompiledFlow
 from ix.chains.loaders.context import IxContext
-
+from ix.chains.loaders.graph import ChainGraph
 from ix.chains.loaders.prompts import load_prompt
+from ix.chains.loaders.profiling import (
+    load_phase,
+    profile_node_load,
+    profile_load,
+    subgraph_span,
+    export_profile,
+    aexport_profile,
+)
 from ix.chains.loaders.templates import NodeTemplate
 from ix.chains.models import NodeType, ChainNode, ChainEdge, Chain
 from ix.runnable.flow import MergeList
@@ -31,7 +46,6 @@ from ix.secrets.models import Secret
 from ix.utils.config import format_config
 from ix.utils.importlib import import_class
 from ix.utils.pydantic import create_args_model_v1
-from jsonschema_pydantic import jsonschema_to_pydantic
 
 import_node_class = import_class
 
@@ -71,6 +85,19 @@ def get_property_loader(name: str) -> Callable:
     }.get(name, None)
 
 
+def get_aproperty_loader(name: str) -> Callable:
+    """Get an async property loader. Async variant of `get_property_loader`."""
+    from ix.chains.loaders.memory import aload_memory_property
+    from ix.chains.loaders.retriever import aload_retriever_property
+    from ix.chains.loaders.tools import aload_tool_property
+
+    return {
+        "memory": aload_memory_property,
+        "retriever": aload_retriever_property,
+        "tool": aload_tool_property,
+    }.get(name, None)
+
+
 def get_node_initializer(node_type: str) -> Callable:
     """Get a node initializer
 
@@ -88,21 +115,44 @@ def get_node_initializer(node_type: str) -> Callable:
     }.get(node_type, None)
 
 
-def load_secrets(config: dict, node_type: NodeType):
-    """Load secrets from vault into the config dict"""
+def get_anode_initializer(class_path: str, node_type: str) -> Callable:
+    """Get an async node initializer.
 
-    if not node_type.fields:
-        return
+    Used by `aload_node` for components that query the database or do blocking IO
+    when initialized. Looked up by class_path and then by node type.
+    """
+    from ix.chains.loaders.vectorstore import ainitialize_vectorstore
+    from ix.runnable.flow import ainit_chain_reference
 
-    # build map of secrets to load
-    to_load = set()
-    for field in node_type.fields:
+    if class_path == CHAIN_REF_CLASS_PATH:
+        return ainit_chain_reference
+
+    return {
+        "vectorstore": ainitialize_vectorstore,
+    }.get(node_type, None)
+
+
+def get_secret_ids(config: dict, node_type: NodeType) -> Set[str]:
+    """Return ids of secrets referenced by secret fields in the config"""
+    secret_ids = set()
+    for field in node_type.fields or []:
         if field["input_type"] == "secret":
             if field["name"] not in config:
                 continue
             secret_id = config[field["name"]]
             if secret_id:
-                to_load.add(secret_id)
+                secret_ids.add(secret_id)
+    return secret_ids
+
+
+def load_secrets(config: dict, node_type: NodeType):
+    """Load secrets from vault into the config dict"""
+
+    if not node_type.fields:
+        return
+
+    # build map of secrets to load
+    to_load = get_secret_ids(config, node_type)
 
     # load secrets and update config
     # TODO: need user here to limit access to secrets
@@ -120,20 +170,44 @@ def load_secrets(config: dict, node_type: NodeType):
         raise ValueError(f"Secrets not found: {to_load}")
 
 
-def load_flow_props(
-    node: ChainNode,
-    node_type: NodeType,
-    context: IxContext,
-    variables: Dict[str, Any] = None,
-) -> Dict[str, Runnable]:
-    """Load properties that create a runnable flow.
+async def aload_secrets(config: dict, node_type: NodeType):
+    """Load secrets from vault into the config dict.
 
-    This props use outgoing edges to the input on the first node in the flow.
-    Returns a dict of props that can be merged into the nodes config dict.
+    All secrets are read concurrently.
     """
-    config = {}
-    properties = node.outgoing_edges.filter(relation="PROP").order_by("source_key")
 
+    if not node_type.fields:
+        return
+
+    to_load = get_secret_ids(config, node_type)
+    if not to_load:
+        return
+
+    # TODO: need user here to limit access to secrets
+    secrets = [secret async for secret in Secret.objects.filter(id__in=to_load)]
+    try:
+        values = await Secret.aread_many(secrets)
+    except Exception as e:
+        logger.error(f"Failed to load secrets {to_load}: {e}")
+        raise Exception(f"Failed to load secrets: {to_load}")
+
+    for secret in secrets:
+        to_load.remove(str(secret.id))
+        config.update(values[str(secret.id)])
+
+    if to_load:
+        raise ValueError(f"Secrets not found: {to_load}")
+
+
+def get_flow_property_groups(
+    node: ChainNode, node_type: NodeType, graph: ChainGraph
+) -> List[Tuple[str, List[ChainNode]]]:
+    """Outgoing flow properties of a node grouped by source_key.
+
+    Returns the key and the nodes that start the flow for each property.
+    """
+    properties = graph.outgoing(node.id, "PROP")
+    groups = []
     for group in itertools.groupby(properties, lambda x: x.source_key):
         key, edges = group
         edge_group: List[ChainEdge] = [edge for edge in edges]
@@ -146,39 +220,62 @@ def load_flow_props(
         logger.debug(
             f"Loading flow property source_key={key} target_key={edge_group[0].target_key} edge_group={edge_group}"
         )
+        groups.append((key, [edge.target for edge in edge_group]))
+    return groups
 
-        nodes = [edge.target for edge in edge_group]
-        config[key] = init_flow(nodes, context=context, variables=variables)
 
-    return config
+def load_flow_props(
+    node: ChainNode,
+    node_type: NodeType,
+    context: IxContext,
+    variables: Dict[str, Any] = None,
+    graph: ChainGraph = None,
+) -> Dict[str, Runnable]:
+    """Load properties that create a runnable flow.
+
+    This props use outgoing edges to the input on the first node in the flow.
+    Returns a dict of props that can be merged into the nodes config dict.
+    """
+    graph = graph or ChainGraph.load(node.chain_id)
+    return {
+        key: init_flow(nodes, context=context, variables=variables, graph=graph)
+        for key, nodes in get_flow_property_groups(node, node_type, graph)
+    }
 
 
-def load_node(
+async def aload_flow_props(
     node: ChainNode,
+    node_type: NodeType,
     context: IxContext,
     variables: Dict[str, Any] = None,
-    as_template: bool = False,
-) -> Any:
-    """
-    Generic loader for loading the Langchain component a ChainNode represents.
+    graph: ChainGraph = None,
+) -> Dict[str, Runnable]:
+    """Async variant of `load_flow_props`. Flows are loaded concurrently."""
+    graph = graph or await ChainGraph.aload(node.chain_id)
+    groups = get_flow_property_groups(node, node_type, graph)
+    flows = await asyncio.gather(
+        *[
+            ainit_flow(nodes, context=context, variables=variables, graph=graph)
+            for _, nodes in groups
+        ]
+    )
+    return {key: flow for (key, _), flow in zip(groups, flows)}
 
-    This loader will load the component and its config, and then recursively
-    load any properties that are attached to the node. The loader also handles
-    recursively loading any child nodes that are attached to the node.
-    """
 
-    logger.debug(f"Loading chain for name={node.name} class_path={node.class_path}")
-    start_time = time.time()
-    node_type: NodeType = node.node_type
-    node_type_pydantic = NodeTypePydantic.model_validate(node_type)
+def prepare_node_config(
+    node: ChainNode, node_type: NodeType, variables: Dict[str, Any] = None
+) -> Dict[str, Any]:
+    """Copy, validate and format a node's config.
+
+    The config is copied so nodes held by the flow cache are never mutated.
+    """
+    config = dict(node.config or {})
 
     # HAX: validate configs for component types that aren't implemented as pydantic
     # models. This is a temporary solution until configs are validated at the API
     # endpoints.
-    config = node.config or {}
     if node_type.type in {"transform", "document_loader", "text_splitter"}:
-        node_type_model = jsonschema_to_pydantic(node_type.config_schema)
-        config = node_type_model(**config).model_dump()
+        config = node_type.config_model(**config).model_dump()
 
     # TODO: implement resolve secrets from vault and settings from vocabulary
     #       neither of these subsystems are implemented yet. For now load all
@@ -189,83 +286,30 @@ def load_node(
     # 2. format with secrets
     if variables is not None:
         config = format_config(config, variables)
-    elif as_template:
-        return NodeTemplate(node, context)
-    load_secrets(config, node_type)
-
-    # load type specific config options. This is generally for loading
-    # ix specific features into the config dict
-    if node_loader := get_node_loader(node_type.type):
-        logger.debug(
-            f"Loading config with node config loader for type={node_type.type}"
-        )
-        config = node_loader(node, context)
-
-    # prepare properties for loading. Properties should be grouped by key.
-    properties = (
-        node.incoming_edges.filter(relation="PROP")
-        .exclude(target_key="in")
-        .order_by("target_key")
-    )
-    for group in itertools.groupby(properties, lambda x: x.target_key):
-        key, edges = group
-        edge_group: List[ChainEdge] = [edge for edge in edges]
-        logger.debug(f"Loading property target_key={key} edge_group={edge_group}")
+    return config
 
-        # choose the type the incoming connection is processed as. If the source node
-        # will be converted to another type, use the as_type defined on the connection
-        # this allows a single property loader to encapsulate any necessary conversions.
-        # e.g. retriever converting Vectorstore.
-        connector = node_type.connectors_as_dict[key]
-        as_type = connector.get("as_type", None) or edge_group[0].source.node_type.type
-        connector_is_template = connector.get("template", False)
 
-        if connector.get("collection", None):
-            # load connector as a collection
+def get_property_groups(
+    node: ChainNode, graph: ChainGraph
+) -> List[Tuple[str, List[ChainEdge]]]:
+    """Incoming property edges of a node grouped by target_key."""
+    properties = [
+        edge for edge in graph.incoming(node.id, "PROP") if edge.target_key != "in"
+    ]
+    return [
+        (key, list(edges))
+        for key, edges in itertools.groupby(properties, lambda x: x.target_key)
+    ]
 
-            config[key] = load_collection(
-                connector,
-                edge_group,
-                context,
-                variables=variables,
-                # TODO: will templates be allowed in collections?
-                # as_template=connector_is_template,
-            )
-        elif property_loader := get_property_loader(as_type):
-            # load type specific config options. This is generally for loading
-            # ix specific features into the config dict
-            logger.debug(f"Loading with property loader for type={node_type.type}")
-            config[key] = property_loader(edge_group, context)
-        else:
-            # default recursive property loading
-            if connector.get("multiple", False):
-                config[key] = [
-                    load_node(
-                        edge.source,
-                        context,
-                        variables=variables,
-                        as_template=connector_is_template,
-                    )
-                    for edge in edge_group
-                ]
-            else:
-                if len(edge_group) > 1:
-                    raise ValueError(f"Multiple values for {key} not allowed")
-                config[key] = load_node(
-                    edge_group[0].source,
-                    context,
-                    variables=variables,
-                    as_template=connector_is_template,
-                )
 
-    config.update(
-        load_flow_props(
-            node,
-            node_type=node_type,
-            context=context,
-            variables=variables,
-        )
-    )
+def finalize_node_config(
+    node: ChainNode,
+    node_type: NodeType,
+    config: Dict[str, Any],
+    context: IxContext,
+) -> Dict[str, Any]:
+    """Prepare a fully loaded config to be passed to the node's initializer."""
+    node_type_pydantic = node_type.as_pydantic
 
     # converted flattened property groups back into nested properties. Fields with
     # the same parent are grouped together into a single object. By default, groups
@@ -292,11 +336,6 @@ def load_node(
     if node_type.context:
         config[node_type.context] = context
 
-    # load component class and initialize. A type specific initializer may be used here
-    # for initialization common to all components of that type.
-    node_class = import_node_class(node.class_path)
-    node_initializer = get_node_initializer(node_type.type)
-
     # use name and description from ChainNode.
     if "name" not in config and "name" in node_type_pydantic.field_map:
         config["name"] = node.name
@@ -311,11 +350,247 @@ def load_node(
             if key not in node_type_pydantic.init_exclude
         }
 
+    return config
+
+
+@profile_node_load
+def load_node(
+    node: ChainNode,
+    context: IxContext,
+    variables: Dict[str, Any] = None,
+    as_template: bool = False,
+    graph: ChainGraph = None,
+) -> Any:
+    """
+    Generic loader for loading the Langchain component a ChainNode represents.
+
+    This loader will load the component and its config, and then recursively
+    load any properties that are attached to the node. The loader also handles
+    recursively loading any child nodes that are attached to the node.
+
+    Edges are read from `graph`. The chain's graph is loaded when not provided.
+    """
+
+    logger.debug(f"Loading chain for name={node.name} class_path={node.class_path}")
+    start_time = time.time()
+    node_type: NodeType = node.node_type
+
+    with load_phase("format_config"):
+        config = prepare_node_config(node, node_type, variables)
+    if variables is None and as_template:
+        return NodeTemplate(node, context, graph=graph)
+    with load_phase("secrets"):
+        load_secrets(config, node_type)
+
+    # load type specific config options. This is generally for loading
+    # ix specific features into the config dict
+    if node_loader := get_node_loader(node_type.type):
+        logger.debug(
+            f"Loading config with node config loader for type={node_type.type}"
+        )
+        with load_phase("node_loader"):
+            config = node_loader(node, context)
+
+    # prepare properties for loading. Properties should be grouped by key.
+    graph = graph or ChainGraph.load(node.chain_id)
+    with load_phase("properties"):
+        for key, edge_group in get_property_groups(node, graph):
+            logger.debug(f"Loading property target_key={key} edge_group={edge_group}")
+
+            # choose the type the incoming connection is processed as. If the source node
+            # will be converted to another type, use the as_type defined on the connection
+            # this allows a single property loader to encapsulate any necessary conversions.
+            # e.g. retriever converting Vectorstore.
+            connector = node_type.connectors_as_dict[key]
+            as_type = (
+                connector.get("as_type", None) or edge_group[0].source.node_type.type
+            )
+            connector_is_template = connector.get("template", False)
+
+            if connector.get("collection", None):
+                # load connector as a collection
+
+                config[key] = load_collection(
+                    connector,
+                    edge_group,
+                    context,
+                    variables=variables,
+                    graph=graph,
+                    # TODO: will templates be allowed in collections?
+                    # as_template=connector_is_template,
+                )
+            elif property_loader := get_property_loader(as_type):
+                # load type specific config options. This is generally for loading
+                # ix specific features into the config dict
+                logger.debug(f"Loading with property loader for type={node_type.type}")
+                config[key] = property_loader(edge_group, context, graph=graph)
+            else:
+                # default recursive property loading
+                if connector.get("multiple", False):
+                    config[key] = [
+                        load_node(
+                            edge.source,
+                            context,
+                            variables=variables,
+                            as_template=connector_is_template,
+                            graph=graph,
+                        )
+                        for edge in edge_group
+                    ]
+                else:
+                    if len(edge_group) > 1:
+                        raise ValueError(f"Multiple values for {key} not allowed")
+                    config[key] = load_node(
+                        edge_group[0].source,
+                        context,
+                        variables=variables,
+                        as_template=connector_is_template,
+                        graph=graph,
+                    )
+
+        config.update(
+            load_flow_props(
+                node,
+                node_type=node_type,
+                context=context,
+                variables=variables,
+                graph=graph,
+            )
+        )
+    config = finalize_node_config(node, node_type, config, context)
+
+    # load component class and initialize. A type specific initializer may be used here
+    # for initialization common to all components of that type.
+    with load_phase("import"):
+        node_class = import_node_class(node.class_path)
+    node_initializer = get_node_initializer(node_type.type)
+
     try:
-        if node_initializer:
-            instance = node_initializer(node.class_path, config)
+        with load_phase("initialize"):
+            if node_initializer:
+                instance = node_initializer(node.class_path, config)
+            else:
+                instance = node_class(**config)
+    except Exception:
+        logger.error(f"Exception loading node class={node.class_path}")
+        raise
+    logger.debug(f"Loaded node class={node.class_path} in {time.time() - start_time}s")
+
+    return instance
+
+
+@profile_node_load
+async def aload_node(
+    node: ChainNode,
+    context: IxContext,
+    variables: Dict[str, Any] = None,
+    as_template: bool = False,
+    graph: ChainGraph = None,
+) -> Any:
+    """
+    Async variant of `load_node`.
+
+    Uses the async ORM instead of running `load_node` in a thread. Properties are
+    independent of each other so they are loaded concurrently.
+    """
+
+    logger.debug(f"Loading chain for name={node.name} class_path={node.class_path}")
+    start_time = time.time()
+    node_type: NodeType = node.node_type
+
+    with load_phase("format_config"):
+        config = prepare_node_config(node, node_type, variables)
+    if variables is None and as_template:
+        if graph is None:
+            graph = await ChainGraph.aload(node.chain_id)
+        return NodeTemplate(node, context, graph=graph)
+    with load_phase("secrets"):
+        await aload_secrets(config, node_type)
+
+    # load type specific config options. This is generally for loading
+    # ix specific features into the config dict
+    if node_loader := get_node_loader(node_type.type):
+        logger.debug(
+            f"Loading config with node config loader for type={node_type.type}"
+        )
+        with load_phase("node_loader"):
+            config = node_loader(node, context)
+
+    graph = graph or await ChainGraph.aload(node.chain_id)
+
+    async def aload_property(key: str, edge_group: List[ChainEdge]) -> Any:
+        logger.debug(f"Loading property target_key={key} edge_group={edge_group}")
+        connector = node_type.connectors_as_dict[key]
+        as_type = connector.get("as_type", None) or edge_group[0].source.node_type.type
+        connector_is_template = connector.get("template", False)
+
+        if connector.get("collection", None):
+            return await aload_collection(
+                connector, edge_group, context, variables=variables, graph=graph
+            )
+        elif property_loader := get_aproperty_loader(as_type):
+            logger.debug(f"Loading with property loader for type={node_type.type}")
+            return await property_loader(edge_group, context, graph=graph)
+        elif connector.get("multiple", False):
+            return list(
+                await asyncio.gather(
+                    *[
+                        aload_node(
+                            edge.source,
+                            context,
+                            variables=variables,
+                            as_template=connector_is_template,
+                            graph=graph,
+                        )
+                        for edge in edge_group
+                    ]
+                )
+            )
         else:
-            instance = node_class(**config)
+            if len(edge_group) > 1:
+                raise ValueError(f"Multiple values for {key} not allowed")
+            return await aload_node(
+                edge_group[0].source,
+                context,
+                variables=variables,
+                as_template=connector_is_template,
+                graph=graph,
+            )
+
+    with load_phase("properties"):
+        property_groups = get_property_groups(node, graph)
+        values = await asyncio.gather(
+            *[aload_property(key, edge_group) for key, edge_group in property_groups]
+        )
+        for (key, _), value in zip(property_groups, values):
+            config[key] = value
+
+        config.update(
+            await aload_flow_props(
+                node,
+                node_type=node_type,
+                context=context,
+                variables=variables,
+                graph=graph,
+            )
+        )
+    config = finalize_node_config(node, node_type, config, context)
+
+    # async initializers are used for components that do IO when initialized.
+    # Everything else is initialized the same as `load_node`.
+    with load_phase("import"):
+        node_class = import_node_class(node.class_path)
+    anode_initializer = get_anode_initializer(node.class_path, node_type.type)
+    node_initializer = get_node_initializer(node_type.type)
+
+    try:
+        with load_phase("initialize"):
+            if anode_initializer:
+                instance = await anode_initializer(node.class_path, config)
+            elif node_initializer:
+                instance = node_initializer(node.class_path, config)
+            else:
+                instance = node_class(**config)
     except Exception:
         logger.error(f"Exception loading node class={node.class_path}")
         raise
@@ -329,6 +604,7 @@ def load_collection(
     edge_group: List[ChainEdge],
     context: IxContext,
     variables: Dict[str, Any] = None,
+    graph: ChainGraph = None,
 ) -> RunnableSerializable | List[Tuple[str, RunnableSerializable]]:
     """Load connector as a collection (list, map, map-tuples, etc). These properties
     are special in that the graph is traversed and contained within flow control
@@ -342,7 +618,28 @@ def load_collection(
         if collection_type == "flow":
             # load property as a Runnable flow
             nodes = [edge.source for edge in edge_group]
-            return init_flow_node(nodes, context=context, variables=variables)
+            return init_flow_node(
+                nodes, context=context, variables=variables, graph=graph
+            )
+    else:
+        raise ValueError(f"Unknown collection type: {collection_type}")
+
+
+async def aload_collection(
+    connector: dict,
+    edge_group: List[ChainEdge],
+    context: IxContext,
+    variables: Dict[str, Any] = None,
+    graph: ChainGraph = None,
+) -> RunnableSerializable | List[Tuple[str, RunnableSerializable]]:
+    """Async variant of `load_collection`"""
+    collection_type = connector.get("collection", None)
+
+    if collection_type == "flow":
+        nodes = [edge.source for edge in edge_group]
+        return await ainit_flow_node(
+            nodes, context=context, variables=variables, graph=graph
+        )
     else:
         raise ValueError(f"Unknown collection type: {collection_type}")
 
@@ -467,27 +764,57 @@ FlowPlaceholder = (
 
 
 def init_chain_flow(
-    chain: Chain, context: IxContext, variables: Dict[str, Any] = None
+    chain: Chain,
+    context: IxContext,
+    variables: Dict[str, Any] = None,
 ) -> Runnable:
     """
     Initialize a flow from a chain.
     """
-    input_type, flow_root = load_chain_flow(chain=chain)
-    logger.debug(f"init_chain_flow chain={chain.id} flow_root={flow_root}")
-    flow = init_flow_node(flow_root, context=context, variables=variables)
+    compiled = get_chain_flow(chain)
+    logger.debug(f"init_chain_flow chain={chain.id} flow_root={compiled.flow_root}")
+    with profile_load(chain.id, context) as profile:
+        flow = init_flow_node(
+            compiled.flow_root,
+            context=context,
+            variables=variables,
+            graph=compiled.graph,
+        )
+    export_profile(profile)
 
     # Add the root's schema as the outward facing input_type using a passthrough.
     if isinstance(flow, Runnable):
-        type_mask = RunnablePassthrough(input_type=input_type)
+        type_mask = RunnablePassthrough(input_type=compiled.input_type)
         flow = type_mask | flow
 
     return flow
 
 
 async def ainit_chain_flow(
-    chain: Chain, context: IxContext, variables: Dict[str, Any] = None
-):
-    return await sync_to_async(init_chain_flow)(chain, context, variables)
+    chain: Chain,
+    context: IxContext,
+    variables: Dict[str, Any] = None,
+) -> Runnable:
+    """
+    Initialize a flow from a chain. Async variant of `init_chain_flow`.
+    """
+    compiled = await aget_chain_flow(chain)
+    logger.debug(f"init_chain_flow chain={chain.id} flow_root={compiled.flow_root}")
+    with profile_load(chain.id, context) as profile:
+        flow = await ainit_flow_node(
+            compiled.flow_root,
+            context=context,
+            variables=variables,
+            graph=compiled.graph,
+        )
+    await aexport_profile(profile)
+
+    # Add the root's schema as the outward facing input_type using a passthrough.
+    if isinstance(flow, Runnable):
+        type_mask = RunnablePassthrough(input_type=compiled.input_type)
+        flow = type_mask | flow
+
+    return flow
 
 
 def init_flow(
@@ -495,14 +822,18 @@ def init_flow(
     context: IxContext,
     variables: Dict[str, Any] = None,
     seen: Dict[UUID, "FlowPlaceholder"] = None,
+    graph: ChainGraph = None,
 ) -> Runnable[Input, Output] | List[Runnable[Input, Output]]:
-    flow_roots = load_flow_node(nodes, seen=seen)
+    graph = graph or ChainGraph.load(nodes[0].chain_id)
+    flow_roots = load_flow_node(nodes, seen=seen, graph=graph)
     if not isinstance(flow_roots, list):
         flow_roots = [flow_roots]
 
     flows = []
     for flow_root in flow_roots:
-        flows.append(init_flow_node(flow_root, context=context, variables=variables))
+        flows.append(
+            init_flow_node(flow_root, context=context, variables=variables, graph=graph)
+        )
 
     if len(flows) == 1:
         return flows[0]
@@ -514,36 +845,106 @@ async def ainit_flow(
     context: IxContext,
     variables: Dict[str, Any] = None,
     seen: Dict[UUID, "FlowPlaceholder"] = None,
-) -> Runnable:
-    return await sync_to_async(init_flow)(nodes, context, variables, seen)
+    graph: ChainGraph = None,
+) -> Runnable[Input, Output] | List[Runnable[Input, Output]]:
+    """Async variant of `init_flow`. Disjoint flows are initialized concurrently."""
+    graph = graph or await ChainGraph.aload(nodes[0].chain_id)
+    flow_roots = load_flow_node(nodes, seen=seen, graph=graph)
+    if not isinstance(flow_roots, list):
+        flow_roots = [flow_roots]
 
+    flows = await asyncio.gather(
+        *[
+            ainit_flow_node(
+                flow_root, context=context, variables=variables, graph=graph
+            )
+            for flow_root in flow_roots
+        ]
+    )
 
-def load_chain_flow(chain: Chain) -> Tuple[Type[BaseModel], FlowPlaceholder]:
-    try:
-        root = chain.nodes.get(root=True, class_path=ROOT_CLASS_PATH)
-        nodes = chain.nodes.filter(incoming_edges__source=root)
+    if len(flows) == 1:
+        return flows[0]
+    return list(flows)
+
+
+def load_chain_flow(
+    chain: Chain, graph: ChainGraph = None
+) -> Tuple[Type[BaseModel], FlowPlaceholder]:
+    graph = graph or ChainGraph.load(chain.id)
+    roots = [node for node in graph.roots if node.class_path == ROOT_CLASS_PATH]
+    if roots:
+        root = roots[0]
+        nodes = []
+        for edge in graph.outgoing(root.id):
+            if edge.target not in nodes:
+                nodes.append(edge.target)
         logger.debug(f"Loading chain flow with roots: {root}")
         input_type = create_args_model_v1(
             root.config.get("outputs", []), name="ChainInput"
         )
-    except ChainNode.DoesNotExist:
+    else:
         # fallback to old style roots:
         # TODO: remove this fallback after all chains have been migrated
-        nodes = chain.nodes.filter(root=True)
+        nodes = graph.roots
         logger.debug(f"Loading chain flow with roots: {nodes}")
         input_type = create_args_model_v1(
             ["user_input", "artifact_ids"], name="ChainInput"
         )
 
-    return input_type, load_flow_node(nodes)
+    return input_type, load_flow_node(nodes, graph=graph)
 
 
-async def aload_chain_flow(chain: Chain) -> Tuple[Type[BaseModel], FlowPlaceholder]:
-    return await sync_to_async(load_chain_flow)(chain)
+async def aload_chain_flow(
+    chain: Chain, graph: ChainGraph = None
+) -> Tuple[Type[BaseModel], FlowPlaceholder]:
+    graph = graph or await ChainGraph.aload(chain.id)
+    return load_chain_flow(chain, graph=graph)
+
+
+def get_chain_flow(chain: Chain) -> CompiledFlow:
+    """Return the compiled flow for a chain, loading it only when the cached
+    flow is missing or was compiled from an older revision of the chain.
+    """
+    compiled = flow_cache.get(chain.id, chain.revision)
+    if compiled is None:
+        graph = ChainGraph.load(chain.id)
+        input_type, flow_root = load_chain_flow(chain, graph=graph)
+        compiled = CompiledFlow(
+            chain_id=chain.id,
+            revision=chain.revision,
+            input_type=input_type,
+            flow_root=flow_root,
+            graph=graph,
+        )
+        flow_cache.set(compiled)
+    else:
+        logger.debug(f"Using cached flow chain={chain.id} revision={chain.revision}")
+    return compiled
+
+
+async def aget_chain_flow(chain: Chain) -> CompiledFlow:
+    """Async variant of `get_chain_flow`"""
+    compiled = flow_cache.get(chain.id, chain.revision)
+    if compiled is None:
+        graph = await ChainGraph.aload(chain.id)
+        input_type, flow_root = load_chain_flow(chain, graph=graph)
+        compiled = CompiledFlow(
+            chain_id=chain.id,
+            revision=chain.revision,
+            input_type=input_type,
+            flow_root=flow_root,
+            graph=graph,
+        )
+        flow_cache.set(compiled)
+    else:
+        logger.debug(f"Using cached flow chain={chain.id} revision={chain.revision}")
+    return compiled
 
 
 def load_flow_node(
-    nodes: List[ChainNode], seen: Dict[UUID, "FlowPlaceholder"] = None
+    nodes: List[ChainNode],
+    seen: Dict[UUID, "FlowPlaceholder"] = None,
+    graph: ChainGraph = None,
 ) -> FlowPlaceholder | List[FlowPlaceholder]:
     """Loads a node or group of node connected to a map"""
     # TODO: this can be collapsed into load_flow_map. in both cases it runs
@@ -554,21 +955,32 @@ def load_flow_node(
 
     branch_depth = tuple()
     seen = seen or {}
+    graph = graph or ChainGraph.load(nodes[0].chain_id)
     if len(nodes) == 1:
-        return load_flow_sequence(nodes[0], seen, branch_depth=branch_depth)
-    return load_flow_map(nodes, seen, branch_depth=branch_depth)
+        return load_flow_sequence(
+            nodes[0], seen, branch_depth=branch_depth, graph=graph
+        )
+    return load_flow_map(nodes, seen, branch_depth=branch_depth, graph=graph)
 
 
 async def aload_flow_node(
-    nodes: List[ChainNode], seen: Dict[UUID, "FlowPlaceholder"] = None
+    nodes: List[ChainNode],
+    seen: Dict[UUID, "FlowPlaceholder"] = None,
+    graph: ChainGraph = None,
 ) -> FlowPlaceholder | List[FlowPlaceholder]:
-    return await sync_to_async(load_flow_node)(nodes, seen)
+    """Async variant of `load_flow_node`.
+
+    Traversal is done in memory, only loading the graph is async.
+    """
+    graph = graph or await ChainGraph.aload(nodes[0].chain_id)
+    return load_flow_node(nodes, seen, graph=graph)
 
 
 def load_flow_map(
     nodes: List[ChainNode],
     seen: Dict[UUID, FlowPlaceholder],
     branch_depth: Tuple[str] = None,
+    graph: ChainGraph = None,
 ) -> FlowPlaceholder | List[FlowPlaceholder]:
     """
     Load all paths starting from the given group of nodes. The returned nodes are
@@ -584,6 +996,7 @@ def load_flow_map(
     Agent.tools --> Foo --> Bar --> Baz
                 --> SearchTool
     """
+    graph = graph or ChainGraph.load(nodes[0].chain_id)
     local_seen: Dict[UUID, FlowPlaceholder] = {}
     new_nodes: List[FlowPlaceholder] = []
     for node in nodes:
@@ -591,7 +1004,9 @@ def load_flow_map(
         # The first branch is explored the deepest. Subsequent runs fill in missing
         # branches from the first run. The first run will always be complete after
         # all branches have been processed.
-        loaded_node = load_flow_sequence(node, seen=seen, branch_depth=branch_depth)
+        loaded_node = load_flow_sequence(
+            node, seen=seen, branch_depth=branch_depth, graph=graph
+        )
         node_id = (
             loaded_node.steps[0].id
             if isinstance(loaded_node, SequencePlaceholder)
@@ -613,23 +1028,26 @@ def load_flow_branch(
     node: ChainNode,
     seen: Dict[UUID, FlowPlaceholder],
     branch_depth: Tuple[str] = None,
+    graph: ChainGraph = None,
 ) -> BranchPlaceholder:
     # gather branches
-    outgoing_links = (
-        node.outgoing_edges.select_related("target")
-        .filter(relation="LINK")
-        .order_by("source_key")
-    )
+    graph = graph or ChainGraph.load(node.chain_id)
+    outgoing_links = graph.outgoing(node.id, "LINK")
     branches = {}
     for key, group in itertools.groupby(outgoing_links, lambda edge: edge.source_key):
         _branch_depth = branch_depth + (key,) if branch_depth else (key,)
         group_as_list = list(group)
         if len(group_as_list) > 1:
             targets = [edge.target for edge in group_as_list]
-            nodes = load_flow_map(targets, seen=seen, branch_depth=_branch_depth)
+            nodes = load_flow_map(
+                targets, seen=seen, branch_depth=_branch_depth, graph=graph
+            )
         else:
             nodes = load_flow_sequence(
-                group_as_list[0].target, seen=seen, branch_depth=_branch_depth
+                group_as_list[0].target,
+                seen=seen,
+                branch_depth=_branch_depth,
+                graph=graph,
             )
         branches[key] = nodes
 
@@ -657,8 +1075,10 @@ def load_flow_sequence(
     start: ChainNode,
     seen: Dict[UUID, FlowPlaceholder],
     branch_depth: Tuple[str] = None,
+    graph: ChainGraph = None,
 ) -> Runnable | SequencePlaceholder:
     sequential_nodes = []
+    graph = graph or ChainGraph.load(start.chain_id)
 
     # traverse the sequence
     current = start
@@ -666,10 +1086,8 @@ def load_flow_sequence(
     while infinite_loop_safety_count < 1000:
         infinite_loop_safety_count += 1
 
-        outgoing_links = list(
-            current.outgoing_edges.select_related("target").filter(relation="LINK")
-        )
-        incoming_links = list(current.incoming_edges.filter(relation="LINK"))
+        outgoing_links = graph.outgoing(current.id, "LINK")
+        incoming_links = graph.incoming(current.id, "LINK")
 
         # single outgoing link
         # TODO: non map nodes with multiple incoming links require a map node.
@@ -706,10 +1124,12 @@ def load_flow_sequence(
                 # has incoming links
                 # resolve the map edge hash into the key
                 try:
-                    incoming_link = current.incoming_edges.get(
-                        relation="LINK", source_id=sequential_nodes[-1].id
+                    incoming_link = next(
+                        edge
+                        for edge in incoming_links
+                        if edge.source_id == sequential_nodes[-1].id
                     )
-                except ChainEdge.DoesNotExist:
+                except StopIteration:
                     raise Exception(
                         f"Unable to find incoming link from {sequential_nodes[-1]} "
                         f"to map node {current}"
@@ -776,7 +1196,7 @@ def load_flow_sequence(
         elif current.class_path == BRANCH_CLASS_PATH:
             # start of explicitly defined branch
             branch_placeholder = load_flow_branch(
-                current, seen=seen, branch_depth=branch_depth
+                current, seen=seen, branch_depth=branch_depth, graph=graph
             )
             sequential_nodes.append(branch_placeholder)
 
@@ -797,7 +1217,9 @@ def load_flow_sequence(
         if len(outgoing_links) > 1 and current.class_path != BRANCH_CLASS_PATH:
             # multiple links: start of split that will end in a map node.
             targets = [link.target for link in outgoing_links]
-            map_node = load_flow_map(targets, seen=seen, branch_depth=branch_depth)
+            map_node = load_flow_map(
+                targets, seen=seen, branch_depth=branch_depth, graph=graph
+            )
 
             # add to sequence
             if isinstance(map_node, SequencePlaceholder):
@@ -842,19 +1264,114 @@ def get_input_config(node: ChainNode, node_type: NodeTypePydantic) -> InputConfi
     )
 
 
+_load_executor: Optional[ThreadPoolExecutor] = None
+_load_slots: Optional[threading.Semaphore] = None
+_load_executor_lock = threading.Lock()
+
+
+def get_load_executor() -> Optional[Tuple[ThreadPoolExecutor, threading.Semaphore]]:
+    """Thread pool used to initialize independent subgraphs concurrently.
+
+    Returns None when CHAIN_LOAD_WORKERS is less than two.
+    """
+    global _load_executor, _load_slots
+    workers = settings.CHAIN_LOAD_WORKERS
+    if workers < 2:
+        return None
+    with _load_executor_lock:
+        if _load_executor is None:
+            _load_executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="ix-chain-load"
+            )
+            _load_slots = threading.Semaphore(workers)
+        return _load_executor, _load_slots
+
+
+def map_subgraphs(
+    func: Callable[[Any], Any], items: List[Any], names: List[str] = None
+) -> List[Any]:
+    """Call func for each item, using the load thread pool while workers are free.
+
+    Items are only submitted when a worker is free to run them, otherwise they run
+    in the calling thread. Callers never wait on queued work, so nested subgraphs
+    can't deadlock the pool.
+
+    Each call is recorded as a subgraph span named by `names` when load profiling
+    is enabled. Names default to the index of the item.
+    """
+    names = names or [str(i) for i in range(len(items))]
+
+    def run(item, name):
+        with subgraph_span(name):
+            return func(item)
+
+    pool = get_load_executor()
+    if pool is None or len(items) < 2:
+        return [run(item, name) for item, name in zip(items, names)]
+    executor, slots = pool
+
+    def run_in_worker(item, name):
+        try:
+            return run(item, name)
+        finally:
+            # each worker thread has its own database connection
+            connections.close_all()
+            slots.release()
+
+    results = []
+    for item, name in zip(items[:-1], names[:-1]):
+        if slots.acquire(blocking=False):
+            # copy context so load profiling follows the work into the thread
+            context = contextvars.copy_context()
+            results.append(executor.submit(context.run, run_in_worker, item, name))
+        else:
+            results.append(run(item, name))
+    results.append(run(items[-1], names[-1]))
+    return [
+        result.result() if isinstance(result, Future) else result for result in results
+    ]
+
+
+def branch_names(root: BranchPlaceholder) -> List[str]:
+    """Subgraph span names for the default and keyed branches of a branch"""
+    return ["branch[default]"] + [f"branch[{key}]" for key, _ in root.branches]
+
+
+def map_names(root: MapPlaceholder) -> List[str]:
+    """Subgraph span names for the keyed steps of a map"""
+    return [f"map[{key}]" for key in root.map.keys()]
+
+
+def step_names(prefix: str, steps: List[Any]) -> List[str]:
+    """Subgraph span names for the steps of a sequence or aggregate"""
+    return [f"{prefix}[{i}]" for i in range(len(steps))]
+
+
 def init_flow_node(
     root: FlowPlaceholder,
     context: IxContext,
     variables: Dict[str, Any] = None,
+    graph: ChainGraph = None,
     **kwargs,
 ) -> Runnable:
     """Initial a flow node
 
     Assumes a collection of ChainNodes and placeholders constructed by load_flow.
+
+    Children of maps, branches, sequences and aggregates are independent of each
+    other. They are initialized on a thread pool when CHAIN_LOAD_WORKERS > 1.
     """
+    if isinstance(root, ImplicitJoin):
+        return init_flow_node(
+            root.resolve(), context=context, variables=variables, graph=graph
+        )
+
+    def init(node: FlowPlaceholder) -> Runnable:
+        return init_flow_node(node, context=context, variables=variables, graph=graph)
+
     if isinstance(root, ChainNode):
-        node_type = NodeTypePydantic.model_validate(root.node_type)
-        instance = load_node(root, context=context, variables=variables)
+        node_type = root.node_type.as_pydantic
+        instance = load_node(root, context=context, variables=variables, graph=graph)
 
         if isinstance(instance, Runnable):
             instance = IxNode(
@@ -868,50 +1385,121 @@ def init_flow_node(
             )
         return instance
     elif isinstance(root, BranchPlaceholder):
-        return init_branch(
-            default=init_flow_node(root.default, context=context, variables=variables),
-            branches=[
-                (key, init_flow_node(branch, context=context, variables=variables))
-                for key, branch in root.branches
-            ],
+        keys = [key for key, _ in root.branches]
+        default, *branches = map_subgraphs(
+            init,
+            [root.default] + [branch for _, branch in root.branches],
+            names=branch_names(root),
         )
+        return init_branch(default=default, branches=list(zip(keys, branches)))
     elif isinstance(root, MapPlaceholder):
-        runnable_map = RunnableParallel(
-            **{
-                key: init_flow_node(node, context=context, variables=variables)
-                for key, node in root.map.items()
-            }
-        )
+        keys = list(root.map.keys())
+        steps = map_subgraphs(init, list(root.map.values()), names=map_names(root))
+        runnable_map = RunnableParallel(**dict(zip(keys, steps)))
         if root.node.class_path == MAP_CLASS_PATH:
             return runnable_map
         else:
             # create an implicit [map -> node] sequence.
-            sequence = runnable_map | init_flow_node(
-                root.node, context=context, variables=variables
-            )
-            return sequence
+            return runnable_map | init(root.node)
     elif isinstance(root, list):
         # Still callable from load_node/load_collection
-        nodes = [
-            init_flow_node(node, context=context, variables=variables) for node in root
-        ]
-        return init_sequence(steps=nodes)
-
+        return init_sequence(
+            steps=map_subgraphs(init, root, names=step_names("sequence", root))
+        )
     elif isinstance(root, SequencePlaceholder):
-        nodes = [
-            init_flow_node(node, context=context, variables=variables)
-            for node in root.steps
-        ]
-        return init_sequence(steps=nodes)
+        return init_sequence(
+            steps=map_subgraphs(
+                init, root.steps, names=step_names("sequence", root.steps)
+            )
+        )
     elif isinstance(root, AggPlaceholder):
         return MergeList(
-            steps=[
-                init_flow_node(node, context=context, variables=variables)
-                for node in root.steps
-            ]
+            steps=map_subgraphs(init, root.steps, names=step_names("agg", root.steps))
+        )
+    else:
+        raise Exception("Invalid flow type: " + str(type(root)))
+
+
+async def ainit_flow_node(
+    root: FlowPlaceholder,
+    context: IxContext,
+    variables: Dict[str, Any] = None,
+    graph: ChainGraph = None,
+    **kwargs,
+) -> Runnable:
+    """Async variant of `init_flow_node`.
+
+    Children of maps, branches, sequences and aggregates are independent of each
+    other so they are initialized concurrently.
+    """
+    if isinstance(root, ImplicitJoin):
+        return await ainit_flow_node(
+            root.resolve(), context=context, variables=variables, graph=graph
+        )
+
+    async def ainit(node: FlowPlaceholder) -> Runnable:
+        return await ainit_flow_node(
+            node, context=context, variables=variables, graph=graph
+        )
+
+    async def ainit_subgraph(node: FlowPlaceholder, name: str) -> Runnable:
+        with subgraph_span(name):
+            return await ainit(node)
+
+    async def ainit_all(
+        nodes: List[FlowPlaceholder], names: List[str]
+    ) -> List[Runnable]:
+        return list(
+            await asyncio.gather(
+                *[ainit_subgraph(node, name) for node, name in zip(nodes, names)]
+            )
+        )
+
+    if isinstance(root, ChainNode):
+        node_type = root.node_type.as_pydantic
+        instance = await aload_node(
+            root, context=context, variables=variables, graph=graph
         )
-    elif isinstance(root, ImplicitJoin):
-        return init_flow_node(root.resolve(), context=context, variables=variables)
 
+        if isinstance(instance, Runnable):
+            instance = IxNode(
+                name=root.name,
+                description=root.description,
+                node_id=root.id,
+                child=instance,
+                context=context,
+                config=root.config,
+                bind_points=node_type.bind_points,
+            )
+        return instance
+    elif isinstance(root, BranchPlaceholder):
+        keys = [key for key, _ in root.branches]
+        default, *branches = await ainit_all(
+            [root.default] + [branch for _, branch in root.branches],
+            names=branch_names(root),
+        )
+        return init_branch(default=default, branches=list(zip(keys, branches)))
+    elif isinstance(root, MapPlaceholder):
+        keys = list(root.map.keys())
+        steps = await ainit_all(list(root.map.values()), names=map_names(root))
+        runnable_map = RunnableParallel(**dict(zip(keys, steps)))
+        if root.node.class_path == MAP_CLASS_PATH:
+            return runnable_map
+        else:
+            # create an implicit [map -> node] sequence.
+            return runnable_map | await ainit(root.node)
+    elif isinstance(root, list):
+        # Still callable from load_node/load_collection
+        return init_sequence(
+            steps=await ainit_all(root, names=step_names("sequence", root))
+        )
+    elif isinstance(root, SequencePlaceholder):
+        return init_sequence(
+            steps=await ainit_all(root.steps, names=step_names("sequence", root.steps))
+        )
+    elif isinstance(root, AggPlaceholder):
+        return MergeList(
+            steps=await ainit_all(root.steps, names=step_names("agg", root.steps))
+        )
     else:
         raise Exception("Invalid flow type: " + str(type(root)))
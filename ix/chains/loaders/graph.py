@@ -0,0 +1,134 @@
+import logging
+from collections import defaultdict
+from typing import Dict, List, Iterable, Optional, Tuple
+from uuid import UUID
+
+from ix.chains.models import ChainNode, ChainEdge, NodeType
+
+logger = logging.getLogger(__name__)
+
+
+EdgeKey = Tuple[UUID, Optional[str], Optional[str]]
+
+
+def _key_order(key: Optional[str]) -> Tuple[bool, str]:
+    """Sort order matching `order_by(key)` in postgres: nulls last."""
+    return key is None, key or ""
+
+
+class ChainGraph:
+    """
+    In-memory snapshot of a chain's nodes, edges and node types.
+
+    The flow loader traverses the graph many times per node. Loading the graph
+    up front keeps the number of queries constant (three) regardless of the size
+    of the chain. Edges are indexed by `(node_id, relation, key)` where key is
+    the `source_key` for outgoing edges and the `target_key` for incoming edges.
+
+    Nodes and edges are linked to each other and to their NodeType, so accessing
+    `edge.source`, `edge.target` and `node.node_type` does not query the database.
+    """
+
+    def __init__(
+        self,
+        nodes: Iterable[ChainNode],
+        edges: Iterable[ChainEdge],
+        node_types: Iterable[NodeType],
+    ):
+        self.nodes: Dict[UUID, ChainNode] = {node.id: node for node in nodes}
+        self.node_types: Dict[UUID, NodeType] = {
+            node_type.id: node_type for node_type in node_types
+        }
+        self.edges: List[ChainEdge] = list(edges)
+
+        for node in self.nodes.values():
+            if node.node_type_id in self.node_types:
+                node.node_type = self.node_types[node.node_type_id]
+
+        # index edges
+        self._outgoing: Dict[EdgeKey, List[ChainEdge]] = defaultdict(list)
+        self._incoming: Dict[EdgeKey, List[ChainEdge]] = defaultdict(list)
+        self._outgoing_by_relation: Dict[EdgeKey, List[ChainEdge]] = defaultdict(list)
+        self._incoming_by_relation: Dict[EdgeKey, List[ChainEdge]] = defaultdict(list)
+        for edge in sorted(self.edges, key=lambda e: _key_order(e.source_key)):
+            if edge.source_id in self.nodes:
+                edge.source = self.nodes[edge.source_id]
+            self._outgoing[(edge.source_id, edge.relation, edge.source_key)].append(
+                edge
+            )
+            self._outgoing_by_relation[(edge.source_id, edge.relation, None)].append(
+                edge
+            )
+            self._outgoing_by_relation[(edge.source_id, None, None)].append(edge)
+        for edge in sorted(self.edges, key=lambda e: _key_order(e.target_key)):
+            if edge.target_id in self.nodes:
+                edge.target = self.nodes[edge.target_id]
+            self._incoming[(edge.target_id, edge.relation, edge.target_key)].append(
+                edge
+            )
+            self._incoming_by_relation[(edge.target_id, edge.relation, None)].append(
+                edge
+            )
+            self._incoming_by_relation[(edge.target_id, None, None)].append(edge)
+
+    @classmethod
+    def load(cls, chain_id: UUID) -> "ChainGraph":
+        """Load the graph for a chain in three queries"""
+        nodes = list(ChainNode.objects.filter(chain_id=chain_id))
+        edges = list(ChainEdge.objects.filter(source__chain_id=chain_id))
+        node_type_ids = {node.node_type_id for node in nodes}
+        node_types = list(
+            NodeType.objects.filter(id__in=node_type_ids).defer("embedding")
+        )
+        logger.debug(
+            f"Loaded graph chain_id={chain_id} nodes={len(nodes)} edges={len(edges)}"
+        )
+        return cls(nodes, edges, node_types)
+
+    @classmethod
+    async def aload(cls, chain_id: UUID) -> "ChainGraph":
+        """Load the graph for a chain in three queries"""
+        nodes = [node async for node in ChainNode.objects.filter(chain_id=chain_id)]
+        edges = [
+            edge async for edge in ChainEdge.objects.filter(source__chain_id=chain_id)
+        ]
+        node_type_ids = {node.node_type_id for node in nodes}
+        node_types = [
+            node_type
+            async for node_type in NodeType.objects.filter(id__in=node_type_ids).defer(
+                "embedding"
+            )
+        ]
+        return cls(nodes, edges, node_types)
+
+    def get_node(self, node_id: UUID) -> ChainNode:
+        try:
+            return self.nodes[node_id]
+        except KeyError:
+            raise ChainNode.DoesNotExist(f"ChainNode id={node_id} not in graph")
+
+    @property
+    def roots(self) -> List[ChainNode]:
+        return [node for node in self.nodes.values() if node.root]
+
+    def outgoing(
+        self, node_id: UUID, relation: str = None, key: str = None
+    ) -> List[ChainEdge]:
+        """Outgoing edges of a node, ordered by source_key.
+
+        Filtered by relation and source_key when given.
+        """
+        if key is None:
+            return self._outgoing_by_relation.get((node_id, relation, None), [])
+        return self._outgoing.get((node_id, relation, key), [])
+
+    def incoming(
+        self, node_id: UUID, relation: str = None, key: str = None
+    ) -> List[ChainEdge]:
+        """Incoming edges of a node, ordered by target_key.
+
+        Filtered by relation and target_key when given.
+        """
+        if key is None:
+            return self._incoming_by_relation.get((node_id, relation, None), [])
+        return self._incoming.get((node_id, relation, key), [])
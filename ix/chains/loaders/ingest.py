@@ -0,0 +1,307 @@
+import hashlib
+import json
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import chain, islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from django.conf import settings
+from django.core.cache import caches
+from langchain.document_loaders.base import BaseLoader
+from langchain.schema import Document
+from langchain.schema.vectorstore import VectorStore
+from langchain_community.vectorstores.chroma import Chroma
+from langchain_community.vectorstores.redis import Redis
+
+from ix.chains.loaders.text_splitter import TextSplitterShim
+from ix.runnable.vectorstore import AddDocuments
+
+logger = logging.getLogger(__name__)
+
+
+def lazy_load(document_loader: BaseLoader) -> Iterator[Document]:
+    """Load documents one at a time, if the loader supports it"""
+    try:
+        yield from document_loader.lazy_load()
+    except NotImplementedError:
+        logger.debug(
+            f"{document_loader.__class__.__name__} doesn't implement lazy_load(), "
+            f"loading all documents at once"
+        )
+        yield from document_loader.load()
+
+
+def iter_documents(document_source: Any) -> Iterator[Document]:
+    """
+    Stream documents from a TextSplitterShim or BaseLoader. Documents are split as
+    they are loaded, so the whole corpus is never held in memory.
+    """
+    if isinstance(document_source, TextSplitterShim):
+        text_splitter = document_source.text_splitter
+        for document in lazy_load(document_source.document_loader):
+            yield from text_splitter.split_documents([document])
+    elif isinstance(document_source, BaseLoader):
+        yield from lazy_load(document_source)
+    else:
+        raise ValueError(f"unsupported document_source type: {type(document_source)}")
+
+
+def batched(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def fingerprint(value: Any, depth: int = 3) -> Any:
+    """
+    JSON-able summary of a config value. Objects are summarized by class name and
+    their simple attributes, so the same config produces the same fingerprint.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [fingerprint(item, depth) for item in value]
+    if isinstance(value, dict):
+        return {str(key): fingerprint(item, depth) for key, item in value.items()}
+    summary = {"__class__": f"{type(value).__module__}.{type(value).__name__}"}
+    if depth > 0 and hasattr(value, "__dict__"):
+        for key, item in sorted(vars(value).items()):
+            if not key.startswith("_"):
+                summary[key] = fingerprint(item, depth - 1)
+    return summary
+
+
+def get_ingest_key(class_path: str, config: Dict[str, Any], document_source) -> str:
+    data = json.dumps(
+        fingerprint(
+            {"class_path": class_path, "config": config, "source": document_source}
+        ),
+        sort_keys=True,
+        default=str,
+    )
+    return f"ingest:{hashlib.sha256(data.encode()).hexdigest()}"
+
+
+def batch_digest(batch: List[Document]) -> str:
+    """Digest of a batch's documents, used to check a resumed source is unchanged"""
+    data = json.dumps(
+        [[document.page_content, document.metadata] for document in batch],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(data.encode()).hexdigest()[:32]
+
+
+def can_resume_ingest(
+    vectorstore_class: Type[VectorStore], config: Dict[str, Any]
+) -> bool:
+    """
+    Whether `vectorstore_class(**config)` reopens the store an earlier ingest wrote
+    to. Only a persistent target that the config names can be resumed: a Redis
+    index without `index_name` has a generated name, and an in-memory Chroma is
+    gone when the worker restarts.
+    """
+    if issubclass(vectorstore_class, Redis):
+        return bool(config.get("index_name"))
+    if issubclass(vectorstore_class, Chroma):
+        client_settings = config.get("client_settings")
+        if isinstance(client_settings, dict):
+            server_host = client_settings.get("chroma_server_host")
+        else:
+            server_host = getattr(client_settings, "chroma_server_host", None)
+        return bool(config.get("persist_directory") or server_host)
+    return False
+
+
+@dataclass
+class IngestProgress:
+    """
+    Batches ingested so far. Progress is saved after each batch so an interrupted
+    ingest resumes after the last batch that was written. Batches are only
+    counted once every batch before them is written.
+
+    `digests` holds a digest of each written batch. A resumed ingest only skips
+    batches the source still produces unchanged, so changed content is ingested
+    even though the progress key is the same.
+    """
+
+    key: Optional[str] = None
+    batches: int = 0
+    documents: int = 0
+    digests: List[str] = field(default_factory=list)
+
+    def add(self, size: int, digest: str) -> None:
+        self.batches += 1
+        self.documents += size
+        self.digests.append(digest)
+
+    def truncate(self, batches: int, documents: int) -> None:
+        """Keep progress for the first `batches` batches only"""
+        self.batches = batches
+        self.documents = documents
+        del self.digests[batches:]
+
+    @staticmethod
+    def cache():
+        return caches[settings.EMBEDDING_CACHE_ALIAS]
+
+    @classmethod
+    def load(cls, key: str) -> "IngestProgress":
+        try:
+            saved = cls.cache().get(key) or {}
+        except Exception as e:
+            logger.warning(f"Failed to read ingest progress: {e}")
+            saved = {}
+        return cls(key=key, **saved)
+
+    def save(self) -> None:
+        if not self.key:
+            return
+        try:
+            self.cache().set(
+                self.key,
+                {
+                    "batches": self.batches,
+                    "documents": self.documents,
+                    "digests": self.digests,
+                },
+                timeout=settings.VECTORSTORE_INGEST_PROGRESS_TTL,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save ingest progress: {e}")
+
+    def clear(self) -> None:
+        if not self.key:
+            return
+        try:
+            self.cache().delete(self.key)
+        except Exception as e:
+            logger.warning(f"Failed to clear ingest progress: {e}")
+
+
+def ingest_documents(
+    vectorstore_class: Type[VectorStore],
+    config: Dict[str, Any],
+    documents: Iterable[Document],
+    batch_size: int,
+    concurrency: int = 1,
+    progress: Optional[IngestProgress] = None,
+    resume: bool = False,
+) -> Optional[VectorStore]:
+    """
+    Embed and write documents to a vectorstore in batches.
+
+    The first batch creates the vectorstore with `from_documents`, which creates
+    indexes for vectorstores that need one. Remaining batches are added with
+    AddDocuments by up to `concurrency` threads. At most `concurrency` batches
+    are in flight, so memory use is bounded by batch size rather than corpus size.
+
+    With `resume`, batches a previous attempt saved to `progress` are skipped and
+    the rest are added to `vectorstore_class(**config)`. Only resume when that
+    reopens the same store, see `can_resume_ingest`. Otherwise saved progress is
+    discarded and every batch is ingested.
+
+    Returns None if there are no documents to ingest.
+    """
+    progress = progress or IngestProgress()
+    batches = batched(documents, batch_size)
+    if not resume and progress.batches:
+        logger.warning(
+            f"Can't resume ingest into {vectorstore_class.__name__}, the config "
+            f"doesn't name a persistent store. Ingesting from the first batch"
+        )
+        progress.truncate(0, 0)
+
+    # skip batches written by a previous attempt while the source still produces
+    # the same documents
+    batch = next(batches, None)
+    skipped = 0
+    skipped_documents = 0
+    while (
+        batch is not None
+        and skipped < min(progress.batches, len(progress.digests))
+        and batch_digest(batch) == progress.digests[skipped]
+    ):
+        skipped += 1
+        skipped_documents += len(batch)
+        batch = next(batches, None)
+    if skipped < progress.batches:
+        logger.warning(
+            f"Documents changed since the previous ingest, ingesting from batch "
+            f"{skipped} instead of {progress.batches}"
+        )
+    progress.truncate(skipped, skipped_documents)
+
+    if skipped:
+        logger.info(f"Resuming ingest after {skipped} batches")
+        vectorstore = vectorstore_class(**config)
+        if batch is not None:
+            batches = chain([batch], batches)
+    elif batch is None:
+        return None
+    else:
+        vectorstore = vectorstore_class.from_documents(documents=batch, **config)
+        progress.add(len(batch), batch_digest(batch))
+        progress.save()
+
+    add_documents = AddDocuments(vectorstore=vectorstore)
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        run_batches(
+            executor,
+            add_documents.invoke,
+            batches,
+            start=progress.batches,
+            concurrency=max(concurrency, 1),
+            progress=progress,
+        )
+
+    logger.info(
+        f"Ingested {progress.documents} documents in {progress.batches} batches"
+    )
+    return vectorstore
+
+
+def run_batches(
+    executor: ThreadPoolExecutor,
+    func: Callable[[List[Document]], Any],
+    batches: Iterator[List[Document]],
+    start: int,
+    concurrency: int,
+    progress: IngestProgress,
+) -> None:
+    in_flight: Dict[Future, int] = {}
+    written: Dict[int, Tuple[int, str]] = {}
+    pending: Dict[int, Tuple[int, str]] = {}
+
+    def collect(futures):
+        for future in futures:
+            index = in_flight.pop(future)
+            # raise errors from the batch, progress stops at the last good batch
+            future.result()
+            written[index] = pending.pop(index)
+        while progress.batches in written:
+            progress.add(*written.pop(progress.batches))
+        progress.save()
+
+    try:
+        for index, batch in enumerate(batches, start=start):
+            if len(in_flight) >= concurrency:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending[index] = (len(batch), batch_digest(batch))
+            in_flight[executor.submit(func, batch)] = index
+        collect(wait(in_flight).done)
+    finally:
+        for future in in_flight:
+            future.cancel()
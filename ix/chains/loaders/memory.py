@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from abc import ABC
 from functools import singledispatch
@@ -10,7 +11,8 @@ from langchain.memory import CombinedMemory
 from langchain.schema import BaseMemory, BaseChatMessageHistory
 from pydantic import BaseModel
 
-from ix.chains.loaders.core import load_node, IxContext
+from ix.chains.loaders.core import load_node, aload_node, IxContext
+from ix.chains.loaders.graph import ChainGraph
 from ix.chains.models import ChainNode, ChainEdge
 from ix.utils.importlib import import_class
 from ix.utils.pydantic import get_model_fields
@@ -83,7 +85,9 @@ def load_chat_memory_backend_config(node: ChainNode, ix_handler: IxHandler):
     return backend_config
 
 
-def load_memory_property(edge_group: List[ChainEdge], context: IxContext) -> BaseMemory:
+def load_memory_property(
+    edge_group: List[ChainEdge], context: IxContext, graph: ChainGraph = None
+) -> BaseMemory:
     """
     Load memories from a list of configs and merge in to a CombinedMemory instance.
     """
@@ -92,10 +96,30 @@ def load_memory_property(edge_group: List[ChainEdge], context: IxContext) -> Bas
 
     if len(node_group) == 1:
         # no need to combine
-        return load_node(node_group[0], context)
+        return load_node(node_group[0], context, graph=graph)
 
     # auto-merge into CombinedMemory
-    return CombinedMemory(memories=[load_node(node, context) for node in node_group])
+    return CombinedMemory(
+        memories=[load_node(node, context, graph=graph) for node in node_group]
+    )
+
+
+async def aload_memory_property(
+    edge_group: List[ChainEdge], context: IxContext, graph: ChainGraph = None
+) -> BaseMemory:
+    """Async variant of `load_memory_property`. Memories are loaded concurrently."""
+    node_group = [edge.source for edge in edge_group]
+    logger.debug(f"Combining memory classes config={node_group}")
+
+    if len(node_group) == 1:
+        # no need to combine
+        return await aload_node(node_group[0], context, graph=graph)
+
+    # auto-merge into CombinedMemory
+    memories = await asyncio.gather(
+        *[aload_node(node, context, graph=graph) for node in node_group]
+    )
+    return CombinedMemory(memories=list(memories))
 
 
 def get_memory_session(
@@ -0,0 +1,354 @@
+import asyncio
+import dataclasses
+import functools
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from ix.utils.importlib import import_class
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class NodeLoadSpan:
+    """
+    Time spent loading a single ChainNode, broken down by load phase.
+
+    Phases are: format_config, secrets, node_loader, properties, import and
+    initialize. `properties` includes loading child nodes, each of which has its
+    own span. `self_time` excludes it.
+    """
+
+    node_id: UUID
+    name: str
+    class_path: str
+    node_type: str
+    started_at: datetime
+    phases: Dict[str, float] = dataclasses.field(default_factory=dict)
+    duration: Optional[float] = None
+
+    @property
+    def self_time(self) -> float:
+        return (self.duration or 0) - self.phases.get("properties", 0)
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[name] = self.phases.get(name, 0) + elapsed
+
+
+@dataclasses.dataclass
+class SubgraphSpan:
+    """
+    Wall clock time spent initializing a child subgraph of a map, branch,
+    sequence or aggregate. Named by its placeholder and key, e.g. `map[a]` or
+    `sequence[0]`. Subgraphs nested within it are its children.
+
+    Independent subgraphs are initialized concurrently, so the time spent on a
+    subgraph is bounded by its slowest child.
+    """
+
+    name: str
+    duration: Optional[float] = None
+    children: List["SubgraphSpan"] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class LoadProfile:
+    """Spans for all nodes and subgraphs loaded while initializing a chain."""
+
+    chain_id: str
+    task_id: Optional[str] = None
+    user_id: Optional[str] = None
+    spans: List[NodeLoadSpan] = dataclasses.field(default_factory=list)
+    subgraphs: List[SubgraphSpan] = dataclasses.field(default_factory=list)
+    duration: Optional[float] = None
+    _lock: threading.Lock = dataclasses.field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def add(self, span: NodeLoadSpan) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def add_subgraph(
+        self, span: SubgraphSpan, parent: Optional[SubgraphSpan] = None
+    ) -> None:
+        with self._lock:
+            (parent.children if parent else self.subgraphs).append(span)
+
+    def critical_path(self) -> List[SubgraphSpan]:
+        """The slowest subgraph, followed by its slowest child at each level."""
+        path = []
+        subgraphs = self.subgraphs
+        while subgraphs:
+            slowest = max(subgraphs, key=lambda subgraph: subgraph.duration or 0)
+            path.append(slowest)
+            subgraphs = slowest.children
+        return path
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregate spans by class_path, slowest components first, and the
+        critical path through the subgraphs.
+
+        Components are ranked by self time so a node isn't blamed for the time
+        spent loading its children.
+        """
+        groups = defaultdict(list)
+        for span in self.spans:
+            groups[span.class_path].append(span)
+
+        summary = []
+        for class_path, spans in groups.items():
+            phases = defaultdict(float)
+            for span in spans:
+                for phase, elapsed in span.phases.items():
+                    phases[phase] += elapsed
+            summary.append(
+                {
+                    "class_path": class_path,
+                    "count": len(spans),
+                    "self_time": sum(span.self_time for span in spans),
+                    "max_self_time": max(span.self_time for span in spans),
+                    "phases": dict(phases),
+                }
+            )
+        return {
+            "components": sorted(
+                summary, key=lambda item: item["self_time"], reverse=True
+            ),
+            "critical_path": [
+                {"name": subgraph.name, "duration": subgraph.duration}
+                for subgraph in self.critical_path()
+            ],
+        }
+
+
+class LoadProfileSink(ABC):
+    """Receives a LoadProfile after each chain is initialized."""
+
+    @abstractmethod
+    def export(self, profile: LoadProfile) -> None:
+        ...
+
+    async def aexport(self, profile: LoadProfile) -> None:
+        await sync_to_async(self.export)(profile)
+
+
+class LoggingLoadProfileSink(LoadProfileSink):
+    """Log the slowest components of each chain load."""
+
+    limit = 5
+
+    def export(self, profile: LoadProfile) -> None:
+        summary = profile.summary()
+        slowest = ", ".join(
+            f"{item['class_path']} x{item['count']} {item['self_time']:.4f}s"
+            for item in summary["components"][: self.limit]
+        )
+        critical_path = " > ".join(
+            f"{item['name']} {item['duration'] or 0:.4f}s"
+            for item in summary["critical_path"]
+        )
+        duration = f"{profile.duration:.4f}s" if profile.duration else "-"
+        logger.info(
+            f"Loaded chain={profile.chain_id} nodes={len(profile.spans)} "
+            f"in {duration} slowest: {slowest} critical path: {critical_path or '-'}"
+        )
+
+    async def aexport(self, profile: LoadProfile) -> None:
+        self.export(profile)
+
+
+class SpanLoggingLoadProfileSink(LoadProfileSink):
+    """Log a record for each node load to the `ix.chains.load_profile` logger.
+
+    The span is attached to each record as `load_span` so a handler for this
+    logger can collect spans apart from the application log.
+    """
+
+    logger = logging.getLogger("ix.chains.load_profile")
+
+    def get_span_data(self, profile: LoadProfile, span: NodeLoadSpan) -> dict:
+        return {
+            "chain_id": profile.chain_id,
+            "task_id": profile.task_id,
+            "user_id": profile.user_id,
+            "node_id": str(span.node_id),
+            "class_path": span.class_path,
+            "started_at": span.started_at.isoformat(),
+            "duration": span.duration,
+            "self_time": span.self_time,
+            "phases": span.phases,
+        }
+
+    def export(self, profile: LoadProfile) -> None:
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        for span in profile.spans:
+            self.logger.info(
+                f"Loaded node={span.node_id} class_path={span.class_path} "
+                f"in {span.duration or 0:.4f}s",
+                extra={"load_span": self.get_span_data(profile, span)},
+            )
+
+    async def aexport(self, profile: LoadProfile) -> None:
+        self.export(profile)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_sinks(class_paths: tuple) -> List[LoadProfileSink]:
+    return [import_class(class_path)() for class_path in class_paths]
+
+
+def get_sinks() -> List[LoadProfileSink]:
+    """Sinks configured by CHAIN_LOAD_PROFILE_SINKS"""
+    return _get_sinks(tuple(settings.CHAIN_LOAD_PROFILE_SINKS))
+
+
+_profile: ContextVar[Optional[LoadProfile]] = ContextVar("load_profile", default=None)
+_span: ContextVar[Optional[NodeLoadSpan]] = ContextVar("load_span", default=None)
+_subgraph: ContextVar[Optional[SubgraphSpan]] = ContextVar(
+    "load_subgraph", default=None
+)
+
+
+@contextmanager
+def profile_load(
+    chain_id: UUID | str, context: Any = None, enabled: bool = None
+) -> Optional[LoadProfile]:
+    """Collect spans for nodes loaded within the block.
+
+    Profiling is enabled when sinks are configured. Use `export_profile` to send
+    the profile to the sinks.
+    """
+    if enabled is None:
+        enabled = bool(settings.CHAIN_LOAD_PROFILE_SINKS)
+    if not enabled:
+        yield None
+        return
+
+    profile = LoadProfile(
+        chain_id=str(chain_id),
+        task_id=getattr(context, "task_id", None),
+        user_id=getattr(context, "user_id", None),
+    )
+    token = _profile.set(profile)
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.duration = time.perf_counter() - start
+        _profile.reset(token)
+
+
+def export_profile(profile: Optional[LoadProfile]) -> None:
+    if profile is None:
+        return
+    for sink in get_sinks():
+        try:
+            sink.export(profile)
+        except Exception:
+            logger.exception(f"Failed to export load profile to {sink}")
+
+
+async def aexport_profile(profile: Optional[LoadProfile]) -> None:
+    if profile is None:
+        return
+    for sink in get_sinks():
+        try:
+            await sink.aexport(profile)
+        except Exception:
+            logger.exception(f"Failed to export load profile to {sink}")
+
+
+@contextmanager
+def node_span(node: Any):
+    """Record a span for loading a node when a profile is active."""
+    profile = _profile.get()
+    if profile is None:
+        yield None
+        return
+
+    span = NodeLoadSpan(
+        node_id=node.id,
+        name=node.name,
+        class_path=node.class_path,
+        node_type=node.node_type.type,
+        started_at=datetime.now(tz=timezone.utc),
+    )
+    token = _span.set(span)
+    start = time.perf_counter()
+    try:
+        yield span
+    finally:
+        span.duration = time.perf_counter() - start
+        _span.reset(token)
+        profile.add(span)
+
+
+@contextmanager
+def subgraph_span(name: str):
+    """Record a span for initializing a subgraph when a profile is active."""
+    profile = _profile.get()
+    if profile is None:
+        yield None
+        return
+
+    span = SubgraphSpan(name=name)
+    profile.add_subgraph(span, parent=_subgraph.get())
+    token = _subgraph.set(span)
+    start = time.perf_counter()
+    try:
+        yield span
+    finally:
+        span.duration = time.perf_counter() - start
+        _subgraph.reset(token)
+
+
+@contextmanager
+def load_phase(name: str):
+    """Record time spent in a load phase of the current node span."""
+    span = _span.get()
+    if span is None:
+        yield
+        return
+    with span.phase(name):
+        yield
+
+
+def profile_node_load(func):
+    """Decorator recording a span for a node loader, sync or async.
+
+    The node must be the first argument.
+    """
+    if asyncio.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(node, *args, **kwargs):
+            with node_span(node):
+                return await func(node, *args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(node, *args, **kwargs):
+        with node_span(node):
+            return func(node, *args, **kwargs)
+
+    return wrapper
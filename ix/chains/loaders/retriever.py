@@ -1,14 +1,15 @@
 from copy import deepcopy
-from typing import List
+from typing import List, Optional
 
 from asgiref.sync import sync_to_async
 from langchain.schema import BaseRetriever
 from langchain.schema.vectorstore import VectorStore
 
-from ix.chains.fixture_src.vectorstores import get_vectorstore_retriever_fieldnames
 from ix.chains.loaders.context import IxContext
-from ix.chains.loaders.core import load_node
-from ix.chains.models import ChainEdge
+from ix.chains.loaders.core import load_node, aload_node
+from ix.chains.loaders.graph import ChainGraph
+from ix.chains.models import ChainEdge, ChainNode
+from ix.chains.registry import registry
 from ix.utils.importlib import import_class
 
 
@@ -23,8 +24,32 @@ async def async_aget_relevant_documents(self, *args, **kwargs):
 setattr(BaseRetriever, "_aget_relevant_documents", async_aget_relevant_documents)
 
 
+def get_retriever_config(node: ChainNode) -> Optional[dict]:
+    """Return the retriever config for a node that is a VectorStore.
+
+    Returns None if the node's component is not a VectorStore.
+    """
+    component_class = import_class(node.class_path)
+    if not (
+        isinstance(component_class, type) and issubclass(component_class, VectorStore)
+    ):
+        return None
+
+    # unpack retriever fields from vectorstore config
+    config = deepcopy(node.config)
+    retriever_fields = registry.get_retriever_fieldnames(node.class_path)
+    retriever_config = {}
+    for field in retriever_fields:
+        if field in config:
+            retriever_config[field] = config[field]
+    return retriever_config
+
+
 def load_retriever_property(
-    edge_group: List[ChainEdge], context: IxContext, **kwargs
+    edge_group: List[ChainEdge],
+    context: IxContext,
+    graph: ChainGraph = None,
+    **kwargs,
 ) -> BaseRetriever:
     """Property loader for retriever.
 
@@ -34,21 +59,30 @@ def load_retriever_property(
     """
     assert len(edge_group) == 1
     node = edge_group[0].source
-    component_class = import_class(node.class_path)
-
-    if isinstance(component_class, type) and issubclass(component_class, VectorStore):
-        # unpack retriever fields from vectorstore config
-        config = deepcopy(node.config)
-        retriever_fields = get_vectorstore_retriever_fieldnames(node.class_path)
-        retriever_config = {}
-        for field in retriever_fields:
-            if field in config:
-                retriever_config[field] = config[field]
+    retriever_config = get_retriever_config(node)
 
+    if retriever_config is not None:
         # load vectorstore and then convert to retriever
-        component = load_node(node, context)
+        component = load_node(node, context, graph=graph)
         return component.as_retriever(**retriever_config)
 
     else:
         # return as a regular component
-        return load_node(node, context)
+        return load_node(node, context, graph=graph)
+
+
+async def aload_retriever_property(
+    edge_group: List[ChainEdge],
+    context: IxContext,
+    graph: ChainGraph = None,
+    **kwargs,
+) -> BaseRetriever:
+    """Async variant of `load_retriever_property`"""
+    assert len(edge_group) == 1
+    node = edge_group[0].source
+    retriever_config = get_retriever_config(node)
+
+    component = await aload_node(node, context, graph=graph)
+    if retriever_config is not None:
+        return component.as_retriever(**retriever_config)
+    return component
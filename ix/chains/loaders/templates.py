@@ -1,9 +1,9 @@
 from typing import TypeVar, Generic, Dict, Any, Set, Type
 
-from asgiref.sync import sync_to_async
 from pydantic import BaseModel
 
 from ix.chains.loaders.context import IxContext
+from ix.chains.loaders.graph import ChainGraph
 from ix.chains.models import ChainNode
 from ix.utils.config import get_config_variables
 from ix.utils.pydantic import create_args_model
@@ -26,19 +26,31 @@ class NodeTemplate(Generic[T]):
     for different source documents.
     """
 
-    def __init__(self, node: ChainNode, context: IxContext):
+    def __init__(self, node: ChainNode, context: IxContext, graph: ChainGraph = None):
         self.node = node
         self.context = context
+        self._graph = graph
+
+    @property
+    def graph(self) -> ChainGraph:
+        """Graph of the chain the node belongs to. Loaded on first access."""
+        if self._graph is None:
+            self._graph = ChainGraph.load(self.node.chain_id)
+        return self._graph
 
     def format(self, input: Dict[str, Any]) -> T:
         from ix.chains.loaders.core import load_node
 
-        return load_node(self.node, self.context, variables=input)
+        return load_node(self.node, self.context, variables=input, graph=self.graph)
 
     async def aformat(self, input: Dict[str, Any]) -> T:
-        from ix.chains.loaders.core import load_node
+        from ix.chains.loaders.core import aload_node
 
-        return await sync_to_async(load_node)(self.node, self.context, variables=input)
+        if self._graph is None:
+            self._graph = await ChainGraph.aload(self.node.chain_id)
+        return await aload_node(
+            self.node, self.context, variables=input, graph=self._graph
+        )
 
     def get_variables(self, node: ChainNode = None) -> Set[str]:
         """
@@ -48,12 +60,8 @@ class NodeTemplate(Generic[T]):
         variables = get_config_variables(node.config if node.config else {})
 
         # Recursively traverse for all connected nodes
-        connected_edges = node.incoming_edges.filter(relation="PROP").order_by(
-            "target_key"
-        )
-        for edge in connected_edges.iterator():
-            connected_node = ChainNode.objects.get(pk=edge.source_id)
-            variables.update(self.get_variables(connected_node))
+        for edge in self.graph.incoming(node.id, "PROP"):
+            variables.update(self.get_variables(edge.source))
 
         return variables
 
@@ -61,16 +69,9 @@ class NodeTemplate(Generic[T]):
         """
         Helper recursive function to extract config variables.
         """
-        node = node if node else self.node
-        variables = get_config_variables(node.config if node.config else {})
-
-        # Recursively traverse for all connected nodes
-        connected_edges = node.incoming_edges.filter(relation="PROP").order_by("key")
-        async for edge in connected_edges.aiterator():
-            connected_node = await ChainNode.objects.aget(pk=edge.source_id)
-            variables.update(await self.get_variables(connected_node))
-
-        return variables
+        if self._graph is None:
+            self._graph = await ChainGraph.aload(self.node.chain_id)
+        return self.get_variables(node)
 
     def get_args_schema(self) -> Type[BaseModel]:
         """
@@ -5,9 +5,10 @@ from langchain.schema.runnable import Runnable
 from langchain.tools import BaseTool, Tool
 from langchain_core.tools import StructuredTool
 
-from ix.chains.fixture_src.tools import TOOL_BASE_FIELDS
+from ix.chains.fixture_src.common import TOOL_BASE_FIELDS
 from ix.chains.loaders.context import IxContext
-from ix.chains.loaders.core import init_flow
+from ix.chains.loaders.core import init_flow, ainit_flow
+from ix.chains.loaders.graph import ChainGraph
 from ix.chains.models import ChainEdge
 from ix.runnable.ix import IxNode
 
@@ -26,10 +27,22 @@ def extract_tool_kwargs(kwargs: dict) -> dict:
 
 
 def load_flow_property(
-    edge_group: List[ChainEdge], context: IxContext
+    edge_group: List[ChainEdge], context: IxContext, graph: ChainGraph = None
 ) -> List[Runnable]:
     nodes = [edge.source for edge in edge_group]
-    flows = init_flow(nodes, context)
+    flows = init_flow(nodes, context, graph=graph)
+
+    if not isinstance(flows, list):
+        flows = [flows]
+
+    return flows
+
+
+async def aload_flow_property(
+    edge_group: List[ChainEdge], context: IxContext, graph: ChainGraph = None
+) -> List[Runnable]:
+    nodes = [edge.source for edge in edge_group]
+    flows = await ainit_flow(nodes, context, graph=graph)
 
     if not isinstance(flows, list):
         flows = [flows]
@@ -62,12 +75,31 @@ def get_runnable_tool(
 
 
 def load_tool_property(
-    edge_group: List[ChainEdge], context: IxContext, **kwargs
+    edge_group: List[ChainEdge],
+    context: IxContext,
+    graph: ChainGraph = None,
+    **kwargs,
 ) -> BaseTool:
     """Loads all connected nodes as Tools. Intended for old style
     agents that still expect BaseTool instances.
     """
-    flows = load_flow_property(edge_group, context)
+    flows = load_flow_property(edge_group, context, graph=graph)
+    return get_flow_tools(flows)
+
+
+async def aload_tool_property(
+    edge_group: List[ChainEdge],
+    context: IxContext,
+    graph: ChainGraph = None,
+    **kwargs,
+) -> BaseTool:
+    """Async variant of `load_tool_property`"""
+    flows = await aload_flow_property(edge_group, context, graph=graph)
+    return get_flow_tools(flows)
+
+
+def get_flow_tools(flows: List[Runnable]) -> List[BaseTool]:
+    """Convert flows into Tools"""
     tools = []
 
     for root in flows:
@@ -1,11 +1,18 @@
 import logging
 from typing import Dict, Any, Type
 
-from langchain.document_loaders.base import BaseLoader
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from langchain.schema.vectorstore import VectorStore
 
-from ix.chains.fixture_src.vectorstores import get_vectorstore_retriever_fieldnames
-from ix.chains.loaders.text_splitter import TextSplitterShim
+from ix.chains.loaders.ingest import (
+    IngestProgress,
+    can_resume_ingest,
+    get_ingest_key,
+    ingest_documents,
+    iter_documents,
+)
+from ix.chains.registry import registry
 from ix.utils.importlib import import_class
 
 
@@ -22,7 +29,7 @@ def initialize_vectorstore(class_path: str, config: Dict[str, Any]) -> VectorSto
     config = config.copy()
 
     # remove retriever fields from the config, if present
-    retriever_fields = get_vectorstore_retriever_fieldnames(class_path)
+    retriever_fields = registry.get_retriever_fieldnames(class_path)
     for field in retriever_fields:
         config.pop(field, None)
 
@@ -33,20 +40,25 @@ def initialize_vectorstore(class_path: str, config: Dict[str, Any]) -> VectorSto
     # Ingest and load from documents if TextSplitters or BaseLoaders
     # is configured as a document source.
     document_source = config.pop("documents", None)
-    if document_source:
-        if isinstance(document_source, TextSplitterShim):
-            document_loader = document_source.document_loader
-            documents = document_source.text_splitter.split_documents(
-                document_loader.load()
-            )
-        elif isinstance(document_source, BaseLoader):
-            documents = document_source.load()
-
-        else:
-            raise ValueError(
-                f"unsupported document_source type: {type(document_source)}"
-            )
+    if document_source and settings.VECTORSTORE_INGEST_BATCH_SIZE > 0:
+        # Stream documents in batches so the corpus is never loaded at once.
+        progress = IngestProgress.load(
+            get_ingest_key(class_path, config, document_source)
+        )
+        vectorstore = ingest_documents(
+            vectorstore_class,
+            config,
+            iter_documents(document_source),
+            batch_size=settings.VECTORSTORE_INGEST_BATCH_SIZE,
+            concurrency=settings.VECTORSTORE_INGEST_CONCURRENCY,
+            progress=progress,
+            resume=can_resume_ingest(vectorstore_class, config),
+        )
+        # progress is only needed to resume a failed ingest
+        progress.clear()
 
+    elif document_source:
+        documents = list(iter_documents(document_source))
         if documents:
             vectorstore = vectorstore_class.from_documents(
                 documents=documents, **config
@@ -58,3 +70,16 @@ def initialize_vectorstore(class_path: str, config: Dict[str, Any]) -> VectorSto
         vectorstore = vectorstore_class(**config)
 
     return vectorstore
+
+
+async def ainitialize_vectorstore(
+    class_path: str, config: Dict[str, Any]
+) -> VectorStore:
+    """
+    Async variant of `initialize_vectorstore`.
+
+    Loading and ingesting documents does blocking IO so it runs in a worker thread.
+    """
+    return await sync_to_async(initialize_vectorstore, thread_sensitive=False)(
+        class_path, config
+    )
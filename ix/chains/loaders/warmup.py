@@ -0,0 +1,70 @@
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.db import connections
+
+from ix.utils.importlib import warm_import_cache
+
+logger = logging.getLogger(__name__)
+
+
+def warm_node_types() -> Dict[str, str]:
+    """
+    Import the class of every NodeType so the first chain loaded by a fresh
+    worker doesn't pay for importing langchain modules.
+
+    Returns:
+        dict of class_path to error message for classes that failed to import.
+    """
+    from ix.chains.models import NodeType
+
+    start = time.perf_counter()
+    class_paths = list(NodeType.objects.values_list("class_path", flat=True))
+    errors = warm_import_cache(class_paths)
+    logger.info(
+        f"Imported {len(class_paths) - len(errors)}/{len(class_paths)} node types "
+        f"in {time.perf_counter() - start:.2f}s"
+    )
+    for class_path, error in errors.items():
+        logger.debug(f"Failed to import node type class_path={class_path}: {error}")
+    return errors
+
+
+def _warm_node_types_in_thread():
+    try:
+        warm_node_types()
+    except Exception:
+        logger.exception("Failed to warm node type imports")
+    finally:
+        # thread has its own connection that would otherwise be left open
+        connections.close_all()
+
+
+def start_warmup(background: bool = True) -> Optional[threading.Thread]:
+    """
+    Warm node type imports. Runs in a daemon thread by default so startup isn't
+    blocked; imports requested before it finishes wait on the import lock.
+    """
+    if not background:
+        try:
+            warm_node_types()
+        except Exception:
+            logger.exception("Failed to warm node type imports")
+        return None
+
+    thread = threading.Thread(
+        target=_warm_node_types_in_thread, name="node-type-warmup", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def warmup_from_settings() -> Optional[threading.Thread]:
+    """Warm imports as configured by NODE_TYPE_IMPORT_WARMUP"""
+    mode = settings.NODE_TYPE_IMPORT_WARMUP
+    if mode == "off":
+        return None
+    return start_warmup(background=mode != "sync")
@@ -0,0 +1,65 @@
+import os
+import statistics
+import subprocess
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+# Each target is timed in a fresh interpreter so imports aren't already cached.
+TARGETS = {
+    "django": "",
+    "fast_api": "import ix.server.fast_api",
+    "celery": "from ix.server.celery import app; app.loader.import_default_modules()",
+    "components_manifest": "from ix.chains.registry import registry; registry.entries()",
+    "components_source": "from ix.chains.registry import build_manifest; build_manifest()",
+}
+
+SCRIPT = """
+import time
+start = time.perf_counter()
+import django
+django.setup()
+{code}
+print(time.perf_counter() - start)
+"""
+
+
+class Command(BaseCommand):
+    """
+    Measures how long it takes a new process to start. Used to check the cost of
+    imports done by server and worker processes and the component registry.
+    """
+
+    help = "Benchmarks process startup time."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "targets",
+            nargs="*",
+            help=f"Targets to benchmark: {', '.join(TARGETS)}. Defaults to all.",
+        )
+        parser.add_argument("--runs", type=int, default=5)
+
+    def time_target(self, code: str) -> float:
+        output = subprocess.run(
+            [sys.executable, "-c", SCRIPT.format(code=code)],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=os.environ.copy(),
+        )
+        return float(output.stdout.strip().splitlines()[-1])
+
+    def handle(self, *args, **options):
+        targets = options["targets"] or list(TARGETS)
+        runs = options["runs"]
+        if unknown := set(targets) - set(TARGETS):
+            raise CommandError(f"Unknown targets: {', '.join(sorted(unknown))}")
+
+        self.stdout.write(f"{'target':<24}{'min':>10}{'median':>10}{'max':>10}")
+        for target in targets:
+            times = [self.time_target(TARGETS[target]) for _ in range(runs)]
+            self.stdout.write(
+                f"{target:<24}{min(times):>9.3f}s{statistics.median(times):>9.3f}s"
+                f"{max(times):>9.3f}s"
+            )
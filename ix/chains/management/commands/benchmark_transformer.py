@@ -0,0 +1,112 @@
+import statistics
+import time
+from pathlib import Path
+from typing import List
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+DEFAULT_PATH = settings.BASE_DIR.parent / "test_data" / "documents"
+DEFAULT_TRANSFORMER = "langchain.text_splitter.RecursiveCharacterTextSplitter"
+
+
+def parse_ints(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+class Command(BaseCommand):
+    """
+    Compares serial and parallel RunTransformer throughput.
+
+    Files in `--path` are loaded as documents and repeated `--copies` times to
+    build a corpus large enough to measure. The corpus is transformed serially,
+    then with each `--workers` process count. Parallel output is checked against
+    the serial output.
+
+    Example:
+        ./manage.py benchmark_transformer --copies 2000 --workers 2,4,8
+    """
+
+    help = "Benchmarks serial vs. parallel document transforms."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", type=Path, default=DEFAULT_PATH)
+        parser.add_argument("--copies", type=int, default=500)
+        parser.add_argument("--class-path", default=DEFAULT_TRANSFORMER)
+        parser.add_argument("--chunk-size", type=int, default=200)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.DOCUMENT_TRANSFORM_CHUNK_SIZE,
+            help="Documents sent to a worker at a time.",
+        )
+        parser.add_argument("--workers", type=parse_ints, default=[2, 4])
+        parser.add_argument("--runs", type=int, default=3)
+
+    def handle(self, *args, **options):
+        # imported here to keep langchain out of management command discovery
+        from langchain_core.documents import Document
+
+        from ix.runnable.documents import (
+            RunTransformer,
+            shutdown_transform_executor,
+        )
+
+        files = sorted(path for path in options["path"].glob("*") if path.is_file())
+        if not files:
+            raise CommandError(f"No files found in {options['path']}")
+        corpus = [
+            Document(
+                page_content=path.read_text(errors="ignore"),
+                metadata={"source": str(path), "copy": copy},
+            )
+            for copy in range(options["copies"])
+            for path in files
+        ]
+
+        transformer_options = {
+            "chunk_size": options["chunk_size"],
+            "chunk_overlap": 0,
+        }
+        serial = RunTransformer.from_config(options["class_path"], transformer_options)
+        expected = serial.invoke(corpus)
+        self.stdout.write(
+            f"corpus files={len(files)} documents={len(corpus)} "
+            f"output={len(expected)} transformer={options['class_path']}"
+        )
+        self.stdout.write(f"{'mode':<16}{'min':>10}{'median':>10}{'speedup':>10}")
+        baseline = self.report("serial", lambda: serial.invoke(corpus), options)
+
+        parallel = RunTransformer.from_config(
+            options["class_path"],
+            {
+                **transformer_options,
+                "parallel": True,
+                "parallel_chunk_size": options["batch_size"],
+            },
+        )
+        for workers in options["workers"]:
+            # each worker count needs its own pool
+            settings.DOCUMENT_TRANSFORM_WORKERS = workers
+            shutdown_transform_executor()
+
+            # start the pool before timing so process startup isn't measured
+            if parallel.invoke(corpus) != expected:
+                raise CommandError(f"workers={workers} output doesn't match serial")
+            self.report(
+                f"workers={workers}",
+                lambda: parallel.invoke(corpus),
+                options,
+                baseline,
+            )
+
+    def report(self, mode, func, options, baseline=None) -> float:
+        times = []
+        for _ in range(options["runs"]):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        median = statistics.median(times)
+        speedup = f"{baseline / median:.2f}x" if baseline else "-"
+        self.stdout.write(f"{mode:<16}{min(times):>9.3f}s{median:>9.3f}s{speedup:>10}")
+        return median
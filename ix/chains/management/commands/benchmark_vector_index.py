@@ -0,0 +1,187 @@
+import random
+import statistics
+import time
+from typing import Dict, List
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+# operator and operator class for each distance function
+DISTANCES = {
+    "l2": ("<->", "vector_l2_ops"),
+    "ip": ("<#>", "vector_ip_ops"),
+    "cosine": ("<=>", "vector_cosine_ops"),
+}
+
+TABLE = "benchmark_vector_index"
+
+
+def parse_ints(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+class Command(BaseCommand):
+    """
+    Reports recall and latency of pg_vector index searches on a synthetic corpus.
+
+    Random vectors are written to a temporary table. Exact nearest neighbors are
+    found with a sequential scan, then ivfflat and hnsw indexes are built and
+    searched with each `probes` and `ef_search` value. Nothing is left behind;
+    the table is dropped when the transaction ends.
+
+    Example:
+        ./manage.py benchmark_vector_index --rows 20000 --dim 1536 --probes 1,10
+    """
+
+    help = "Benchmarks recall vs. latency of pg_vector indexes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10000)
+        parser.add_argument("--dim", type=int, default=128)
+        parser.add_argument("--queries", type=int, default=50)
+        parser.add_argument("--k", type=int, default=10)
+        parser.add_argument("--distance", choices=list(DISTANCES), default="cosine")
+        parser.add_argument(
+            "--index", choices=["ivfflat", "hnsw", "both"], default="both"
+        )
+        parser.add_argument("--lists", type=int, default=100)
+        parser.add_argument("--m", type=int, default=16)
+        parser.add_argument("--ef-construction", type=int, default=64)
+        parser.add_argument("--probes", type=parse_ints, default=[1, 5, 10, 20])
+        parser.add_argument("--ef-search", type=parse_ints, default=[20, 40, 100, 200])
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        if options["k"] > options["rows"]:
+            raise CommandError("--k must not be larger than --rows")
+
+        rng = random.Random(options["seed"])
+        operator, opclass = DISTANCES[options["distance"]]
+        dim = options["dim"]
+        queries = [
+            self.to_vector([rng.random() for _ in range(dim)])
+            for _ in range(options["queries"])
+        ]
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            self.create_corpus(cursor, options["rows"], dim, options["seed"])
+            exact = [
+                self.search(cursor, operator, query, options["k"]) for query in queries
+            ]
+            self.stdout.write(
+                f"corpus rows={options['rows']} dim={dim} "
+                f"distance={options['distance']} k={options['k']}"
+            )
+            self.stdout.write(
+                f"{'index':<10}{'param':<18}{'build':>10}{'recall':>10}"
+                f"{'p50':>10}{'p95':>10}"
+            )
+
+            if options["index"] in ("ivfflat", "both"):
+                build = self.create_index(
+                    cursor,
+                    f"USING ivfflat (embedding {opclass}) "
+                    f"WITH (lists = {options['lists']})",
+                )
+                for probes in options["probes"]:
+                    self.run(
+                        cursor,
+                        "ivfflat",
+                        {"ivfflat.probes": probes},
+                        build,
+                        operator,
+                        queries,
+                        exact,
+                        options["k"],
+                    )
+                cursor.execute(f"DROP INDEX {TABLE}_idx")
+
+            if options["index"] in ("hnsw", "both"):
+                build = self.create_index(
+                    cursor,
+                    f"USING hnsw (embedding {opclass}) "
+                    f"WITH (m = {options['m']}, "
+                    f"ef_construction = {options['ef_construction']})",
+                )
+                for ef_search in options["ef_search"]:
+                    self.run(
+                        cursor,
+                        "hnsw",
+                        {"hnsw.ef_search": ef_search},
+                        build,
+                        operator,
+                        queries,
+                        exact,
+                        options["k"],
+                    )
+
+    @staticmethod
+    def to_vector(values: List[float]) -> str:
+        return "[" + ",".join(f"{value:.6f}" for value in values) + "]"
+
+    def create_corpus(self, cursor, rows: int, dim: int, seed: int) -> None:
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {TABLE} "
+            f"(id serial PRIMARY KEY, embedding vector({dim})) ON COMMIT DROP"
+        )
+        cursor.execute("SELECT setseed(%s)", [((seed % 1000) / 1000)])
+        # correlate with `g` so a new vector is generated for every row
+        cursor.execute(
+            f"""
+            INSERT INTO {TABLE} (embedding)
+            SELECT (
+                SELECT array_agg(random() + g * 0)
+                FROM generate_series(1, %s)
+            )::vector
+            FROM generate_series(1, %s) AS g
+            """,
+            [dim, rows],
+        )
+        cursor.execute(f"ANALYZE {TABLE}")
+
+    def create_index(self, cursor, definition: str) -> float:
+        start = time.perf_counter()
+        cursor.execute(f"CREATE INDEX {TABLE}_idx ON {TABLE} {definition}")
+        cursor.execute(f"ANALYZE {TABLE}")
+        return time.perf_counter() - start
+
+    def search(self, cursor, operator: str, query: str, k: int) -> List[int]:
+        cursor.execute(
+            f"SELECT id FROM {TABLE} "
+            f"ORDER BY embedding {operator} %s::vector LIMIT %s",
+            [query, k],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+    def run(
+        self,
+        cursor,
+        index: str,
+        params: Dict[str, int],
+        build: float,
+        operator: str,
+        queries: List[str],
+        exact: List[List[int]],
+        k: int,
+    ) -> None:
+        for name, value in params.items():
+            cursor.execute("SELECT set_config(%s, %s, true)", [name, str(value)])
+
+        latencies = []
+        hits = 0
+        for query, expected in zip(queries, exact):
+            start = time.perf_counter()
+            found = self.search(cursor, operator, query, k)
+            latencies.append(time.perf_counter() - start)
+            hits += len(set(found) & set(expected))
+
+        recall = hits / (len(queries) * k)
+        latencies.sort()
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        param = ",".join(
+            f"{name.split('.')[-1]}={value}" for name, value in params.items()
+        )
+        self.stdout.write(
+            f"{index:<10}{param:<18}{build:>9.2f}s{recall:>10.3f}"
+            f"{statistics.median(latencies) * 1000:>8.2f}ms{p95 * 1000:>8.2f}ms"
+        )
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from ix.chains.registry import MANIFEST_PATH, write_manifest
+
+
+class Command(BaseCommand):
+    """
+    Builds the component manifest from python fixtures. The manifest must be
+    rebuilt whenever a component definition in `fixture_src` changes.
+    """
+
+    help = "Builds the component manifest from python fixtures."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default=str(MANIFEST_PATH))
+
+    def handle(self, *args, **options):
+        manifest = write_manifest(options["path"])
+        self.stdout.write(
+            f"Wrote {len(manifest['components'])} components to {options['path']}"
+        )
@@ -46,6 +46,7 @@ class Command(BaseCommand):
 
         # Create root node
         ChainNode.objects.create(chain=chain, root=True, **DAD_JOKESTER)
+        Chain.bump_revision(chain.id)
 
         Agent.objects.get_or_create(
             id=DAD_JOKES_AGENT_V1,
@@ -47,6 +47,7 @@ class Command(BaseCommand):
 
         # Create root node
         ChainNode.objects.create(chain=chain, root=True, **FAKE_WEATHERMAN)
+        Chain.bump_revision(chain.id)
 
         Agent.objects.get_or_create(
             name="Weatherman",
@@ -2,32 +2,36 @@ from django.core.management.base import BaseCommand
 
 from ix.agents.models import Agent
 from ix.chains.models import ChainNode, Chain
-from ix.chains.moderator import LLM_CHOOSE_AGENT_CONFIG
 
 
-CHAT_MODERATOR = {
-    "class_path": "ix.chains.moderator.ChatModerator",
-    "config": {
-        "selection_chain": LLM_CHOOSE_AGENT_CONFIG,
-        "memory": [
-            {
-                "class_path": "langchain.memory.ConversationBufferMemory",
-                "config": {
-                    "memory_key": "chat_history",
-                    "input_key": "user_input",
-                    "output_key": "text",
-                    "chat_memory": {
-                        "class_path": "langchain.memory.RedisChatMessageHistory",
-                        "config": {
-                            "url": "redis://redis:6379/0",
-                            "session_scope": "chat",
+def get_chat_moderator_config() -> dict:
+    # imported here so importing IX_AGENT_V2 doesn't import the moderator chain
+    from ix.chains.moderator import LLM_CHOOSE_AGENT_CONFIG
+
+    return {
+        "class_path": "ix.chains.moderator.ChatModerator",
+        "config": {
+            "selection_chain": LLM_CHOOSE_AGENT_CONFIG,
+            "memory": [
+                {
+                    "class_path": "langchain.memory.ConversationBufferMemory",
+                    "config": {
+                        "memory_key": "chat_history",
+                        "input_key": "user_input",
+                        "output_key": "text",
+                        "chat_memory": {
+                            "class_path": "langchain.memory.RedisChatMessageHistory",
+                            "config": {
+                                "url": "redis://redis:6379/0",
+                                "session_scope": "chat",
+                            },
                         },
                     },
                 },
-            },
-        ],
-    },
-}
+            ],
+        },
+    }
+
 
 IX_CHAIN_V2 = "b7d8f662-12f6-4525-b07b-c9ea7c10001c"
 IX_AGENT_V2 = "b7d8f662-12f6-4525-b07b-c9ea7c10001a"
@@ -49,7 +53,7 @@ class Command(BaseCommand):
         # create chain nodes
         chain.clear_chain()
         ChainNode.objects.create_from_config(
-            chain=chain, root=True, config=CHAT_MODERATOR
+            chain=chain, root=True, config=get_chat_moderator_config()
         )
 
         Agent.objects.get_or_create(
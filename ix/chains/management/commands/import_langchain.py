@@ -1,91 +1,16 @@
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
-from ix.api.components.types import NodeType as NodeTypePydantic
-from ix.chains.fixture_src.agent_interaction import AGENT_INTERACTION_CHAINS
-
-from ix.chains.fixture_src.agents import AGENTS
-from ix.chains.fixture_src.artifacts import ARTIFACTS
-from ix.chains.fixture_src.chains import CHAINS
-from ix.chains.fixture_src.dalle import DALLE
-from ix.chains.fixture_src.chat_memory_backend import MEMORY_BACKEND
-from ix.chains.fixture_src.document_loaders import DOCUMENT_LOADERS
-from ix.chains.fixture_src.embeddings import EMBEDDINGS
-from ix.chains.fixture_src.flow import FLOW
-from ix.chains.fixture_src.ix import CHAT_MODERATOR_TYPE
-from ix.chains.fixture_src.json import JSON
-from ix.chains.fixture_src.lcel import LANGCHAIN_RUNNABLES
-from ix.chains.fixture_src.llm import LLMS
-from ix.chains.fixture_src.memory import MEMORY
-from ix.chains.fixture_src.openai_functions import OPENAI_FUNCTIONS
-from ix.chains.fixture_src.parsers import PARSERS
-from ix.chains.fixture_src.prompts import PROMPTS
-from ix.chains.fixture_src.retriever import RETRIEVERS
-from ix.chains.fixture_src.routing import ROUTING_CHAINS
-from ix.chains.fixture_src.testing import MOCK_MEMORY, MOCK_CHAIN
-from ix.chains.fixture_src.text_splitter import TEXT_SPLITTERS
-from ix.chains.fixture_src.toolkit import TOOLKITS
-from ix.chains.fixture_src.tools import TOOLS
-from ix.chains.fixture_src.vectorstores import VECTORSTORES
 from ix.chains.models import NodeType
-from ix.chains.tests.mock_runnable import MOCK_RUNNABLE_CONFIG
+from ix.chains.registry import (
+    COMPONENT_SOURCES,
+    TESTING_COMPONENT_SOURCES,
+    build_entry,
+    iter_component_sources,
+    registry,
+)
 from ix.secrets.models import SecretType
 
-COMPONENTS = []
-
-# Embeddings
-COMPONENTS.extend(EMBEDDINGS)
-
-# Agents
-COMPONENTS.extend(AGENTS)
-COMPONENTS.extend(TOOLS)
-COMPONENTS.extend(TOOLKITS)
-
-# LLMS
-COMPONENTS.extend(LLMS)
-COMPONENTS.extend(DALLE)
-COMPONENTS.extend(PROMPTS)
-
-# Chains
-COMPONENTS.extend(CHAINS)
-COMPONENTS.extend(ROUTING_CHAINS)
-
-# OpenAI Functions
-COMPONENTS.extend(OPENAI_FUNCTIONS)
-
-# Memory
-COMPONENTS.extend(MEMORY)
-COMPONENTS.extend(MEMORY_BACKEND)
-
-# Document retrieval
-COMPONENTS.extend(PARSERS)
-COMPONENTS.extend(TEXT_SPLITTERS)
-COMPONENTS.extend(DOCUMENT_LOADERS)
-COMPONENTS.extend(VECTORSTORES)
-COMPONENTS.extend(RETRIEVERS)
-
-# IX integrations & flow
-COMPONENTS.extend(LANGCHAIN_RUNNABLES)
-COMPONENTS.extend(JSON)
-COMPONENTS.extend(FLOW)
-
-# IX Misc
-COMPONENTS.extend([CHAT_MODERATOR_TYPE])
-COMPONENTS.extend(AGENT_INTERACTION_CHAINS)
-
-# IX Artifacts
-COMPONENTS.extend(ARTIFACTS)
-
-# Testing
-if settings.TESTING:
-    COMPONENTS.extend(
-        [
-            MOCK_MEMORY,
-            MOCK_CHAIN,
-            MOCK_RUNNABLE_CONFIG,
-        ]
-    )
-
 
 class Command(BaseCommand):
     """
@@ -98,38 +23,57 @@ class Command(BaseCommand):
 
     This data this command loads is used to generate the json fixtures
     required for tests.
+
+    Components are read from the component manifest so that langchain doesn't
+    need to be imported. Use --from-source to build them from the fixtures.
     """
 
     help = "Imports LangChain components from python fixtures."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--from-source",
+            action="store_true",
+            help="Build components from fixture_src instead of the manifest.",
+        )
+        parser.add_argument(
+            "--embed",
+            action="store_true",
+            help="Embed node types without an embedding. Requires an OpenAI key.",
+        )
+
     def to_stdout(self, msg):
         if not settings.TESTING:
             self.stdout.write(msg)
 
+    def get_entries(self, from_source: bool = False):
+        if not from_source:
+            return registry.entries()
+
+        sources = list(COMPONENT_SOURCES)
+        if settings.TESTING:
+            sources.extend(TESTING_COMPONENT_SOURCES)
+        return [build_entry(component) for component in iter_component_sources(sources)]
+
     def handle(self, *args, **options):
-        for component in COMPONENTS:
-            # validate by converting to pydantic model instance
-            # TODO: COMPONENTS should be converted to pydantic models but for now
-            #       expect that they are dicts and validated here.
-            if isinstance(component, dict):
-                node_type_pydantic = NodeTypePydantic(**component)
-            else:
-                node_type_pydantic = component
-            config_schema = node_type_pydantic.get_config_schema()
-            validated_options = node_type_pydantic.model_dump(
-                exclude={"id", "display_groups", "config_schema"}
-            )
+        for entry in self.get_entries(options.get("from_source", False)):
+            validated_options = entry["node_type"]
+            config_schema = entry["config_schema"]
 
-            class_path = node_type_pydantic.class_path
+            class_path = validated_options["class_path"]
             if NodeType.objects.filter(class_path=class_path).exists():
                 # updating existing node type
                 self.to_stdout(f"Updating component: {class_path}")
                 node_type = NodeType.objects.get(class_path=class_path)
+                embedding_text = node_type.embedding_text
                 for key, value in validated_options.items():
                     if key == "class_path":
                         continue
                     setattr(node_type, key, value)
                 node_type.config_schema = config_schema
+                if node_type.embedding_text != embedding_text:
+                    # embedding is stale, it will be recreated by --embed
+                    node_type.embedding = None
                 node_type.save()
             else:
                 # creating new node type
@@ -138,10 +82,16 @@ class Command(BaseCommand):
                 )
 
             # Secrets - generate SecretTypes from secret fields
-            for secret_group in node_type_pydantic.secret_groups:
+            for secret_type_options in entry["secret_types"]:
                 try:
-                    secret_type = SecretType.objects.get(name=secret_group.key)
+                    secret_type = SecretType.objects.get(
+                        name=secret_type_options["name"]
+                    )
                 except SecretType.DoesNotExist:
-                    secret_type = SecretType(name=secret_group.key)
-                secret_type.fields_schema = secret_group.fields_schema
+                    secret_type = SecretType(name=secret_type_options["name"])
+                secret_type.fields_schema = secret_type_options["fields_schema"]
                 secret_type.save()
+
+        if options.get("embed", False):
+            count = NodeType.objects.update_embeddings()
+            self.to_stdout(f"Embedded {count} components")
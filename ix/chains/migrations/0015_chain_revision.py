@@ -0,0 +1,17 @@
+# Generated by Django 4.2.6 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("chains", "0014_nodetype_context"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chain",
+            name="revision",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.6 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+import ix.pg_vector.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("chains", "0015_chain_revision"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE EXTENSION IF NOT EXISTS vector;", reverse_sql=migrations.RunSQL.noop
+        ),
+        migrations.AddField(
+            model_name="nodetype",
+            name="embedding",
+            field=ix.pg_vector.fields.VectorField(
+                base_field=models.FloatField(), null=True, size=1536
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.6 on 2026-10-18 12:00
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+from ix.pg_vector.index import AddCosineDistanceHNSWIndex
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("chains", "0016_nodetype_embedding"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="nodetype",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.SearchVector(
+                    "name", "description", "class_path", config="english"
+                ),
+                name="chains_nodetype_search_idx",
+            ),
+        ),
+        AddCosineDistanceHNSWIndex("chains_nodetype", "embedding"),
+    ]
@@ -1,24 +1,121 @@
 import logging
+import re
+import threading
+import time
 import uuid
-from asgiref.sync import sync_to_async
 from functools import cached_property
-from typing import Any, Dict, Type
+from typing import Any, Dict, List, Optional, Type
 
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
 from django.db import models
 from langchain.schema.runnable import Runnable
 
 from ix.ix_users.models import OwnedModel
+from ix.pg_vector.fields import CosineSimilarity, VectorField
 from ix.pg_vector.tests.models import PGVectorMixin
-from ix.pg_vector.utils import get_embedding
+from ix.pg_vector.utils import (
+    get_embedding,
+    get_embeddings,
+    reciprocal_rank_fusion,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+# full text search over node types. Must match the expression indexed by
+# NodeType.Meta.indexes for the index to be used.
+NODE_TYPE_SEARCH_VECTOR = SearchVector(
+    "name", "description", "class_path", config="english"
+)
+
+
+def get_prefix_search_query(text: str) -> Optional[SearchQuery]:
+    """
+    Build a query matching all words in text as prefixes, so partially typed
+    words match, e.g. "chat open" matches "ChatOpenAI".
+    """
+    words = re.findall(r"\w+", text.lower())
+    if not words:
+        return None
+    raw = " & ".join(f"{word}:*" for word in words)
+    return SearchQuery(raw, config="english", search_type="raw")
+
+
+# hybrid search falls back to text search on every query while embeddings are
+# unavailable, e.g. without an OpenAI key. Warn about it at most this often.
+VECTOR_SEARCH_WARNING_INTERVAL = 300
+
+_vector_search_warned_at: Optional[float] = None
+_vector_search_warning_lock = threading.Lock()
+
+
+def warn_vector_search_unavailable(error: Exception) -> None:
+    """Log that vector search failed, at most once per warning interval."""
+    global _vector_search_warned_at
+    with _vector_search_warning_lock:
+        now = time.monotonic()
+        if (
+            _vector_search_warned_at is not None
+            and now - _vector_search_warned_at < VECTOR_SEARCH_WARNING_INTERVAL
+        ):
+            logger.debug(f"Vector search unavailable, using text search: {error}")
+            return
+        _vector_search_warned_at = now
+    logger.warning(f"Vector search unavailable, using text search: {error}")
+
+
 class NodeTypeQuery(PGVectorMixin, models.QuerySet):
     """Mixing PGVectorMixin into the default QuerySet."""
 
-    pass
+    def text_search(self, text: str) -> "NodeTypeQuery":
+        """Full text search ranked by relevance"""
+        query = get_prefix_search_query(text)
+        if query is None:
+            return self.none()
+        return (
+            self.annotate(
+                search=NODE_TYPE_SEARCH_VECTOR,
+                rank=SearchRank(NODE_TYPE_SEARCH_VECTOR, query),
+            )
+            .filter(search=query)
+            .order_by("-rank")
+        )
+
+    def vector_search(self, text: str, timeout: float = None) -> "NodeTypeQuery":
+        """Node types with embeddings ranked by cosine distance to text"""
+        embedding = get_embedding(text, timeout=timeout)
+        return (
+            self.filter(embedding__isnull=False)
+            .annotate(distance=CosineSimilarity("embedding", embedding))
+            .order_by("distance")
+        )
+
+    def hybrid_search(self, text: str, candidates: int = None) -> List["NodeType"]:
+        """
+        Combine full text and vector search with reciprocal rank fusion. The top
+        `candidates` of each search are fused. Falls back to full text search
+        when the text can't be embedded within NODE_TYPE_SEARCH_EMBEDDING_TIMEOUT.
+        """
+        candidates = candidates or settings.NODE_TYPE_SEARCH_CANDIDATES
+        rankings = [
+            list(self.text_search(text).values_list("id", flat=True)[:candidates])
+        ]
+        try:
+            vector_search = self.vector_search(
+                text, timeout=settings.NODE_TYPE_SEARCH_EMBEDDING_TIMEOUT
+            )
+            rankings.append(
+                list(vector_search.values_list("id", flat=True)[:candidates])
+            )
+        except Exception as e:
+            warn_vector_search_unavailable(e)
+
+        ids = reciprocal_rank_fusion(rankings)
+        node_types = self.in_bulk(ids)
+        return [node_types[id] for id in ids if id in node_types]
 
 
 class NodeTypeManager(models.Manager.from_queryset(NodeTypeQuery)):
@@ -30,7 +127,7 @@ class NodeTypeManager(models.Manager.from_queryset(NodeTypeQuery)):
         Creates a new NodeType object with a vector embedding generated
         from the given text using OpenAI's API.
         """
-        text = f"{name} {description} {class_path}"
+        text = NodeType.get_embedding_text(name, description, class_path)
         embedding = get_embedding(text)
         return self.create(
             name=name,
@@ -39,6 +136,23 @@ class NodeTypeManager(models.Manager.from_queryset(NodeTypeQuery)):
             embedding=embedding,
         )
 
+    def update_embeddings(self, only_missing: bool = True) -> int:
+        """
+        Embed node types in batches. Returns the number of node types updated.
+        """
+        queryset = self.get_queryset()
+        if only_missing:
+            queryset = queryset.filter(embedding__isnull=True)
+        node_types = list(queryset.only("id", "name", "description", "class_path"))
+        if not node_types:
+            return 0
+
+        texts = [node_type.embedding_text for node_type in node_types]
+        for node_type, embedding in zip(node_types, get_embeddings(texts)):
+            node_type.embedding = embedding
+        self.bulk_update(node_types, ["embedding"], batch_size=100)
+        return len(node_types)
+
 
 class NodeType(OwnedModel):
     TYPES = [
@@ -88,12 +202,54 @@ class NodeType(OwnedModel):
     # JSONSchema for the config object
     config_schema = models.JSONField(default=dict)
 
+    # embedding of name, description and class_path used to search components
+    embedding = VectorField(null=True)
+
     objects = NodeTypeManager()
 
+    class Meta:
+        indexes = [
+            GinIndex(NODE_TYPE_SEARCH_VECTOR, name="chains_nodetype_search_idx"),
+        ]
+
+    @staticmethod
+    def get_embedding_text(name: str, description: str, class_path: str) -> str:
+        return f"{name} {description} {class_path}"
+
+    @property
+    def embedding_text(self) -> str:
+        return self.get_embedding_text(self.name, self.description, self.class_path)
+
     @cached_property
     def connectors_as_dict(self):
         return {c["key"]: c for c in self.connectors or []}
 
+    @cached_property
+    def as_pydantic(self):
+        """Validated pydantic representation used by the flow loader."""
+        from ix.api.components.types import NodeType as NodeTypePydantic
+
+        return NodeTypePydantic.model_validate(self)
+
+    @cached_property
+    def config_model(self):
+        """Pydantic model generated from config_schema."""
+        from jsonschema_pydantic import jsonschema_to_pydantic
+
+        return jsonschema_to_pydantic(self.config_schema)
+
+    def save(self, *args, **kwargs):
+        """
+        Saving a node type bumps the revision of chains that use it. Compiled flows
+        hold NodeType instances and their memoized models, so they're recompiled.
+        """
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if not adding:
+            Chain.objects.filter(nodes__node_type_id=self.id).update(
+                revision=models.F("revision") + 1
+            )
+
     def __str__(self):
         return f"{self.class_path}"
 
@@ -114,8 +270,16 @@ class ChainNodeManager(models.Manager):
 
         This method will identify the NodeType from the class_path. The NodeType
         definition is used to recursively identify and parse nested property nodes
-        and child nodes.
+        and child nodes. The chain's revision is bumped once the nodes are created.
         """
+        node = self._create_from_config(chain, config, root=root, parent=parent)
+        Chain.bump_revision(chain.id)
+        chain.refresh_from_db(fields=["revision"])
+        return node
+
+    def _create_from_config(
+        self, chain, config: Dict[str, Any], root=False, parent=None
+    ) -> "ChainNode":
         # create copy of config since it will be mutated
         config = config.copy()
 
@@ -160,7 +324,7 @@ class ChainNodeManager(models.Manager):
                     property_config_group = [property_config_group]
 
                 for property_config in property_config_group:
-                    nested_node = self.create_from_config(
+                    nested_node = self._create_from_config(
                         chain=chain, config=property_config
                     )
                     ChainEdge.objects.create(
@@ -195,7 +359,7 @@ class ChainNodeManager(models.Manager):
 
                 # create child
                 source_node = latest_child
-                latest_child = self.create_from_config(
+                latest_child = self._create_from_config(
                     chain=chain, config=child, root=root and i == 0 and is_hidden
                 )
 
@@ -299,6 +463,10 @@ class Chain(OwnedModel):
     # The endpoints are responsible for ensuring that the agent does or does not exist.
     is_agent = models.BooleanField(default=True)
 
+    # Incremented whenever the graph (nodes, edges, roots) changes. Compiled flows
+    # are cached per process and keyed by this revision.
+    revision = models.PositiveIntegerField(default=0)
+
     nodes: models.QuerySet[ChainNode]
 
     @property
@@ -317,11 +485,24 @@ class Chain(OwnedModel):
         return init_chain_flow(self, context=context)
 
     async def aload_chain(self, context) -> Runnable:
-        from ix.chains.loaders.core import init_chain_flow
+        from ix.chains.loaders.core import ainit_chain_flow
+
+        return await ainit_chain_flow(self, context=context)
 
-        return await sync_to_async(init_chain_flow)(self, context=context)
+    @classmethod
+    def bump_revision(cls, chain_id) -> None:
+        """Mark the chain's graph as changed, invalidating compiled flows."""
+        cls.objects.filter(id=chain_id).update(revision=models.F("revision") + 1)
+
+    @classmethod
+    async def abump_revision(cls, chain_id) -> None:
+        await cls.objects.filter(id=chain_id).aupdate(revision=models.F("revision") + 1)
 
     def clear_chain(self):
-        """removes the chain nodes associated with this chain"""
+        """
+        removes the chain nodes associated with this chain. The revision is bumped
+        when the new nodes are created, so a load in between can't cache a partial
+        graph under the new revision.
+        """
         # clear old chain
         ChainNode.objects.filter(chain_id=self.id).delete()
@@ -0,0 +1,210 @@
+import importlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PATH = Path(__file__).parent / "fixture_src" / "manifest.json"
+MANIFEST_VERSION = 1
+
+# Component definitions in `fixture_src`, as (module, attribute) pairs in the order
+# they are imported. Attributes are either a list of components or one component.
+COMPONENT_SOURCES = [
+    # Embeddings
+    ("ix.chains.fixture_src.embeddings", "EMBEDDINGS"),
+    # Agents
+    ("ix.chains.fixture_src.agents", "AGENTS"),
+    ("ix.chains.fixture_src.tools", "TOOLS"),
+    ("ix.chains.fixture_src.toolkit", "TOOLKITS"),
+    # LLMS
+    ("ix.chains.fixture_src.llm", "LLMS"),
+    ("ix.chains.fixture_src.dalle", "DALLE"),
+    ("ix.chains.fixture_src.prompts", "PROMPTS"),
+    # Chains
+    ("ix.chains.fixture_src.chains", "CHAINS"),
+    ("ix.chains.fixture_src.routing", "ROUTING_CHAINS"),
+    # OpenAI Functions
+    ("ix.chains.fixture_src.openai_functions", "OPENAI_FUNCTIONS"),
+    # Memory
+    ("ix.chains.fixture_src.memory", "MEMORY"),
+    ("ix.chains.fixture_src.chat_memory_backend", "MEMORY_BACKEND"),
+    # Document retrieval
+    ("ix.chains.fixture_src.parsers", "PARSERS"),
+    ("ix.chains.fixture_src.text_splitter", "TEXT_SPLITTERS"),
+    ("ix.chains.fixture_src.document_loaders", "DOCUMENT_LOADERS"),
+    ("ix.chains.fixture_src.vectorstores", "VECTORSTORES"),
+    ("ix.chains.fixture_src.retriever", "RETRIEVERS"),
+    # IX integrations & flow
+    ("ix.chains.fixture_src.lcel", "LANGCHAIN_RUNNABLES"),
+    ("ix.chains.fixture_src.json", "JSON"),
+    ("ix.chains.fixture_src.flow", "FLOW"),
+    # IX Misc
+    ("ix.chains.fixture_src.ix", "CHAT_MODERATOR_TYPE"),
+    ("ix.chains.fixture_src.agent_interaction", "AGENT_INTERACTION_CHAINS"),
+    # IX Artifacts
+    ("ix.chains.fixture_src.artifacts", "ARTIFACTS"),
+]
+
+# Components only available when testing. These are never written to the manifest.
+TESTING_COMPONENT_SOURCES = [
+    ("ix.chains.fixture_src.testing", "MOCK_MEMORY"),
+    ("ix.chains.fixture_src.testing", "MOCK_CHAIN"),
+    ("ix.chains.tests.mock_runnable", "MOCK_RUNNABLE_CONFIG"),
+]
+
+
+def iter_component_sources(sources: List[tuple]) -> Iterator[Any]:
+    """Import component definitions. This imports the classes they describe."""
+    for module_path, attr in sources:
+        value = getattr(importlib.import_module(module_path), attr)
+        if isinstance(value, list):
+            yield from value
+        else:
+            yield value
+
+
+def build_entry(component: Any) -> Dict[str, Any]:
+    """
+    Validate a component definition and convert it to a manifest entry. Entries
+    contain everything needed to create the NodeType and its SecretTypes.
+    """
+    from ix.api.components.types import NodeType as NodeTypePydantic
+    from ix.chains.fixture_src.vectorstores import (
+        get_vectorstore_retriever_fieldnames,
+    )
+
+    # TODO: COMPONENTS should be converted to pydantic models but for now
+    #       expect that they are dicts and validated here.
+    if isinstance(component, dict):
+        node_type = NodeTypePydantic(**component)
+    else:
+        node_type = component
+
+    entry = {
+        "node_type": node_type.model_dump(
+            exclude={"id", "display_groups", "config_schema"}
+        ),
+        "config_schema": node_type.get_config_schema(),
+        "secret_types": [
+            {"name": group.key, "fields_schema": group.fields_schema}
+            for group in node_type.secret_groups
+        ],
+    }
+    if node_type.type == "vectorstore":
+        entry["retriever_fields"] = get_vectorstore_retriever_fieldnames(
+            node_type.class_path
+        )
+    return entry
+
+
+def build_manifest() -> Dict[str, Any]:
+    """Build the manifest from the component definitions in `fixture_src`"""
+    from ix.chains.fixture_src.vectorstores import (
+        get_vectorstore_retriever_fieldnames,
+    )
+
+    return {
+        "version": MANIFEST_VERSION,
+        "default_retriever_fields": get_vectorstore_retriever_fieldnames(None),
+        "components": [
+            build_entry(component)
+            for component in iter_component_sources(COMPONENT_SOURCES)
+        ],
+    }
+
+
+def write_manifest(path: Path = MANIFEST_PATH) -> Dict[str, Any]:
+    manifest = build_manifest()
+    with open(path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return manifest
+
+
+class ComponentRegistry:
+    """
+    Component definitions read from a precomputed manifest.
+
+    `fixture_src` builds definitions by inspecting langchain classes, which means
+    importing most of langchain. The manifest is a JSON snapshot of those
+    definitions so that components can be listed and imported into the database
+    without importing the classes until a component is initialized.
+
+    The manifest is read on first use. If it doesn't exist, definitions are built
+    from `fixture_src` instead.
+    """
+
+    def __init__(self, path: Path = MANIFEST_PATH):
+        self.path = path
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._by_class_path: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        if self._manifest is None:
+            with self._lock:
+                if self._manifest is None:
+                    self._manifest = self._load()
+        return self._manifest
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path) as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            logger.warning(
+                f"Component manifest not found at {self.path}, building it from "
+                f"fixture_src. Run `manage.py build_component_manifest` to create it."
+            )
+            return build_manifest()
+
+        if manifest.get("version") != MANIFEST_VERSION:
+            logger.warning(
+                f"Component manifest version={manifest.get('version')} is out of "
+                f"date, building it from fixture_src."
+            )
+            return build_manifest()
+        return manifest
+
+    def clear(self) -> None:
+        with self._lock:
+            self._manifest = None
+            self._by_class_path = None
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Manifest entries. Includes testing components when TESTING is set"""
+        entries = list(self.manifest["components"])
+        if settings.TESTING:
+            entries.extend(
+                build_entry(component)
+                for component in iter_component_sources(TESTING_COMPONENT_SOURCES)
+            )
+        return entries
+
+    @property
+    def by_class_path(self) -> Dict[str, Dict[str, Any]]:
+        if self._by_class_path is None:
+            self._by_class_path = {
+                entry["node_type"]["class_path"]: entry
+                for entry in self.manifest["components"]
+            }
+        return self._by_class_path
+
+    def get(self, class_path: str) -> Optional[Dict[str, Any]]:
+        return self.by_class_path.get(class_path)
+
+    def get_retriever_fieldnames(self, class_path: str) -> List[str]:
+        """Fields of a vectorstore component that configure its retriever"""
+        entry = self.get(class_path) or {}
+        if "retriever_fields" in entry:
+            return entry["retriever_fields"]
+        return self.manifest["default_retriever_fields"]
+
+
+registry = ComponentRegistry()
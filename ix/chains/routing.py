@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from uuid import UUID
 
@@ -29,6 +31,10 @@ class MapSubchain(Chain):
     Each iteration will receive the outputs of the previous iteration under the key `outputs`
 
     Results are output as a list under `output_key`
+
+    When `max_concurrency` is greater than 1, up to that many iterations run at
+    once. Iterations are independent in this mode and receive an empty `outputs`
+    list. Results are still returned in input order.
     """
 
     chain: Runnable  #: :meta private:
@@ -37,6 +43,7 @@ class MapSubchain(Chain):
     map_input: str
     map_input_to: str
     output_key: str
+    max_concurrency: Optional[int] = None
 
     def __init__(self, *args, **kwargs):
         input_variables = list(kwargs.get("input_variables", []))
@@ -73,7 +80,11 @@ class MapSubchain(Chain):
     def output_keys(self) -> List[str]:
         return [self.output_key]
 
-    def _call(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    @property
+    def is_concurrent(self) -> bool:
+        return bool(self.max_concurrency and self.max_concurrency > 1)
+
+    def _get_values(self, inputs: Dict[str, Any]) -> List[Any]:
         map_input = self.map_input
         map_input_to = self.map_input_to
 
@@ -94,21 +105,42 @@ class MapSubchain(Chain):
             raise ValueError(
                 f"MapSubchain input at {map_input} is not a list: {values}"
             )
+        return values
 
-        chain_inputs = inputs.copy()
-
-        # run chain for each value
-        outputs = []
-        for value in values:
-            logger.debug(f"MapSubchain processing value={value}")
-            iteration_inputs = chain_inputs.copy()
-            iteration_inputs[map_input_to] = value
-            iteration_inputs[self.output_key] = outputs
-            logger.debug(f"MapSubchain iteration_inputs={iteration_inputs}")
-            iteration_outputs = self.chain.run(**iteration_inputs)
-            iteration_mapped_output = iteration_outputs
-            logger.debug(f"MapSubchain response outputs={iteration_mapped_output}")
-            outputs.append(iteration_mapped_output)
+    def _iteration_inputs(
+        self, inputs: Dict[str, Any], value: Any, outputs: List[Any]
+    ) -> Dict[str, Any]:
+        logger.debug(f"MapSubchain processing value={value}")
+        iteration_inputs = inputs.copy()
+        iteration_inputs[self.map_input_to] = value
+        iteration_inputs[self.output_key] = outputs
+        logger.debug(f"MapSubchain iteration_inputs={iteration_inputs}")
+        return iteration_inputs
+
+    def _call(
+        self,
+        inputs: Dict[str, Any],
+        run_manager: Optional[CallbackManagerForChainRun] = None,
+    ) -> Dict[str, Any]:
+        values = self._get_values(inputs)
+        _run_manager = run_manager or CallbackManagerForChainRun.get_noop_manager()
+
+        def run(value: Any, outputs: List[Any]) -> Any:
+            iteration_inputs = self._iteration_inputs(inputs, value, outputs)
+            iteration_outputs = self.chain.run(
+                callbacks=_run_manager.get_child(), **iteration_inputs
+            )
+            logger.debug(f"MapSubchain response outputs={iteration_outputs}")
+            return iteration_outputs
+
+        if self.is_concurrent:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                outputs = list(executor.map(lambda value: run(value, []), values))
+        else:
+            # run chain for each value
+            outputs = []
+            for value in values:
+                outputs.append(run(value, outputs))
 
         # return as output_key
         return {self.output_key: outputs}
@@ -118,44 +150,31 @@ class MapSubchain(Chain):
         inputs: Dict[str, Any],
         run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
     ) -> Dict[str, Any]:
-        map_input = self.map_input
-        map_input_to = self.map_input_to
-
-        # map input to values list
-        logger.debug(
-            f"MapSubchain mapping values from map_input={map_input} to map_input_to={map_input_to}"
-        )
-        jsonpath_expr = jsonpath_parse(map_input)
-        json_matches = jsonpath_expr.find(inputs)
-
-        if len(json_matches) == 0:
-            raise ValueError(
-                f"MapSubchain could not find input at {map_input} for {map_input_to} searched: {inputs}"
-            )
-
-        values = json_matches[0].value
-        if not isinstance(values, list):
-            raise ValueError(
-                f"MapSubchain input at {map_input} is not a list: {values}"
-            )
-
-        chain_inputs = inputs.copy()
+        values = self._get_values(inputs)
         _run_manager = run_manager or AsyncCallbackManagerForChainRun.get_noop_manager()
 
-        # run chain for each value
-        outputs = []
-        for value in values:
-            logger.debug(f"MapSubchain processing value={value}")
-            iteration_inputs = chain_inputs.copy()
-            iteration_inputs[map_input_to] = value
-            iteration_inputs[self.output_key] = outputs
-            logger.debug(f"MapSubchain iteration_inputs={iteration_inputs}")
+        async def run(value: Any, outputs: List[Any]) -> Any:
+            iteration_inputs = self._iteration_inputs(inputs, value, outputs)
             iteration_outputs = await self.chain.arun(
                 callbacks=_run_manager.get_child(), **iteration_inputs
             )
-            iteration_mapped_output = iteration_outputs
-            logger.debug(f"MapSubchain response outputs={iteration_mapped_output}")
-            outputs.append(iteration_mapped_output)
+            logger.debug(f"MapSubchain response outputs={iteration_outputs}")
+            return iteration_outputs
+
+        if self.is_concurrent:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def run_bounded(value: Any) -> Any:
+                async with semaphore:
+                    return await run(value, [])
+
+            outputs = await asyncio.gather(*(run_bounded(value) for value in values))
+            outputs = list(outputs)
+        else:
+            # run chain for each value
+            outputs = []
+            for value in values:
+                outputs.append(await run(value, outputs))
 
         # return as output_key
         return {self.output_key: outputs}
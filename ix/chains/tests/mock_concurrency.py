@@ -0,0 +1,30 @@
+import asyncio
+import time
+
+from pydantic.v1 import BaseModel as BaseModelV1
+
+
+class MockDelay(BaseModelV1):
+    """
+    Mixin for mock chains and runnables that wait `delay` seconds and track how
+    many calls run at once. Used for testing only.
+    """
+
+    delay: float = 0.02
+    running: int = 0
+    max_running: int = 0
+
+    def _start(self) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+
+    def _wait(self) -> None:
+        self._start()
+        time.sleep(self.delay)
+        self.running -= 1
+
+    async def _await(self, index: int) -> None:
+        self._start()
+        # finish in reverse order to check that output order is preserved
+        await asyncio.sleep(self.delay / (index + 1))
+        self.running -= 1
@@ -0,0 +1,48 @@
+from typing import Dict, Iterable, List, Optional
+
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
+
+
+class MockVectorStore(VectorStore):
+    """
+    Mock vectorstore that stores texts by id. `fail_on` raises when that text is
+    added. Used for testing only.
+    """
+
+    def __init__(self, fail_on: Optional[str] = None, **kwargs):
+        self.fail_on = fail_on
+        self.records: Dict[str, str] = {}
+        self.next_id = 0
+        self.calls = 0
+
+    @property
+    def texts(self) -> List[str]:
+        """Stored texts in the order they were added"""
+        return list(self.records.values())
+
+    def add_texts(self, texts: Iterable[str], metadatas=None, **kwargs) -> List[str]:
+        texts = list(texts)
+        if self.fail_on in texts:
+            raise ValueError(f"failed to add {self.fail_on}")
+        self.calls += 1
+        ids = []
+        for text in texts:
+            self.next_id += 1
+            self.records[str(self.next_id)] = text
+            ids.append(str(self.next_id))
+        return ids
+
+    def delete(self, ids: Optional[List[str]] = None, **kwargs) -> Optional[bool]:
+        for id in ids or []:
+            del self.records[id]
+        return True
+
+    @classmethod
+    def from_texts(cls, texts, embedding=None, metadatas=None, **kwargs):
+        vectorstore = cls(**kwargs)
+        vectorstore.add_texts(texts, metadatas)
+        return vectorstore
+
+    def similarity_search(self, query: str, k: int = 4, **kwargs) -> List[Document]:
+        return []
@@ -2,7 +2,7 @@ import pytest
 from django.db.models.signals import post_save
 
 from ix.agents.models import Agent
-from ix.chains.callbacks import IxHandler
+from ix.chains.callbacks import IxHandler, RunContext
 from ix.chains.models import Chain
 from ix.chains.tests.test_config_loader import unpack_chain_flow
 from ix.schema.subscriptions import ChatMessageTokenSubscription
@@ -34,7 +34,12 @@ CHAIN_WITH_LLM = {
 
 @pytest.mark.django_db
 class TestIxHandler:
-    async def test_stream(self, achat, aload_chain, mock_openai_streaming, mocker):
+    async def test_stream(
+        self, achat, aload_chain, mock_openai_streaming, mocker, settings
+    ):
+        # coalesce tokens in pairs, the remainder is sent when the stream ends.
+        settings.CHAT_STREAM_COALESCE_TOKENS = 2
+        settings.CHAT_STREAM_COALESCE_INTERVAL = 60
         await TaskLogMessage.objects.all().adelete()
         spy_broadcast = mocker.spy(ChatMessageTokenSubscription, "broadcast")
         saves = []
@@ -80,29 +85,44 @@ class TestIxHandler:
         for call in spy_broadcast.call_args_list:
             assert call.kwargs["group"] == f"stream_task_id_{task.id}"
         calls = spy_broadcast.call_args_list
-        assert len(calls) == 5
+        assert len(calls) == 3
         assert calls[0].kwargs["payload"] == {
             "msg_id": str(msg.id),
             "index": 1,
-            "text": "mock",
+            "end_index": 2,
+            "text": "mock ",
         }
         assert calls[1].kwargs["payload"] == {
-            "msg_id": str(msg.id),
-            "index": 2,
-            "text": " ",
-        }
-        assert calls[2].kwargs["payload"] == {
             "msg_id": str(msg.id),
             "index": 3,
-            "text": "llm",
+            "end_index": 4,
+            "text": "llm ",
         }
-        assert calls[3].kwargs["payload"] == {
-            "msg_id": str(msg.id),
-            "index": 4,
-            "text": " ",
-        }
-        assert calls[4].kwargs["payload"] == {
+        assert calls[2].kwargs["payload"] == {
             "msg_id": str(msg.id),
             "index": 5,
+            "end_index": 5,
             "text": "response",
         }
+
+    async def test_finalize_stream_invalidates_root(self, achat, mocker):
+        # replies are written to a subtask, the chat reads the root task's window
+        invalidate = mocker.patch(
+            "ix.chains.callbacks.message_history_cache.ainvalidate"
+        )
+        chat = achat["chat"]
+        task = await Task.objects.aget(id=chat.task_id)
+        agent = await Agent.objects.aget(id=task.agent_id)
+        subtask = await task.adelegate_to_agent(agent)
+        message = await TaskLogMessage.objects.acreate(
+            task=subtask,
+            role="ASSISTANT",
+            content={"type": "ASSISTANT", "text": "", "stream": True},
+        )
+
+        context = RunContext(message=message, tokens=["hi"])
+        await context.finalize_stream()
+        assert {call.args[0] for call in invalidate.call_args_list} == {
+            subtask.id,
+            task.id,
+        }
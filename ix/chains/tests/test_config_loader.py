@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from copy import deepcopy
 from functools import reduce
@@ -44,6 +45,7 @@ from langchain.schema import (
 from langchain.tools import BaseTool
 
 from ix.chains.fixture_src.tools import GOOGLE_SEARCH
+from ix.chains.loaders.cache import flow_cache
 from ix.chains.loaders.core import (
     aload_chain_flow,
     BranchPlaceholder,
@@ -52,9 +54,10 @@ from ix.chains.loaders.core import (
     SequencePlaceholder,
     ImplicitJoin,
 )
+from ix.chains.loaders import core
 from ix.chains.loaders.memory import get_memory_session
 from ix.chains.loaders.tools import extract_tool_kwargs, get_runnable_tool
-from ix.chains.models import Chain
+from ix.chains.models import Chain, ChainNode, NodeType
 from ix.chains.tests.mock_configs import (
     CONVERSATIONAL_RETRIEVAL_CHAIN,
     EMBEDDINGS,
@@ -81,7 +84,13 @@ from ix.conftest import aload_fixture
 from ix.memory.artifacts import ArtifactMemory
 from ix.runnable.documents import RunLoader, RunTransformer
 from ix.runnable.ix import IxNode
-from ix.task_log.tests.fake import afake_chain_node, afake_chain, afake_chain_edge
+from ix.task_log.tests.fake import (
+    afake_chain_node,
+    afake_chain,
+    afake_chain_edge,
+    fake_chain,
+    fake_chain_node,
+)
 from ix.utils.importlib import import_class
 
 
@@ -1253,6 +1262,100 @@ class TestLoadFlow:
         assert flow == fixture["each"]
 
 
+@pytest.mark.django_db
+class TestFlowCache:
+    """Compiled flows are cached per process and keyed by the chain revision."""
+
+    async def test_cached_flow_reused(self, lcel_sequence, aix_context, mocker):
+        chain = lcel_sequence["chain"]
+        spy = mocker.spy(core, "load_chain_flow")
+
+        await ainit_chain_flow(chain, context=aix_context)
+        flow = await ainit_chain_flow(chain, context=aix_context)
+
+        assert spy.call_count == 1
+        assert flow_cache.get(chain.id, chain.revision) is not None
+        output = await flow.ainvoke(input={"input": "test"})
+        assert output == {"input": "test", "sequence_0": 0, "sequence_1": 1}
+
+    async def test_revision_invalidates_flow(self, lcel_sequence, aix_context, mocker):
+        chain = lcel_sequence["chain"]
+        spy = mocker.spy(core, "load_chain_flow")
+
+        await ainit_chain_flow(chain, context=aix_context)
+        await Chain.abump_revision(chain.id)
+        await chain.arefresh_from_db()
+        await ainit_chain_flow(chain, context=aix_context)
+
+        assert chain.revision == 1
+        assert spy.call_count == 2
+
+    async def test_node_type_update_invalidates_flow(
+        self, lcel_sequence, aix_context, mocker
+    ):
+        chain = lcel_sequence["chain"]
+        revision = chain.revision
+        spy = mocker.spy(core, "load_chain_flow")
+        await ainit_chain_flow(chain, context=aix_context)
+
+        # editing a node type recompiles the chains that use it
+        node = await ChainNode.objects.filter(chain=chain).afirst()
+        node_type = await NodeType.objects.aget(id=node.node_type_id)
+        node_type.description = "edited"
+        await node_type.asave()
+        await chain.arefresh_from_db()
+        await ainit_chain_flow(chain, context=aix_context)
+
+        assert chain.revision == revision + 1
+        assert spy.call_count == 2
+
+    def test_create_from_config_bumps_revision(self, node_types):
+        chain = fake_chain()
+        fake_chain_node(chain=chain)
+        revision = chain.revision
+
+        # clearing alone doesn't bump, so a partial graph is never cached
+        chain.clear_chain()
+        assert chain.revision == revision
+
+        ChainNode.objects.create_from_config(chain, OPENAI_LLM, root=True)
+        assert chain.revision == revision + 1
+        chain.refresh_from_db()
+        assert chain.revision == revision + 1
+
+
+@pytest.mark.django_db
+class TestAsyncLoader:
+    """Chains are loaded with the async ORM rather than in asgiref's thread."""
+
+    async def test_does_not_use_thread(self, lcel_map, aix_context, mocker):
+        chain = lcel_map["chain"]
+        spy = mocker.spy(core, "load_node")
+
+        flow = await ainit_chain_flow(chain, context=aix_context)
+
+        assert spy.call_count == 0
+        output = await flow.ainvoke(input={"input": "test"})
+        assert output == {
+            "a": {"input": "test", "node1": 0},
+            "b": {"input": "test", "node2": 0},
+        }
+
+    async def test_concurrent_loads(self, lcel_map, aix_context):
+        chain = lcel_map["chain"]
+
+        flows = await asyncio.gather(
+            *[ainit_chain_flow(chain, context=aix_context) for _ in range(3)]
+        )
+
+        for flow in flows:
+            output = await flow.ainvoke(input={"input": "test"})
+            assert output == {
+                "a": {"input": "test", "node1": 0},
+                "b": {"input": "test", "node2": 0},
+            }
+
+
 @pytest.mark.django_db
 class TestFlow:
     """Test loading, initializing, and invoking flows:
@@ -0,0 +1,45 @@
+import pytest
+
+from ix.chains.loaders.graph import ChainGraph
+from ix.chains.models import ChainEdge
+from ix.task_log.tests.fake import fake_chain_node, afake_chain_node
+
+
+@pytest.mark.django_db
+class TestChainGraph:
+    def test_load(self, node_types, django_assert_num_queries):
+        node = fake_chain_node()
+
+        with django_assert_num_queries(3):
+            graph = ChainGraph.load(node.chain_id)
+
+        expected = list(
+            ChainEdge.objects.filter(target=node, relation="PROP").order_by(
+                "target_key"
+            )
+        )
+        assert graph.incoming(node.id, "PROP") == expected
+        assert graph.incoming(node.id, "PROP", "llm") == [
+            edge for edge in expected if edge.target_key == "llm"
+        ]
+        assert graph.outgoing(node.id, "PROP") == []
+        assert graph.roots == [graph.get_node(node.id)]
+
+    def test_traversal_does_not_query(self, node_types, django_assert_num_queries):
+        node = fake_chain_node()
+        graph = ChainGraph.load(node.chain_id)
+
+        with django_assert_num_queries(0):
+            for edge in graph.incoming(node.id, "PROP"):
+                assert edge.target.id == node.id
+                assert edge.source.node_type.type in {"llm", "prompt"}
+                assert graph.outgoing(edge.source_id, "PROP") == [edge]
+
+    async def test_aload(self, anode_types):
+        node = await afake_chain_node()
+        graph = await ChainGraph.aload(node.chain_id)
+
+        assert set(graph.nodes) == {node.id} | {
+            edge.source_id for edge in graph.incoming(node.id, "PROP")
+        }
+        assert len(graph.edges) == 2
@@ -0,0 +1,279 @@
+from typing import Iterator, List
+from uuid import uuid4
+
+import pytest
+from chromadb.config import Settings
+from django.core.cache import caches
+from langchain.embeddings import FakeEmbeddings
+from langchain.document_loaders.base import BaseLoader
+from langchain.schema import Document
+from langchain.text_splitter import CharacterTextSplitter
+
+from ix.chains.components.vectorstores import (
+    AsyncChromaVectorstore,
+    AsyncRedisVectorstore,
+)
+from ix.chains.loaders.ingest import (
+    IngestProgress,
+    batched,
+    can_resume_ingest,
+    get_ingest_key,
+    ingest_documents,
+    iter_documents,
+)
+from ix.chains.loaders.text_splitter import TextSplitterShim
+from ix.chains.loaders.vectorstore import initialize_vectorstore
+from ix.chains.tests.mock_vectorstore import MockVectorStore
+
+FAKE_VECTORSTORE = "ix.chains.tests.mock_vectorstore.MockVectorStore"
+CONFIG = {"embedding": None}
+
+
+class FakeLoader(BaseLoader):
+    def __init__(self, texts: List[str], lazy: bool = True):
+        self.texts = texts
+        self.lazy = lazy
+        self.loaded = 0
+
+    def load(self) -> List[Document]:
+        return list(self._iter())
+
+    def lazy_load(self) -> Iterator[Document]:
+        if not self.lazy:
+            raise NotImplementedError()
+        return self._iter()
+
+    def _iter(self) -> Iterator[Document]:
+        for text in self.texts:
+            self.loaded += 1
+            yield Document(page_content=text)
+
+
+def texts(count: int) -> List[str]:
+    return [f"doc-{i}" for i in range(count)]
+
+
+@pytest.fixture
+def cache(settings):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    settings.EMBEDDING_CACHE_ALIAS = "default"
+    caches["default"].clear()
+    yield caches["default"]
+
+
+class TestIterDocuments:
+    def test_loader(self):
+        loader = FakeLoader(texts(3))
+        documents = iter_documents(loader)
+        assert next(documents).page_content == "doc-0"
+        # documents are loaded as they are consumed
+        assert loader.loaded == 1
+        assert [doc.page_content for doc in documents] == ["doc-1", "doc-2"]
+
+    def test_loader_without_lazy_load(self):
+        loader = FakeLoader(texts(3), lazy=False)
+        assert [doc.page_content for doc in iter_documents(loader)] == texts(3)
+
+    def test_text_splitter(self):
+        loader = FakeLoader(["a b", "c d"])
+        splitter = CharacterTextSplitter(separator=" ", chunk_size=1, chunk_overlap=0)
+        source = TextSplitterShim(document_loader=loader, text_splitter=splitter)
+        documents = iter_documents(source)
+        assert next(documents).page_content == "a"
+        assert loader.loaded == 1
+        assert [doc.page_content for doc in documents] == ["b", "c", "d"]
+
+    def test_unsupported(self):
+        with pytest.raises(ValueError):
+            list(iter_documents("not a loader"))
+
+
+def test_batched():
+    assert list(batched(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(batched([], 2)) == []
+
+
+class TestIngestDocuments:
+    @pytest.mark.parametrize("concurrency", [1, 3])
+    def test_ingest(self, concurrency):
+        documents = iter_documents(FakeLoader(texts(10)))
+        progress = IngestProgress()
+        vectorstore = ingest_documents(
+            MockVectorStore,
+            CONFIG,
+            documents,
+            batch_size=3,
+            concurrency=concurrency,
+            progress=progress,
+        )
+        assert sorted(vectorstore.texts) == sorted(texts(10))
+        assert vectorstore.calls == 4
+        assert progress.batches == 4
+        assert progress.documents == 10
+
+    def test_no_documents(self):
+        assert ingest_documents(MockVectorStore, CONFIG, [], batch_size=3) is None
+
+    def test_resume(self, cache):
+        key = get_ingest_key(FAKE_VECTORSTORE, {}, None)
+        progress = IngestProgress.load(key)
+        with pytest.raises(ValueError, match="failed to add doc-7"):
+            ingest_documents(
+                MockVectorStore,
+                {**CONFIG, "fail_on": "doc-7"},
+                iter_documents(FakeLoader(texts(10))),
+                batch_size=3,
+                progress=progress,
+            )
+
+        # batches before the failed batch are saved
+        progress = IngestProgress.load(key)
+        assert progress.batches == 2
+        assert progress.documents == 6
+
+        vectorstore = ingest_documents(
+            MockVectorStore,
+            CONFIG,
+            iter_documents(FakeLoader(texts(10))),
+            batch_size=3,
+            progress=progress,
+            resume=True,
+        )
+        assert vectorstore.texts == texts(10)[6:]
+        assert IngestProgress.load(key).batches == 4
+
+    def test_resume_disabled(self, cache):
+        key = get_ingest_key(FAKE_VECTORSTORE, {}, None)
+        with pytest.raises(ValueError, match="failed to add doc-7"):
+            ingest_documents(
+                MockVectorStore,
+                {**CONFIG, "fail_on": "doc-7"},
+                iter_documents(FakeLoader(texts(10))),
+                batch_size=3,
+                progress=IngestProgress.load(key),
+            )
+        assert IngestProgress.load(key).batches == 2
+
+        # without resume, saved progress is discarded and every batch is written
+        progress = IngestProgress.load(key)
+        vectorstore = ingest_documents(
+            MockVectorStore,
+            CONFIG,
+            iter_documents(FakeLoader(texts(10))),
+            batch_size=3,
+            progress=progress,
+        )
+        assert vectorstore.texts == texts(10)
+        assert progress.batches == 4
+        assert progress.documents == 10
+
+    def test_resume_changed_source(self, cache):
+        key = get_ingest_key(FAKE_VECTORSTORE, {}, None)
+        with pytest.raises(ValueError, match="failed to add doc-7"):
+            ingest_documents(
+                MockVectorStore,
+                {**CONFIG, "fail_on": "doc-7"},
+                iter_documents(FakeLoader(texts(10))),
+                batch_size=3,
+                progress=IngestProgress.load(key),
+            )
+        assert IngestProgress.load(key).batches == 2
+
+        # only the unchanged first batch is skipped
+        changed = texts(10)
+        changed[4] = "changed"
+        progress = IngestProgress.load(key)
+        vectorstore = ingest_documents(
+            MockVectorStore,
+            CONFIG,
+            iter_documents(FakeLoader(changed)),
+            batch_size=3,
+            progress=progress,
+            resume=True,
+        )
+        assert vectorstore.texts == changed[3:]
+        assert progress.batches == 4
+        assert progress.documents == 10
+        assert IngestProgress.load(key).digests == progress.digests
+
+
+class TestCanResumeIngest:
+    def test_redis(self):
+        assert can_resume_ingest(AsyncRedisVectorstore, {"index_name": "docs"})
+        # without index_name from_documents generates a random index
+        assert not can_resume_ingest(AsyncRedisVectorstore, {"redis_url": "x"})
+
+    def test_chroma(self):
+        assert can_resume_ingest(AsyncChromaVectorstore, {"persist_directory": "x"})
+        assert can_resume_ingest(
+            AsyncChromaVectorstore,
+            {"client_settings": Settings(chroma_server_host="chroma")},
+        )
+        # an in-memory client is gone after a worker restart
+        assert not can_resume_ingest(AsyncChromaVectorstore, {})
+        assert not can_resume_ingest(
+            AsyncChromaVectorstore, {"client_settings": Settings()}
+        )
+
+    def test_other(self):
+        assert not can_resume_ingest(MockVectorStore, {})
+
+
+class TestInitializeVectorstore:
+    def test_streaming(self, cache, settings):
+        settings.VECTORSTORE_INGEST_BATCH_SIZE = 4
+        loader = FakeLoader(texts(10))
+        vectorstore = initialize_vectorstore(
+            FAKE_VECTORSTORE, {"documents": loader, **CONFIG}
+        )
+        assert sorted(vectorstore.texts) == sorted(texts(10))
+        assert vectorstore.calls == 3
+
+        # progress is cleared once ingest completes
+        key = get_ingest_key(FAKE_VECTORSTORE, CONFIG, loader)
+        assert IngestProgress.load(key).batches == 0
+
+    def test_in_memory_chroma_not_resumed(self, cache, settings):
+        settings.VECTORSTORE_INGEST_BATCH_SIZE = 4
+        class_path = "ix.chains.components.vectorstores.AsyncChromaVectorstore"
+        config = {
+            "collection_name": f"test_{uuid4().hex}",
+            "embedding": FakeEmbeddings(size=4),
+        }
+        loader = FakeLoader(texts(10))
+
+        # progress saved by an ingest into a store that no longer exists
+        progress = IngestProgress.load(get_ingest_key(class_path, config, loader))
+        progress.add(4, "digest")
+        progress.save()
+
+        vectorstore = initialize_vectorstore(
+            class_path, {"documents": loader, **config}
+        )
+        assert vectorstore._collection.count() == 10
+
+    def test_streaming_disabled(self, settings):
+        settings.VECTORSTORE_INGEST_BATCH_SIZE = 0
+        loader = FakeLoader(texts(10))
+        vectorstore = initialize_vectorstore(
+            FAKE_VECTORSTORE, {"documents": loader, **CONFIG}
+        )
+        assert vectorstore.texts == texts(10)
+        assert vectorstore.calls == 1
+
+    def test_no_documents(self, cache):
+        vectorstore = initialize_vectorstore(
+            FAKE_VECTORSTORE, {"documents": FakeLoader([]), **CONFIG}
+        )
+        assert vectorstore.texts == []
+
+    def test_progress_key(self):
+        loader = FakeLoader(texts(2))
+        key = get_ingest_key(FAKE_VECTORSTORE, {"collection_name": "a"}, loader)
+        assert key == get_ingest_key(
+            FAKE_VECTORSTORE, {"collection_name": "a"}, FakeLoader(texts(2))
+        )
+        assert key != get_ingest_key(FAKE_VECTORSTORE, {"collection_name": "b"}, loader)
+        assert key != get_ingest_key(FAKE_VECTORSTORE, {}, FakeLoader(texts(3)))
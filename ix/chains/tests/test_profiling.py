@@ -0,0 +1,181 @@
+import logging
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from ix.chains.loaders import core
+from ix.chains.loaders.core import ainit_chain_flow, map_subgraphs
+from ix.chains.loaders.profiling import (
+    LoadProfile,
+    LoadProfileSink,
+    NodeLoadSpan,
+    SpanLoggingLoadProfileSink,
+    export_profile,
+    load_phase,
+    profile_load,
+    profile_node_load,
+)
+
+
+def fake_node(name: str, class_path: str = "test.Component"):
+    return SimpleNamespace(
+        id=uuid4(),
+        name=name,
+        class_path=class_path,
+        node_type=SimpleNamespace(type="chain"),
+    )
+
+
+def fake_span(class_path: str, duration: float, properties: float = 0):
+    return NodeLoadSpan(
+        node_id=uuid4(),
+        name=class_path,
+        class_path=class_path,
+        node_type="chain",
+        started_at=datetime.now(tz=timezone.utc),
+        phases={"properties": properties, "initialize": duration - properties},
+        duration=duration,
+    )
+
+
+@profile_node_load
+def load(node, children=None):
+    with load_phase("properties"):
+        loaded = [load(child) for child in children or []]
+    with load_phase("initialize"):
+        return node.name, loaded
+
+
+@profile_node_load
+async def aload(node):
+    with load_phase("initialize"):
+        return node.name
+
+
+class TestLoadProfile:
+    def test_summary(self):
+        profile = LoadProfile(chain_id="test")
+        profile.add(fake_span("parent", duration=3, properties=2.5))
+        profile.add(fake_span("child", duration=1))
+        profile.add(fake_span("child", duration=1.5))
+
+        components = profile.summary()["components"]
+        assert [item["class_path"] for item in components] == ["child", "parent"]
+        assert components[0]["count"] == 2
+        assert components[0]["self_time"] == 2.5
+        assert components[0]["max_self_time"] == 1.5
+        assert components[1]["self_time"] == 0.5
+
+
+class TestProfileNodeLoad:
+    def test_disabled(self):
+        with profile_load("test", enabled=False) as profile:
+            assert load(fake_node("node")) == ("node", [])
+        assert profile is None
+
+    def test_nested_spans(self):
+        parent = fake_node("parent")
+        child = fake_node("child", class_path="test.Child")
+
+        with profile_load("test", enabled=True) as profile:
+            load(parent, children=[child])
+
+        assert profile.duration is not None
+        assert [span.name for span in profile.spans] == ["child", "parent"]
+        child_span, parent_span = profile.spans
+        assert child_span.node_id == child.id
+        assert set(parent_span.phases) == {"properties", "initialize"}
+        assert parent_span.phases["properties"] >= child_span.duration
+        assert parent_span.self_time <= parent_span.duration
+
+    async def test_async(self):
+        with profile_load("test", enabled=True) as profile:
+            assert await aload(fake_node("node")) == "node"
+
+        assert [span.name for span in profile.spans] == ["node"]
+        assert "initialize" in profile.spans[0].phases
+
+    def test_context(self):
+        context = SimpleNamespace(task_id="task", user_id="user")
+        with profile_load("chain", context, enabled=True) as profile:
+            pass
+        assert profile.task_id == "task"
+        assert profile.user_id == "user"
+
+    def test_thread_pool(self, settings, mocker):
+        """spans recorded in worker threads are added to the active profile"""
+        settings.CHAIN_LOAD_WORKERS = 4
+        mocker.patch.object(core, "connections")
+        nodes = [fake_node(f"node{i}") for i in range(3)]
+
+        with profile_load("test", enabled=True) as profile:
+            map_subgraphs(load, nodes)
+
+        assert {span.name for span in profile.spans} == {"node0", "node1", "node2"}
+
+
+class MockSink(LoadProfileSink):
+    def __init__(self):
+        self.profiles = []
+
+    def export(self, profile: LoadProfile) -> None:
+        self.profiles.append(profile)
+
+
+class FailingSink(LoadProfileSink):
+    def export(self, profile: LoadProfile) -> None:
+        raise ValueError("failed")
+
+
+class TestSinks:
+    def test_abstract(self):
+        with pytest.raises(TypeError):
+            LoadProfileSink()
+
+    def test_span_logging(self, caplog):
+        profile = LoadProfile(chain_id="test", task_id="task")
+        profile.add(fake_span("test.Component", duration=2, properties=0.5))
+
+        with caplog.at_level(logging.INFO, logger="ix.chains.load_profile"):
+            SpanLoggingLoadProfileSink().export(profile)
+
+        assert len(caplog.records) == 1
+        span = caplog.records[0].load_span
+        assert span["chain_id"] == "test"
+        assert span["task_id"] == "task"
+        assert span["class_path"] == "test.Component"
+        assert span["self_time"] == 1.5
+
+
+class TestExportProfile:
+    def test_export(self, mocker):
+        sink = MockSink()
+        mocker.patch(
+            "ix.chains.loaders.profiling.get_sinks", return_value=[FailingSink(), sink]
+        )
+        profile = LoadProfile(chain_id="test")
+
+        # errors in one sink don't prevent export to the rest
+        export_profile(profile)
+        export_profile(None)
+        assert sink.profiles == [profile]
+
+
+@pytest.mark.django_db
+class TestInitChainFlowProfile:
+    async def test_profile(self, settings, mocker, lcel_map, aix_context):
+        settings.CHAIN_LOAD_PROFILE_SINKS = ["test.MockSink"]
+        sink = MockSink()
+        mocker.patch("ix.chains.loaders.profiling.get_sinks", return_value=[sink])
+        chain = lcel_map["chain"]
+
+        await ainit_chain_flow(chain, context=aix_context)
+
+        assert len(sink.profiles) == 1
+        profile = sink.profiles[0]
+        assert profile.chain_id == str(chain.id)
+        assert {span.name for span in profile.spans} >= {"node1", "node2"}
+        assert all(span.duration is not None for span in profile.spans)
+        assert {span.name for span in profile.subgraphs} == {"map[a]", "map[b]"}
@@ -0,0 +1,48 @@
+import json
+
+from ix.chains.fixture_src.vectorstores import (
+    REDIS_VECTORSTORE_CLASS_PATH,
+    get_vectorstore_retriever_fieldnames,
+)
+from ix.chains.registry import ComponentRegistry, build_manifest, registry
+from ix.chains.tests.mock_runnable import MOCK_RUNNABLE_CLASS_PATH
+
+
+class TestComponentRegistry:
+    def test_manifest_is_up_to_date(self):
+        """
+        The manifest must be rebuilt when component definitions change. Run:
+        `./manage.py build_component_manifest`
+        """
+        # round trip through json so tuples etc. compare equal
+        expected = json.loads(json.dumps(build_manifest()))
+        assert registry.manifest == expected
+
+    def test_entries_include_testing_components(self, settings):
+        settings.TESTING = True
+        class_paths = {entry["node_type"]["class_path"] for entry in registry.entries()}
+        assert MOCK_RUNNABLE_CLASS_PATH in class_paths
+
+        settings.TESTING = False
+        class_paths = {entry["node_type"]["class_path"] for entry in registry.entries()}
+        assert MOCK_RUNNABLE_CLASS_PATH not in class_paths
+
+    def test_get(self):
+        entry = registry.get("langchain.chat_models.openai.ChatOpenAI")
+        assert entry["node_type"]["type"] == "llm"
+        assert entry["config_schema"]["type"] == "object"
+        assert registry.get("does.not.Exist") is None
+
+    def test_get_retriever_fieldnames(self):
+        assert registry.get_retriever_fieldnames(
+            REDIS_VECTORSTORE_CLASS_PATH
+        ) == get_vectorstore_retriever_fieldnames(REDIS_VECTORSTORE_CLASS_PATH)
+        assert registry.get_retriever_fieldnames(
+            "does.not.Exist"
+        ) == get_vectorstore_retriever_fieldnames("does.not.Exist")
+
+    def test_missing_manifest(self, tmp_path):
+        missing = ComponentRegistry(path=tmp_path / "manifest.json")
+        assert len(missing.manifest["components"]) == len(
+            registry.manifest["components"]
+        )
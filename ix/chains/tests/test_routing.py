@@ -1,13 +1,16 @@
 import logging
 from copy import deepcopy
+from typing import Any, List
 from unittest.mock import MagicMock
 
 import pytest
+from langchain.chains.base import Chain
 from langchain.schema import HumanMessage
 
 from ix.chains.models import ChainNode
 from ix.chains.routing import MapSubchain
 from ix.chains.tests.mock_chain import MOCK_CHAIN_CONFIG
+from ix.chains.tests.mock_concurrency import MockDelay
 from ix.chains.tests.mock_configs import (
     LLM_REPLY,
     LLM_REPLY_WITH_HISTORY,
@@ -244,3 +247,65 @@ class TestMapSubchain:
         assert "Human: test1" not in system_message2
         assert "Human: test1" not in system_message3
         assert "Human: test2" not in system_message3
+
+
+class SlowEchoChain(Chain, MockDelay):
+    """Echoes `item` after a delay, tracking how many calls run at once"""
+
+    seen_outputs: List[Any] = []
+
+    @property
+    def input_keys(self) -> List[str]:
+        return ["item", "outputs"]
+
+    @property
+    def output_keys(self) -> List[str]:
+        return ["echo"]
+
+    def _call(self, inputs, run_manager=None):
+        self.seen_outputs.append(list(inputs["outputs"]))
+        self._wait()
+        return {"echo": inputs["item"]}
+
+    async def _acall(self, inputs, run_manager=None):
+        self.seen_outputs.append(list(inputs["outputs"]))
+        await self._await(inputs["item"])
+        return {"echo": inputs["item"]}
+
+
+class TestMapSubchainConcurrency:
+    def map_subchain(self, **kwargs):
+        echo = SlowEchoChain(seen_outputs=[])
+        chain = MapSubchain(
+            chains=[echo],
+            input_variables=["items"],
+            map_input="items",
+            map_input_to="item",
+            output_key="outputs",
+            **kwargs,
+        )
+        return chain, echo
+
+    def test_sequential(self):
+        chain, echo = self.map_subchain()
+        assert chain.run(items=[0, 1, 2]) == [0, 1, 2]
+        assert echo.max_running == 1
+        # each iteration receives the outputs of previous iterations
+        assert echo.seen_outputs == [[], [0], [0, 1]]
+
+    def test_concurrent(self):
+        chain, echo = self.map_subchain(max_concurrency=2)
+        assert chain.run(items=[0, 1, 2, 3]) == [0, 1, 2, 3]
+        assert echo.max_running == 2
+        assert echo.seen_outputs == [[], [], [], []]
+
+    async def test_asequential(self):
+        chain, echo = self.map_subchain()
+        assert await chain.arun(items=[0, 1, 2]) == [0, 1, 2]
+        assert echo.max_running == 1
+        assert echo.seen_outputs == [[], [0], [0, 1]]
+
+    async def test_aconcurrent(self):
+        chain, echo = self.map_subchain(max_concurrency=3)
+        assert await chain.arun(items=[0, 1, 2, 3, 4]) == [0, 1, 2, 3, 4]
+        assert echo.max_running == 3
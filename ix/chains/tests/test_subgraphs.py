@@ -0,0 +1,152 @@
+import threading
+import time
+
+import pytest
+
+from ix.chains.loaders import core
+from ix.chains.loaders.core import init_chain_flow, map_subgraphs
+from ix.chains.loaders.profiling import LoadProfile, SubgraphSpan, profile_load
+from ix.chains.tests.fake import fake_chain, fake_node_map, fake_runnable
+
+
+class TestMapSubgraphs:
+    def test_sequential(self, settings):
+        settings.CHAIN_LOAD_WORKERS = 0
+        threads = set()
+
+        def func(item):
+            threads.add(threading.get_ident())
+            return item * 2
+
+        assert map_subgraphs(func, [1, 2, 3]) == [2, 4, 6]
+        assert threads == {threading.get_ident()}
+
+    def test_thread_pool(self, settings, mocker):
+        settings.CHAIN_LOAD_WORKERS = 4
+        mocker.patch.object(core, "connections")
+        barrier = threading.Barrier(3, timeout=5)
+
+        def func(item):
+            # all three items must run at the same time to pass the barrier
+            barrier.wait()
+            return item * 2
+
+        assert map_subgraphs(func, [1, 2, 3]) == [2, 4, 6]
+
+    def test_nested_does_not_deadlock(self, settings, mocker):
+        """More nested subgraphs than workers run inline instead of waiting"""
+        settings.CHAIN_LOAD_WORKERS = 2
+        mocker.patch.object(core, "connections")
+
+        def func(item):
+            if isinstance(item, list):
+                return sum(map_subgraphs(func, item))
+            time.sleep(0.01)
+            return item
+
+        items = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+        assert map_subgraphs(func, items) == [6, 15, 24]
+
+
+def sleep_subgraphs(item):
+    """Sleep for each leaf of a nested list of durations"""
+    if isinstance(item, list):
+        return sum(map_subgraphs(sleep_subgraphs, item))
+    time.sleep(item)
+    return item
+
+
+class TestSubgraphSpans:
+    def test_disabled(self, settings):
+        settings.CHAIN_LOAD_WORKERS = 0
+        with profile_load("test", enabled=False) as profile:
+            assert map_subgraphs(sleep_subgraphs, [0, 0]) == [0, 0]
+        assert profile is None
+
+    def test_named_spans(self, settings):
+        settings.CHAIN_LOAD_WORKERS = 0
+        with profile_load("test", enabled=True) as profile:
+            map_subgraphs(sleep_subgraphs, [0, 0.01], names=["map[a]", "map[b]"])
+
+        assert [span.name for span in profile.subgraphs] == ["map[a]", "map[b]"]
+        assert profile.subgraphs[1].duration >= 0.01
+
+    def test_default_names(self, settings):
+        settings.CHAIN_LOAD_WORKERS = 0
+        with profile_load("test", enabled=True) as profile:
+            map_subgraphs(sleep_subgraphs, [0, 0])
+
+        assert [span.name for span in profile.subgraphs] == ["0", "1"]
+
+    @pytest.mark.parametrize("workers", [0, 4])
+    def test_nested_spans(self, workers, settings, mocker):
+        settings.CHAIN_LOAD_WORKERS = workers
+        mocker.patch.object(core, "connections")
+        with profile_load("test", enabled=True) as profile:
+            map_subgraphs(sleep_subgraphs, [[0, 0.01], [0.05, 0]])
+
+        # worker threads may start subgraphs out of order
+        assert sorted(span.name for span in profile.subgraphs) == ["0", "1"]
+        assert all(
+            sorted(child.name for child in span.children) == ["0", "1"]
+            for span in profile.subgraphs
+        )
+        assert [span.name for span in profile.critical_path()] == ["1", "0"]
+        assert profile.critical_path()[1].duration >= 0.05
+
+    def test_critical_path(self):
+        profile = LoadProfile(chain_id="test")
+        fast = SubgraphSpan(name="branch[default]", duration=1)
+        slow = SubgraphSpan(name="branch[a]", duration=3)
+        profile.add_subgraph(fast)
+        profile.add_subgraph(slow)
+        profile.add_subgraph(SubgraphSpan(name="sequence[0]", duration=2), slow)
+        profile.add_subgraph(SubgraphSpan(name="sequence[1]", duration=0.5), slow)
+
+        assert profile.summary()["critical_path"] == [
+            {"name": "branch[a]", "duration": 3},
+            {"name": "sequence[0]", "duration": 2},
+        ]
+
+    def test_critical_path_empty(self):
+        profile = LoadProfile(chain_id="test")
+        assert profile.critical_path() == []
+        assert profile.summary()["critical_path"] == []
+
+
+@pytest.mark.django_db(transaction=True)
+class TestInitChainFlowThreadPool:
+    """
+    Subgraphs loaded by worker threads read the chain with their own database
+    connections, so they only see committed rows.
+    """
+
+    def test_map(self, settings, ix_context):
+        settings.CHAIN_LOAD_WORKERS = 4
+        chain = fake_chain()
+        node1 = fake_runnable(chain=chain, name="node1", root=True)
+        node2 = fake_runnable(chain=chain, name="node2", root=True)
+        fake_node_map(chain=chain, nodes={"a": node1, "b": node2})
+
+        flow = init_chain_flow(chain, context=ix_context)
+
+        assert flow.invoke(input={"input": "test"}) == {
+            "a": {"input": "test", "node1": 0},
+            "b": {"input": "test", "node2": 0},
+        }
+
+    def test_map_subgraph_spans(self, settings, mocker, ix_context):
+        settings.CHAIN_LOAD_WORKERS = 4
+        settings.CHAIN_LOAD_PROFILE_SINKS = ["test.MockSink"]
+        sink = mocker.Mock()
+        mocker.patch("ix.chains.loaders.profiling.get_sinks", return_value=[sink])
+        chain = fake_chain()
+        node1 = fake_runnable(chain=chain, name="node1", root=True)
+        node2 = fake_runnable(chain=chain, name="node2", root=True)
+        fake_node_map(chain=chain, nodes={"a": node1, "b": node2})
+
+        init_chain_flow(chain, context=ix_context)
+
+        profile = sink.export.call_args.args[0]
+        assert {span.name for span in profile.subgraphs} == {"map[a]", "map[b]"}
+        assert profile.summary()["critical_path"][0]["name"] in {"map[a]", "map[b]"}
@@ -0,0 +1,39 @@
+import pytest
+
+from ix.chains.loaders.warmup import start_warmup, warm_node_types
+from ix.chains.models import NodeType
+from ix.utils import importlib as ix_importlib
+from ix.utils.importlib import clear_import_cache
+
+
+@pytest.fixture()
+def node_types():
+    clear_import_cache()
+    NodeType.objects.create(
+        name="ordered dict", type="chain", class_path="collections.OrderedDict"
+    )
+    NodeType.objects.create(
+        name="missing", type="chain", class_path="does_not_exist.Missing"
+    )
+    yield
+    clear_import_cache()
+
+
+@pytest.mark.django_db
+class TestWarmNodeTypes:
+    def test_warm_node_types(self, node_types, mocker):
+        errors = warm_node_types()
+        assert "does_not_exist.Missing" in errors
+        assert "collections.OrderedDict" not in errors
+
+        # both the class and the failure are cached
+        spy = mocker.spy(ix_importlib, "_resolve_class")
+        ix_importlib.warm_import_cache(
+            ["collections.OrderedDict", "does_not_exist.Missing"]
+        )
+        assert spy.call_count == 0
+
+    def test_start_warmup_sync(self, node_types, mocker):
+        spy = mocker.spy(ix_importlib, "_resolve_class")
+        assert start_warmup(background=False) is None
+        assert spy.call_count >= 2
@@ -15,6 +15,8 @@ from ix.agents.models import Agent
 from ix.agents.tests.mock_llm import MockChatOpenAI
 from ix.chains.callbacks import IxHandler
 from ix.chains.fixture_src.embeddings import OPENAI_EMBEDDINGS_CLASS_PATH
+from ix.chains.loaders.cache import flow_cache
+from ix.secrets.cache import secret_cache
 from ix.chains.loaders.context import IxContext
 from ix.chains.management.commands.create_ix_v2 import (
     IX_CHAIN_V2,
@@ -69,6 +71,22 @@ def silence_import_langchain():
     yield
 
 
+@pytest.fixture(autouse=True)
+def clean_flow_cache():
+    """compiled flows are cached per process, clear them between tests"""
+    flow_cache.clear()
+    yield
+    flow_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clean_secret_cache():
+    """secret values are cached per process, clear them between tests"""
+    secret_cache.clear()
+    yield
+    secret_cache.clear()
+
+
 @pytest_asyncio.fixture
 async def arequest_user(mocker):
     user = await afake_user()
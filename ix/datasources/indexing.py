@@ -0,0 +1,188 @@
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Literal, Optional
+
+from asgiref.sync import sync_to_async
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
+
+from ix.datasources.models import DataSource, IngestedChunk
+from ix.runnable.vectorstore import AddDocuments, DeleteVectors
+
+logger = logging.getLogger(__name__)
+
+
+def hash_document(document: Document) -> str:
+    """Hash of a document's content and metadata"""
+    data = json.dumps(
+        [document.page_content, document.metadata], sort_keys=True, default=str
+    )
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def get_source_id(document: Document) -> str:
+    """Identify the source of a document by its `source` metadata, if present"""
+    source = document.metadata.get("source")
+    if source is None:
+        return f"hash:{hash_document(document)}"
+    return str(source)
+
+
+@dataclass
+class IndexResult:
+    added: int = 0
+    skipped: int = 0
+    deleted: int = 0
+    sources_skipped: int = 0
+
+
+class DataSourceIndexer:
+    """
+    Incrementally index documents into a vectorstore for a DataSource.
+
+    Source documents are grouped by `get_source_id`, in any order, and each source
+    is hashed over all of its documents. Sources whose hash matches the ledger are
+    skipped without splitting or embedding. Changed sources are split and compared
+    chunk by chunk: unchanged chunks are kept, new chunks are embedded with
+    AddDocuments, and chunks no longer present are deleted with DeleteVectors.
+
+    cleanup:
+        "full": sources missing from this import are deleted. Use when `documents`
+            is the complete datasource.
+        "incremental": only sources present in this import are updated.
+
+    This is a library API. Retrieval chains don't call it: vectorstore nodes
+    ingest with `ix.chains.loaders.ingest`, which has no DataSource to keep a
+    ledger for. Callers importing a DataSource outside a chain use this, or
+    `index_documents`, directly.
+    """
+
+    def __init__(
+        self,
+        datasource: DataSource,
+        vectorstore: VectorStore,
+        text_splitter=None,
+        cleanup: Literal["full", "incremental"] = "full",
+    ):
+        self.datasource = datasource
+        self.vectorstore = vectorstore
+        self.text_splitter = text_splitter
+        self.cleanup = cleanup
+
+    def split(self, documents: List[Document]) -> List[Document]:
+        if self.text_splitter is None:
+            return documents
+        return self.text_splitter.split_documents(documents)
+
+    def ledger(self, source: str) -> Dict[str, IngestedChunk]:
+        chunks = IngestedChunk.objects.filter(datasource=self.datasource, source=source)
+        return {chunk.chunk_hash: chunk for chunk in chunks}
+
+    def delete(self, chunks: Iterable[IngestedChunk]) -> int:
+        chunks = list(chunks)
+        if not chunks:
+            return 0
+        DeleteVectors(vectorstore=self.vectorstore).invoke(
+            [chunk.vector_id for chunk in chunks]
+        )
+        IngestedChunk.objects.filter(id__in=[chunk.id for chunk in chunks]).delete()
+        return len(chunks)
+
+    def index_source(
+        self, source: str, documents: List[Document], result: IndexResult
+    ) -> None:
+        """Index all documents from one source, replacing its previous chunks."""
+        ledger = self.ledger(source)
+        source_hash = hashlib.sha256(
+            "".join(hash_document(document) for document in documents).encode()
+        ).hexdigest()
+        if ledger and all(
+            chunk.source_hash == source_hash for chunk in ledger.values()
+        ):
+            result.sources_skipped += 1
+            result.skipped += len(ledger)
+            return
+
+        chunks = {}
+        for chunk in self.split(documents):
+            chunks.setdefault(hash_document(chunk), chunk)
+
+        new_hashes = [chunk_hash for chunk_hash in chunks if chunk_hash not in ledger]
+        kept = [ledger[chunk_hash] for chunk_hash in chunks if chunk_hash in ledger]
+        result.skipped += len(kept)
+        result.deleted += self.delete(
+            chunk for chunk_hash, chunk in ledger.items() if chunk_hash not in chunks
+        )
+        IngestedChunk.objects.filter(id__in=[chunk.id for chunk in kept]).update(
+            source_hash=source_hash
+        )
+
+        if new_hashes:
+            vector_ids = AddDocuments(vectorstore=self.vectorstore).invoke(
+                [chunks[chunk_hash] for chunk_hash in new_hashes]
+            )
+            IngestedChunk.objects.bulk_create(
+                IngestedChunk(
+                    datasource=self.datasource,
+                    source=source,
+                    source_hash=source_hash,
+                    chunk_hash=chunk_hash,
+                    vector_id=vector_id,
+                )
+                for chunk_hash, vector_id in zip(new_hashes, vector_ids)
+            )
+            result.added += len(new_hashes)
+
+    def index(self, documents: Iterable[Document]) -> IndexResult:
+        """
+        Index documents. Documents are buffered by source so that each source is
+        indexed once even when its documents aren't adjacent.
+        """
+        sources: Dict[str, List[Document]] = {}
+        for document in documents:
+            sources.setdefault(get_source_id(document), []).append(document)
+
+        result = IndexResult()
+        for source, source_documents in sources.items():
+            self.index_source(source, source_documents, result)
+
+        if self.cleanup == "full":
+            removed = IngestedChunk.objects.filter(datasource=self.datasource).exclude(
+                source__in=sources
+            )
+            result.deleted += self.delete(removed)
+
+        logger.info(
+            f"Indexed datasource={self.datasource.id} added={result.added} "
+            f"skipped={result.skipped} deleted={result.deleted}"
+        )
+        return result
+
+    async def aindex(self, documents: Iterable[Document]) -> IndexResult:
+        return await sync_to_async(self.index, thread_sensitive=False)(documents)
+
+
+def index_documents(
+    datasource: DataSource,
+    vectorstore: VectorStore,
+    documents: Iterable[Document],
+    text_splitter=None,
+    cleanup: Literal["full", "incremental"] = "full",
+) -> IndexResult:
+    """Incrementally index documents for a datasource. See `DataSourceIndexer`"""
+    indexer = DataSourceIndexer(
+        datasource, vectorstore, text_splitter=text_splitter, cleanup=cleanup
+    )
+    return indexer.index(documents)
+
+
+def clear_index(
+    datasource: DataSource, vectorstore: Optional[VectorStore] = None
+) -> int:
+    """Remove a datasource's ledger, deleting its vectors if a vectorstore is given"""
+    chunks = IngestedChunk.objects.filter(datasource=datasource)
+    if vectorstore is None:
+        return chunks.delete()[0]
+    return DataSourceIndexer(datasource, vectorstore).delete(chunks)
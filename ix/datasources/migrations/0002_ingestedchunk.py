@@ -0,0 +1,49 @@
+# Generated by Django 4.2.6 on 2026-10-18 18:29
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("datasources", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IngestedChunk",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("source", models.CharField(max_length=1024)),
+                ("source_hash", models.CharField(max_length=64)),
+                ("chunk_hash", models.CharField(max_length=64)),
+                ("vector_id", models.CharField(max_length=255)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "datasource",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ingested_chunks",
+                        to="datasources.datasource",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["datasource", "source"],
+                        name="datasources_chunk_source_idx",
+                    )
+                ],
+            },
+        ),
+    ]
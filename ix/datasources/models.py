@@ -29,3 +29,36 @@ class DataSource(models.Model):
 
     # Retrieval chain - chain used to import this datasource
     retrieval_chain = models.ForeignKey(Chain, on_delete=models.SET_NULL, null=True)
+
+
+class IngestedChunk(models.Model):
+    """
+    Ledger of chunks a DataSource has written to its vectorstore.
+
+    Each row records a chunk's content hash and the id of its vector, along with
+    the source document it was split from and that document's content hash. When
+    a datasource is re-imported, unchanged source documents and chunks are
+    skipped, removed chunks are deleted from the vectorstore, and only new or
+    changed content is embedded. See `ix.datasources.indexing`.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    datasource = models.ForeignKey(
+        DataSource, on_delete=models.CASCADE, related_name="ingested_chunks"
+    )
+    source = models.CharField(max_length=1024)
+    source_hash = models.CharField(max_length=64)
+    chunk_hash = models.CharField(max_length=64)
+    vector_id = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["datasource", "source"],
+                name="datasources_chunk_source_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.source}:{self.chunk_hash[:8]}"
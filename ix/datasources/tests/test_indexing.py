@@ -0,0 +1,120 @@
+import pytest
+from langchain.text_splitter import CharacterTextSplitter
+from langchain_core.documents import Document
+
+from ix.chains.tests.mock_vectorstore import MockVectorStore
+from ix.datasources.indexing import (
+    clear_index,
+    get_source_id,
+    hash_document,
+    index_documents,
+)
+from ix.datasources.models import IngestedChunk
+from ix.datasources.tests.fake import fake_datasource
+
+
+def doc(source: str, content: str) -> Document:
+    return Document(page_content=content, metadata={"source": source})
+
+
+SPLITTER = CharacterTextSplitter(separator=" ", chunk_size=1, chunk_overlap=0)
+
+
+class TestHashing:
+    def test_hash_document(self):
+        assert hash_document(doc("a", "x")) == hash_document(doc("a", "x"))
+        assert hash_document(doc("a", "x")) != hash_document(doc("a", "y"))
+        assert hash_document(doc("a", "x")) != hash_document(doc("b", "x"))
+
+    def test_get_source_id(self):
+        assert get_source_id(doc("a.txt", "x")) == "a.txt"
+        no_source = Document(page_content="x")
+        assert get_source_id(no_source).startswith("hash:")
+
+
+@pytest.mark.django_db
+class TestIndexDocuments:
+    @pytest.fixture
+    def datasource(self, user):
+        return fake_datasource(user=user)
+
+    def index(self, datasource, vectorstore, documents, **kwargs):
+        return index_documents(
+            datasource, vectorstore, documents, text_splitter=SPLITTER, **kwargs
+        )
+
+    def test_initial_import(self, datasource):
+        vectorstore = MockVectorStore()
+        result = self.index(
+            datasource, vectorstore, [doc("a", "one two"), doc("b", "three")]
+        )
+        assert result.added == 3
+        assert sorted(vectorstore.texts) == ["one", "three", "two"]
+        assert IngestedChunk.objects.filter(datasource=datasource).count() == 3
+
+    def test_unchanged_reimport(self, datasource):
+        vectorstore = MockVectorStore()
+        documents = [doc("a", "one two"), doc("b", "three")]
+        self.index(datasource, vectorstore, documents)
+
+        result = self.index(datasource, vectorstore, documents)
+        assert result.added == 0
+        assert result.deleted == 0
+        assert result.skipped == 3
+        assert result.sources_skipped == 2
+        assert len(vectorstore.texts) == 3
+
+    def test_non_adjacent_source(self, datasource):
+        """a source split across the import is hashed and indexed once"""
+        vectorstore = MockVectorStore()
+        documents = [doc("a", "one"), doc("b", "three"), doc("a", "two")]
+        result = self.index(datasource, vectorstore, documents)
+        assert result.added == 3
+        source_hashes = IngestedChunk.objects.filter(source="a").values_list(
+            "source_hash", flat=True
+        )
+        assert len(set(source_hashes)) == 1
+
+        result = self.index(datasource, vectorstore, documents)
+        assert result.added == 0
+        assert result.deleted == 0
+        assert result.sources_skipped == 2
+        assert sorted(vectorstore.texts) == ["one", "three", "two"]
+
+    def test_changed_source(self, datasource):
+        vectorstore = MockVectorStore()
+        self.index(datasource, vectorstore, [doc("a", "one two"), doc("b", "three")])
+
+        result = self.index(
+            datasource, vectorstore, [doc("a", "one four"), doc("b", "three")]
+        )
+        assert result.added == 1
+        assert result.deleted == 1
+        assert result.skipped == 2
+        assert sorted(vectorstore.texts) == ["four", "one", "three"]
+
+    def test_removed_source(self, datasource):
+        vectorstore = MockVectorStore()
+        self.index(datasource, vectorstore, [doc("a", "one two"), doc("b", "three")])
+
+        result = self.index(datasource, vectorstore, [doc("a", "one two")])
+        assert result.deleted == 1
+        assert sorted(vectorstore.texts) == ["one", "two"]
+        assert not IngestedChunk.objects.filter(source="b").exists()
+
+    def test_incremental_cleanup_keeps_missing_sources(self, datasource):
+        vectorstore = MockVectorStore()
+        self.index(datasource, vectorstore, [doc("a", "one two"), doc("b", "three")])
+
+        result = self.index(
+            datasource, vectorstore, [doc("a", "one")], cleanup="incremental"
+        )
+        assert result.deleted == 1
+        assert sorted(vectorstore.texts) == ["one", "three"]
+
+    def test_clear_index(self, datasource):
+        vectorstore = MockVectorStore()
+        self.index(datasource, vectorstore, [doc("a", "one two")])
+        assert clear_index(datasource, vectorstore) == 2
+        assert vectorstore.texts == []
+        assert not IngestedChunk.objects.filter(datasource=datasource).exists()
@@ -1,12 +1,13 @@
 import logging
-import concurrent.futures
 from typing import Dict, Any, List
 
-from django.db.models import Q
+from asgiref.sync import sync_to_async
+from django.db.models import Q, QuerySet
 from langchain.schema import BaseMemory
 
+from ix.memory.cache import artifact_memory_cache
+from ix.memory.utils import run_outside_loop
 from ix.task_log.models import Artifact
-from ix.utils.asyncio import run_coroutine_in_new_loop
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +15,9 @@ logger = logging.getLogger(__name__)
 class ArtifactMemory(BaseMemory):
     """
     A memory implementation that loads artifacts into the context
+
+    Formatted artifacts are cached per chat for ARTIFACT_MEMORY_CACHE_TTL seconds.
+    Saving an artifact invalidates its chat's entries.
     """
 
     save_artifact: bool = False
@@ -31,55 +35,70 @@ class ArtifactMemory(BaseMemory):
     def memory_variables(self) -> List[str]:
         return [self.memory_key]
 
+    def get_chat_id(self) -> str:
+        # split session id back into chat_id
+        return self.session_id.split("_")[-1]
+
     def load_memory_variables(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Load related artifacts into memory"""
         logger.debug(
             f"ArtifactMemory.load_memory_variables input_key={self.input_key} inputs={inputs}"
         )
-
-        # split session id back into chat_id
-        chat_id = self.session_id.split("_")[-1]
-
-        # search for artifacts
         text = ""
         artifact_ids = inputs.get(self.input_key, None)
         if artifact_ids:
-            id_clauses = Q(pk__in=artifact_ids)
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(
-                    run_coroutine_in_new_loop, self.get_artifacts(chat_id, id_clauses)
-                )
-                text = future.result()
+            chat_id = self.get_chat_id()
+            text = artifact_memory_cache.get(chat_id, artifact_ids)
+            if text is None:
+                text = run_outside_loop(self.get_artifacts, chat_id, artifact_ids)
+                artifact_memory_cache.set(chat_id, artifact_ids, text)
 
         # return formatted artifacts
         return {self.memory_key: text}
 
-    async def get_artifacts(self, chat_id, id_clauses) -> None:
+    async def aload_memory_variables(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Load related artifacts into memory"""
+        logger.debug(
+            f"ArtifactMemory.aload_memory_variables input_key={self.input_key} inputs={inputs}"
+        )
         text = ""
-        artifacts = Artifact.objects.filter(
-            id_clauses,
-            (
+        artifact_ids = inputs.get(self.input_key, None)
+        if artifact_ids:
+            chat_id = self.get_chat_id()
+            text = artifact_memory_cache.get(chat_id, artifact_ids)
+            if text is None:
+                text = await sync_to_async(self.get_artifacts)(chat_id, artifact_ids)
+                artifact_memory_cache.set(chat_id, artifact_ids, text)
+
+        return {self.memory_key: text}
+
+    @staticmethod
+    def query(chat_id: str, artifact_ids: List[str]) -> QuerySet:
+        """Latest artifact for each key of the requested artifacts in the chat"""
+        return (
+            Artifact.objects.filter(
                 Q(task__leading_chats__id=chat_id)
-                | Q(task__parent__leading_chats__id=chat_id)
-            ),
-        ).order_by("-created_at")
+                | Q(task__parent__leading_chats__id=chat_id),
+                pk__in=artifact_ids,
+            )
+            .order_by("key", "-created_at")
+            .distinct("key")
+        )
 
-        artifacts = [artifact async for artifact in artifacts]
+    def get_artifacts(self, chat_id: str, artifact_ids: List[str]) -> str:
+        # artifacts are listed newest first
+        artifacts = sorted(
+            self.query(chat_id, artifact_ids),
+            key=lambda artifact: artifact.created_at,
+            reverse=True,
+        )
         logger.debug(f"Found n={len(artifacts)} artifacts")
-        if artifacts:
-            # format each artifact
-            # HAX: group by key to avoid duplicates, this is done here since it's
-            # a lot simpler than doing it in the query. This method will still
-            # query all the duplicates but only becomes an issue if there is a
-            # large number of duplicates
-            artifact_strs = {}
-            for artifact in artifacts:
-                if artifact.key not in artifact_strs:
-                    artifact_strs[artifact.key] = artifact.as_memory_text()
-            artifact_prompt = "".join(artifact_strs.values())
-            text = f"REFERENCED ARTIFACTS:\n{artifact_prompt}"
-
-        return text
+        if not artifacts:
+            return ""
+
+        # as_memory_text reads artifact data from storage
+        artifact_prompt = "".join(artifact.as_memory_text() for artifact in artifacts)
+        return f"REFERENCED ARTIFACTS:\n{artifact_prompt}"
 
     def save_context(self, inputs: Dict[str, Any], outputs: Dict[str, str]) -> None:
         """
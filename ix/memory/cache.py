@@ -0,0 +1,92 @@
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from django.conf import settings
+
+from ix.chat.models import Chat
+
+ArtifactMemoryKey = Tuple[str, Tuple[str, ...]]
+
+
+class ArtifactMemoryCache:
+    """
+    Per-process cache of formatted artifact memory keyed by chat and the
+    requested artifact ids.
+
+    Entries expire after `ttl` seconds. Saving an artifact invalidates the
+    entries of its chat in the current process, other processes see the change
+    when their entries expire.
+    """
+
+    def __init__(self, ttl: float = None):
+        self._ttl = ttl
+        self._values: Dict[ArtifactMemoryKey, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> float:
+        if self._ttl is not None:
+            return self._ttl
+        return settings.ARTIFACT_MEMORY_CACHE_TTL
+
+    @staticmethod
+    def key(
+        chat_id: UUID | str, artifact_ids: Iterable[UUID | str]
+    ) -> ArtifactMemoryKey:
+        return str(chat_id), tuple(sorted({str(id) for id in artifact_ids}))
+
+    def get(
+        self, chat_id: UUID | str, artifact_ids: Iterable[UUID | str]
+    ) -> Optional[str]:
+        key = self.key(chat_id, artifact_ids)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            expires, text = entry
+            if expires <= time.monotonic():
+                del self._values[key]
+                return None
+            return text
+
+    def set(
+        self, chat_id: UUID | str, artifact_ids: Iterable[UUID | str], text: str
+    ) -> None:
+        if self.ttl <= 0:
+            return
+        key = self.key(chat_id, artifact_ids)
+        with self._lock:
+            self._values[key] = (time.monotonic() + self.ttl, text)
+
+    def invalidate_chat(self, chat_id: UUID | str) -> None:
+        chat_id = str(chat_id)
+        with self._lock:
+            for key in [key for key in self._values if key[0] == chat_id]:
+                del self._values[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+artifact_memory_cache = ArtifactMemoryCache()
+
+
+def invalidate_artifact_memory(sender, instance, **kwargs):
+    """
+    Called when an artifact is saved. Drops cached memory of the chats the
+    artifact belongs to, either through its task or its task's parent.
+    """
+    if not len(artifact_memory_cache):
+        return
+
+    task = instance.task
+    task_ids = {task.id, task.parent_id} - {None}
+    chat_ids = Chat.objects.filter(task_id__in=task_ids).values_list("id", flat=True)
+    for chat_id in chat_ids:
+        artifact_memory_cache.invalidate_chat(chat_id)
@@ -0,0 +1,66 @@
+import logging
+from typing import List
+
+from langchain.schema import BaseChatMessageHistory
+from langchain.schema.messages import AIMessage, BaseMessage, HumanMessage
+
+from ix.chat.models import Chat
+from ix.memory.utils import run_outside_loop
+from ix.task_log.history import HistoryWindow, message_history_cache
+
+logger = logging.getLogger(__name__)
+
+
+class TaskLogMessageHistory(BaseChatMessageHistory):
+    """
+    Chat message history read from the task log.
+
+    Messages are served from the task's window in `message_history_cache`, so each
+    read only fetches messages written since the last one and the history is
+    limited to MESSAGE_HISTORY_TOKEN_BUDGET. User feedback and assistant replies
+    are included. The chat scope reads the chat's task, whose window includes the
+    replies each run writes to its subtask.
+
+    The chat already writes every message to the task log, so `add_message` does
+    nothing and `clear` only drops the cached window.
+    """
+
+    MESSAGE_TYPES = {"FEEDBACK", "ASSISTANT"}
+
+    supported_scopes = {"chat", "task"}
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+
+    def get_task_id(self) -> str:
+        # split session id back into scope and id
+        scope, scope_id = self.session_id.split("_")[-2:]
+        if scope == "chat":
+            return str(Chat.objects.values_list("task_id", flat=True).get(pk=scope_id))
+        return scope_id
+
+    def get_window(self) -> HistoryWindow:
+        return message_history_cache.update(self.get_task_id())
+
+    @property
+    def messages(self) -> List[BaseMessage]:
+        window = run_outside_loop(self.get_window)
+
+        messages = []
+        for message, content_type in zip(window.messages, window.types):
+            if content_type not in self.MESSAGE_TYPES:
+                continue
+            if message["role"] == "assistant":
+                messages.append(AIMessage(content=message["content"]))
+            else:
+                messages.append(HumanMessage(content=message["content"]))
+        return messages
+
+    def add_message(self, message: BaseMessage) -> None:
+        logger.debug(
+            f"TaskLogMessageHistory.add_message ignored, messages are read from the "
+            f"task log session_id={self.session_id}"
+        )
+
+    def clear(self) -> None:
+        message_history_cache.invalidate(run_outside_loop(self.get_task_id))
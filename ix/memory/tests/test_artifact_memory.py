@@ -2,11 +2,17 @@ from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
+from asgiref.sync import sync_to_async
 
 from ix.chains.llm_chain import LLMChain
 from ix.chains.tests.test_config_loader import unpack_chain_flow
 from ix.memory.artifacts import ArtifactMemory
-from ix.task_log.tests.fake import afake_artifact, afake_task
+from ix.task_log.tests.fake import (
+    afake_artifact,
+    afake_task,
+    fake_artifact,
+    fake_chat,
+)
 
 ARTIFACT_MEMORY = {
     "class_path": "ix.memory.artifacts.ArtifactMemory",
@@ -86,29 +92,30 @@ class TestArtifactMemory:
         Test various scenarios for loading memory variables.
         """
         instance = await aload_chain(ARTIFACT_MEMORY)
+        load_memory_variables = sync_to_async(instance.load_memory_variables)
         artifact1 = await afake_artifact(task=atask, key="test_artifact_1")
         artifact2 = await afake_artifact(task=atask, key="test_artifact_2")
         id_1 = str(artifact1.id)
         id_2 = str(artifact2.id)
 
         # test no artifact_keys
-        result1 = instance.load_memory_variables(dict())
+        result1 = await load_memory_variables(dict())
         assert result1 == {"related_artifacts": ""}
 
         # test empty artifact_keys
-        result1 = instance.load_memory_variables(dict(artifact_ids=[]))
+        result1 = await load_memory_variables(dict(artifact_ids=[]))
         assert result1 == {"related_artifacts": ""}
 
         # test one artifact_key
         inputs = dict(artifact_ids=[id_1])
-        result2 = instance.load_memory_variables(inputs=inputs)
+        result2 = await load_memory_variables(inputs=inputs)
         assert "REFERENCED ARTIFACTS:" in result2["related_artifacts"]
         assert artifact1.as_memory_text() in result2["related_artifacts"]
         assert artifact2.as_memory_text() not in result2["related_artifacts"]
 
         # test one artifact_key
         inputs = dict(artifact_ids=[id_1, id_2])
-        result3 = instance.load_memory_variables(inputs=inputs)
+        result3 = await load_memory_variables(inputs=inputs)
         assert "REFERENCED ARTIFACTS:" in result3["related_artifacts"]
         assert artifact1.as_memory_text() in result3["related_artifacts"]
         assert artifact2.as_memory_text() in result3["related_artifacts"]
@@ -117,7 +124,7 @@ class TestArtifactMemory:
         # hax: this won't raise an error of any kind now, but it's worth considering
         #      how to handle this better in the future.
         inputs = dict(artifact_ids=[str(uuid4())])
-        result4 = instance.load_memory_variables(inputs=inputs)
+        result4 = await load_memory_variables(inputs=inputs)
         assert result4 == {"related_artifacts": ""}
 
     def test_mapped_keys(self):
@@ -131,6 +138,53 @@ class TestArtifactMemory:
 
         # none of the excluded artifacts should be included in the memory
         instance = await aload_chain(ARTIFACT_MEMORY)
+        load_memory_variables = sync_to_async(instance.load_memory_variables)
         inputs = dict(artifact_ids=[str(artifact.id)])
-        result1 = instance.load_memory_variables(inputs=inputs)
+        result1 = await load_memory_variables(inputs=inputs)
         assert result1 == {"related_artifacts": ""}
+
+    async def test_latest_artifact_per_key(self, atask, aload_chain, mock_openai_key):
+        instance = await aload_chain(ARTIFACT_MEMORY)
+        old = await afake_artifact(task=atask, key="test_artifact_1")
+        new = await afake_artifact(
+            task=atask, key="test_artifact_1", description="new version"
+        )
+        inputs = dict(artifact_ids=[str(old.id), str(new.id)])
+        result = await instance.aload_memory_variables(inputs=inputs)
+        assert new.as_memory_text() in result["related_artifacts"]
+        assert old.as_memory_text() not in result["related_artifacts"]
+
+    async def test_cache(self, atask, aload_chain, mock_openai_key, mocker):
+        instance = await aload_chain(ARTIFACT_MEMORY)
+        artifact = await afake_artifact(task=atask, key="test_artifact_1")
+        inputs = dict(artifact_ids=[str(artifact.id)])
+        result = await instance.aload_memory_variables(inputs=inputs)
+
+        # cached results don't query
+        query = mocker.spy(ArtifactMemory, "query")
+        assert await instance.aload_memory_variables(inputs=inputs) == result
+        query.assert_not_called()
+
+        # saving an artifact in the chat invalidates the cache
+        await afake_artifact(task=atask, key="test_artifact_2")
+        assert await instance.aload_memory_variables(inputs=inputs) == result
+        query.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_load_memory_sync(task, mock_openai_key):
+    """load_memory_variables queries inline when there's no event loop"""
+    chat = fake_chat(task=task)
+    artifact = fake_artifact(task=task, key="test_artifact_1")
+    memory = ArtifactMemory(session_id=f"chat_{chat.id}", load_artifact=True)
+    result = memory.load_memory_variables(dict(artifact_ids=[str(artifact.id)]))
+    assert artifact.as_memory_text() in result["related_artifacts"]
+
+
+@pytest.mark.django_db
+async def test_load_memory_on_loop(atask, aload_chain, mock_openai_key):
+    """load_memory_variables can't query from an event loop"""
+    instance = await aload_chain(ARTIFACT_MEMORY)
+    artifact = await afake_artifact(task=atask, key="test_artifact_1")
+    with pytest.raises(RuntimeError, match="aload_memory_variables"):
+        instance.load_memory_variables(dict(artifact_ids=[str(artifact.id)]))
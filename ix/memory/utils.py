@@ -0,0 +1,37 @@
+import asyncio
+from typing import Any, Callable, Dict, TypeVar
+
+from asgiref.sync import sync_to_async
+from langchain.schema import BaseMemory
+
+T = TypeVar("T")
+
+
+def run_outside_loop(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run a blocking memory call. The ORM can't be used from an event loop, so
+    calling this from one raises: async code must load memory with
+    `aload_memory_variables`.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return func(*args)
+    raise RuntimeError(
+        f"{func.__qualname__} queries the database and can't be called from an "
+        f"event loop. Load memory with aload_memory_variables from async code."
+    )
+
+
+async def aload_memory_variables(
+    memory: BaseMemory, inputs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Load memory variables from async code. Uses the memory's
+    `aload_memory_variables` when it has one, otherwise runs
+    `load_memory_variables` with `sync_to_async`.
+    """
+    aload = getattr(memory, "aload_memory_variables", None)
+    if aload is not None:
+        return await aload(inputs)
+    return await sync_to_async(memory.load_memory_variables)(inputs)
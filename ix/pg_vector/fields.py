@@ -1,10 +1,33 @@
-from typing import List
+from array import array
+from typing import Optional, Sequence
 
-from django.db.models import Func
+from django.db.models import Func, Value
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
 
 
+def to_vector_literal(value: Optional[Sequence[float]]) -> Optional[str]:
+    """Format a sequence of floats in pgvector's text format, e.g. `[1.0,2.0]`"""
+    if value is None or isinstance(value, str):
+        return value
+    return "[" + ",".join(map(repr, map(float, value))) + "]"
+
+
+def parse_vector(value: str) -> array:
+    """Parse pgvector's text format into an array of 32 bit floats"""
+    value = value.strip("[]")
+    if not value:
+        return array("f")
+    return array("f", map(float, value.split(",")))
+
+
+class VectorValue(Value):
+    """A vector bound as a query parameter"""
+
+    def __init__(self, value: Sequence[float]):
+        super().__init__(to_vector_literal(value))
+
+
 class VectorField(ArrayField):
     """
     A custom Django field for storing vectors in PostgreSQL using the `pgvector` extension.
@@ -48,41 +71,62 @@ class VectorField(ArrayField):
         """
         return "VectorField"
 
+    def get_db_prep_value(self, value, connection, prepared=False):
+        """
+        Converts a sequence of floats (list, array, numpy array) to a vector
+        literal bound as a query parameter.
+        """
+        return to_vector_literal(value)
+
     def from_db_value(self, value, expression, connection):
         """
-        Converts a value as returned by the database to a Python object.
+        Converts a value as returned by the database to an array of 32 bit floats.
+        pgvector stores 32 bit floats, so this is lossless and much more compact
+        than a list. Use `numpy.frombuffer(value, dtype=numpy.float32)` for a
+        numpy view without copying.
         """
         if value is None:
             return value
-        # convert string to list of floats
-        return list(map(float, value.strip("[]").split(",")))
+        return parse_vector(value)
+
+
+class VectorDistance(Func):
+    """
+    Base class for pgvector distance operators.
 
+    The vector being compared to is bound as a query parameter instead of being
+    written into the SQL, so large vectors don't bloat the query text and the
+    query is the same for every vector.
+    """
 
-class EuclideanDistance(Func):
-    function = ""
-    template = "(%(expressions)s::vector) <-> '%(compare_to)s'"
+    operator: str = None
+    template = "(%(lhs)s::vector %(operator)s %(rhs)s::vector)"
     output_field = models.FloatField()
 
-    def __init__(self, expression: str, compare_to: List[float], **extra):
-        super().__init__(expression, **extra)
-        self.extra["compare_to"] = compare_to
+    def __init__(self, expression: str, compare_to: Sequence[float], **extra):
+        super().__init__(expression, VectorValue(compare_to), **extra)
 
+    def as_sql(self, compiler, connection, template=None, **extra_context):
+        lhs, rhs = self.get_source_expressions()
+        lhs_sql, lhs_params = compiler.compile(lhs)
+        rhs_sql, rhs_params = compiler.compile(rhs)
+        sql = (template or self.template) % {
+            "lhs": lhs_sql,
+            "operator": self.operator,
+            "rhs": rhs_sql,
+        }
+        return sql, (*lhs_params, *rhs_params)
 
-class CosineSimilarity(Func):
-    function = ""
-    template = "(%(expressions)s::vector) <=> '%(compare_to)s'"
-    output_field = models.FloatField()
 
-    def __init__(self, expression: str, compare_to: List[float], **extra):
-        super().__init__(expression, **extra)
-        self.extra["compare_to"] = compare_to
+class EuclideanDistance(VectorDistance):
+    operator = "<->"
 
 
-class InnerProduct(Func):
-    function = ""
-    template = "(%(expressions)s::vector <#> '%(compare_to)s') * -1"
-    output_field = models.FloatField()
+class CosineSimilarity(VectorDistance):
+    operator = "<=>"
+
 
-    def __init__(self, expression: str, compare_to: List[float], **extra):
-        super().__init__(expression, **extra)
-        self.extra["compare_to"] = compare_to
+class InnerProduct(VectorDistance):
+    # pgvector returns the negative inner product so ascending order is nearest
+    operator = "<#>"
+    template = "(%(lhs)s::vector %(operator)s %(rhs)s::vector) * -1"
@@ -77,3 +77,77 @@ class AddCosineDistanceIndex(migrations.RunSQL):
         index_name = index_name or f"{table_name}_{column_name}_cosine_idx"
         sql = f"CREATE INDEX {index_name} ON {table_name} USING ivfflat ({column_name} vector_cosine_ops) WITH (lists = {lists});"
         super().__init__(sql)
+
+
+class AddHNSWIndex(migrations.RunSQL):
+    """
+    Create an HNSW index on a specific column of a table. HNSW indexes have better
+    recall / speed tradeoffs than ivfflat and can be created on an empty table,
+    but take longer to build and use more memory.
+
+    Use a subclass for the distance function being indexed.
+
+    Args:
+        table_name (str): Name of the table.
+        column_name (str): Name of the column.
+        m (int, optional): Max connections per layer. Defaults to 16.
+        ef_construction (int, optional): Size of the candidate list used when
+            building the graph. Defaults to 64.
+        index_name (str, optional): Name of the index. If not provided, defaults
+            to '{table_name}_{column_name}_{suffix}'.
+    """
+
+    opclass: str = None
+    suffix: str = None
+
+    def __init__(
+        self,
+        table_name: str,
+        column_name: str,
+        m: int = 16,
+        ef_construction: int = 64,
+        index_name: str = None,
+    ):
+        index_name = index_name or f"{table_name}_{column_name}_{self.suffix}"
+        sql = (
+            f"CREATE INDEX {index_name} ON {table_name} USING hnsw "
+            f"({column_name} {self.opclass}) "
+            f"WITH (m = {m}, ef_construction = {ef_construction});"
+        )
+        super().__init__(sql, reverse_sql=f"DROP INDEX {index_name};")
+
+
+class AddEuclideanDistanceHNSWIndex(AddHNSWIndex):
+    """
+    Create an HNSW index for euclidean distance.
+
+    Example usage:
+        AddEuclideanDistanceHNSWIndex('items', 'embedding', m=16, ef_construction=64)
+    """
+
+    opclass = "vector_l2_ops"
+    suffix = "l2_hnsw_idx"
+
+
+class AddInnerProductHNSWIndex(AddHNSWIndex):
+    """
+    Create an HNSW index for inner product.
+
+    Example usage:
+        AddInnerProductHNSWIndex('items', 'embedding', m=16, ef_construction=64)
+    """
+
+    opclass = "vector_ip_ops"
+    suffix = "ip_hnsw_idx"
+
+
+class AddCosineDistanceHNSWIndex(AddHNSWIndex):
+    """
+    Create an HNSW index for cosine distance.
+
+    Example usage:
+        AddCosineDistanceHNSWIndex('items', 'embedding', m=16, ef_construction=64)
+    """
+
+    opclass = "vector_cosine_ops"
+    suffix = "cosine_hnsw_idx"
@@ -1,5 +1,6 @@
-from typing import List
+from typing import Dict, List, Optional
 
+from django.db import connections, transaction
 from django.db.models import QuerySet
 
 from ix.pg_vector.fields import CosineSimilarity, EuclideanDistance, InnerProduct
@@ -9,44 +10,109 @@ from ix.pg_vector.utils import get_embedding
 class PGVectorMixin:
     """QuerySet mixin for pg_vector operations."""
 
+    _search_params: Dict[str, int] = {}
+
+    def search_params(
+        self: QuerySet, probes: Optional[int] = None, ef_search: Optional[int] = None
+    ) -> QuerySet:
+        """
+        Returns a queryset that sets index search parameters for its query.
+
+        Args:
+            probes: lists searched by ivfflat indexes. Higher is slower with better
+                recall. pgvector defaults to 1.
+            ef_search: candidate list size for hnsw indexes. Higher is slower with
+                better recall. pgvector defaults to 40.
+
+        Parameters are set with SET LOCAL semantics in a transaction wrapping the
+        query, so they don't leak to other queries on the connection. They apply
+        when the queryset is evaluated, not to `.iterator()`, `.count()` etc.
+        """
+        params = dict(self._search_params)
+        if probes is not None:
+            params["ivfflat.probes"] = probes
+        if ef_search is not None:
+            params["hnsw.ef_search"] = ef_search
+        clone = self._chain()
+        clone._search_params = params
+        return clone
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._search_params = self._search_params
+        return clone
+
+    def _fetch_all(self):
+        if self._result_cache is not None or not self._search_params:
+            return super()._fetch_all()
+
+        with transaction.atomic(using=self.db):
+            with connections[self.db].cursor() as cursor:
+                for name, value in self._search_params.items():
+                    cursor.execute(
+                        "SELECT set_config(%s, %s, true)", [name, str(value)]
+                    )
+            super()._fetch_all()
+
     def cosine_similarity(
-        self: QuerySet, compare_to: List[float] | str, field_name: str = "embedding"
+        self: QuerySet,
+        compare_to: List[float] | str,
+        field_name: str = "embedding",
+        probes: Optional[int] = None,
+        ef_search: Optional[int] = None,
     ) -> QuerySet:
         """
         Returns a queryset annotated with the cosine similarity between
-        the given embedding and the given field.
+        the given embedding and the given field. `probes` and `ef_search` tune
+        index searches, see `search_params`.
         """
         if isinstance(compare_to, str):
             compare_to = get_embedding(compare_to)
 
-        return self.annotate(
-            similarity=CosineSimilarity(field_name, compare_to)
-        ).order_by("-similarity")
+        return (
+            self.search_params(probes=probes, ef_search=ef_search)
+            .annotate(similarity=CosineSimilarity(field_name, compare_to))
+            .order_by("-similarity")
+        )
 
     def euclidean_distance(
-        self: QuerySet, compare_to: List[float] | str, field_name: str = "embedding"
+        self: QuerySet,
+        compare_to: List[float] | str,
+        field_name: str = "embedding",
+        probes: Optional[int] = None,
+        ef_search: Optional[int] = None,
     ) -> QuerySet:
         """
         Returns a queryset annotated with the euclidean distance between
-        the given embedding and the given field.
+        the given embedding and the given field. `probes` and `ef_search` tune
+        index searches, see `search_params`.
         """
         if isinstance(compare_to, str):
             compare_to = get_embedding(compare_to)
 
-        return self.annotate(
-            distance=EuclideanDistance(field_name, compare_to)
-        ).order_by("distance")
+        return (
+            self.search_params(probes=probes, ef_search=ef_search)
+            .annotate(distance=EuclideanDistance(field_name, compare_to))
+            .order_by("distance")
+        )
 
     def inner_product(
-        self: QuerySet, compare_to: List[float] | str, field_name: str = "embedding"
+        self: QuerySet,
+        compare_to: List[float] | str,
+        field_name: str = "embedding",
+        probes: Optional[int] = None,
+        ef_search: Optional[int] = None,
     ) -> QuerySet:
         """
         Returns a queryset annotated with the inner product between
-        the given embedding and the given field.
+        the given embedding and the given field. `probes` and `ef_search` tune
+        index searches, see `search_params`.
         """
         if isinstance(compare_to, str):
             compare_to = get_embedding(compare_to)
 
-        return self.annotate(product=InnerProduct(field_name, compare_to)).order_by(
-            "-product"
+        return (
+            self.search_params(probes=probes, ef_search=ef_search)
+            .annotate(product=InnerProduct(field_name, compare_to))
+            .order_by("-product")
         )
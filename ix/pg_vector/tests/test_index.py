@@ -0,0 +1,64 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ix.chains.models import NodeType
+from ix.pg_vector.index import (
+    AddCosineDistanceHNSWIndex,
+    AddEuclideanDistanceHNSWIndex,
+    AddInnerProductHNSWIndex,
+)
+
+
+class TestHNSWIndex:
+    def test_sql(self):
+        operation = AddCosineDistanceHNSWIndex(
+            "embeddings", "embedding", m=24, ef_construction=100
+        )
+        assert operation.sql == (
+            "CREATE INDEX embeddings_embedding_cosine_hnsw_idx ON embeddings "
+            "USING hnsw (embedding vector_cosine_ops) "
+            "WITH (m = 24, ef_construction = 100);"
+        )
+        assert operation.reverse_sql == (
+            "DROP INDEX embeddings_embedding_cosine_hnsw_idx;"
+        )
+
+    def test_opclasses(self):
+        assert "vector_l2_ops" in AddEuclideanDistanceHNSWIndex("t", "c").sql
+        assert "vector_ip_ops" in AddInnerProductHNSWIndex("t", "c").sql
+
+    def test_index_name(self):
+        operation = AddInnerProductHNSWIndex("t", "c", index_name="my_idx")
+        assert operation.sql.startswith("CREATE INDEX my_idx ON t USING hnsw")
+
+
+class TestSearchParams:
+    def test_params_are_chained(self):
+        queryset = NodeType.objects.search_params(probes=10)
+        queryset = queryset.filter(name="test").search_params(ef_search=100)
+        assert queryset._search_params == {
+            "ivfflat.probes": 10,
+            "hnsw.ef_search": 100,
+        }
+
+        # original queryset is not modified
+        assert NodeType.objects.all()._search_params == {}
+
+    @pytest.mark.django_db
+    def test_params_are_set(self):
+        with CaptureQueriesContext(connection) as context:
+            list(NodeType.objects.search_params(probes=10, ef_search=100))
+
+        sql = [query["sql"] for query in context.captured_queries]
+        assert any("ivfflat.probes" in query for query in sql)
+        assert any("hnsw.ef_search" in query for query in sql)
+
+    @pytest.mark.django_db
+    def test_no_params(self):
+        with CaptureQueriesContext(connection) as context:
+            list(NodeType.objects.all())
+
+        assert not any(
+            "set_config" in query["sql"] for query in context.captured_queries
+        )
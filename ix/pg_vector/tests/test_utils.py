@@ -0,0 +1,111 @@
+import pytest
+from django.core.cache import caches
+
+from ix.chains.models import NodeType
+from ix.pg_vector import utils
+from ix.pg_vector.utils import (
+    EmbeddingCache,
+    embedding_cache,
+    get_embedding,
+    get_embeddings,
+    reciprocal_rank_fusion,
+)
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+}
+
+
+def fake_embedding(text: str):
+    return [float(len(text))] + [0.5] * 1535
+
+
+@pytest.fixture
+def mock_create_embeddings(mocker, settings):
+    """Mock OpenAI and use a local cache in place of redis"""
+    settings.CACHES = LOCMEM_CACHES
+    settings.EMBEDDING_CACHE_ALIAS = "default"
+    caches["default"].clear()
+    embedding_cache.clear()
+
+    def create_embeddings(texts, model, timeout=None):
+        return [fake_embedding(text) for text in texts]
+
+    yield mocker.patch.object(utils, "create_embeddings", side_effect=create_embeddings)
+    embedding_cache.clear()
+
+
+class TestGetEmbeddings:
+    def test_batches(self, mock_create_embeddings, settings):
+        settings.EMBEDDING_BATCH_SIZE = 2
+        texts = ["a", "bb", "ccc", "a", "dddd", "eeeee"]
+
+        embeddings = get_embeddings(texts)
+
+        assert embeddings == [fake_embedding(text) for text in texts]
+        # duplicates are embedded once
+        assert [call.args[0] for call in mock_create_embeddings.call_args_list] == [
+            ["a", "bb"],
+            ["ccc", "dddd"],
+            ["eeeee"],
+        ]
+
+    def test_cached(self, mock_create_embeddings):
+        assert get_embedding("cached\ntext") == fake_embedding("cached text")
+        assert get_embedding("cached text") == fake_embedding("cached text")
+        assert mock_create_embeddings.call_count == 1
+
+        # shared cache is used when the local cache misses
+        embedding_cache.clear()
+        assert get_embeddings(["cached text", "new"]) == [
+            fake_embedding("cached text"),
+            fake_embedding("new"),
+        ]
+        assert mock_create_embeddings.call_args.args[0] == ["new"]
+
+    def test_model_is_part_of_key(self, mock_create_embeddings):
+        get_embedding("text", model="one")
+        get_embedding("text", model="two")
+        assert mock_create_embeddings.call_count == 2
+
+    def test_cache_errors_are_misses(self, mock_create_embeddings, mocker):
+        backend = mocker.patch.object(EmbeddingCache, "backend")
+        backend.get_many.side_effect = ConnectionError("redis is down")
+        backend.set_many.side_effect = ConnectionError("redis is down")
+
+        assert get_embedding("text") == fake_embedding("text")
+
+
+class TestEmbeddingCache:
+    def test_lru(self, mock_create_embeddings):
+        cache = EmbeddingCache(maxsize=2)
+        cache.set_many("model", {"a": [1.0], "b": [2.0]})
+        cache.get_many("model", ["a"])
+        cache.set_many("model", {"c": [3.0]})
+
+        assert len(cache._local) == 2
+        assert cache.key("model", "a") in cache._local
+        assert cache.key("model", "b") not in cache._local
+
+
+def test_reciprocal_rank_fusion():
+    # "b" ranks well in both lists so it beats "a" which is first in only one
+    assert reciprocal_rank_fusion([["a", "b", "c"], ["d", "b", "e"]])[:1] == ["b"]
+    assert set(reciprocal_rank_fusion([["a"], ["b"], []])) == {"a", "b"}
+    assert reciprocal_rank_fusion([]) == []
+
+
+@pytest.mark.django_db
+class TestUpdateEmbeddings:
+    def test_update_embeddings(self, mock_create_embeddings):
+        NodeType.objects.all().delete()
+        node_type = NodeType.objects.create(
+            name="test", description="test type", class_path="test.Test", type="chain"
+        )
+
+        assert NodeType.objects.update_embeddings() == 1
+        node_type.refresh_from_db()
+        assert list(node_type.embedding) == fake_embedding(node_type.embedding_text)
+
+        # only node types without an embedding are updated
+        assert NodeType.objects.update_embeddings() == 0
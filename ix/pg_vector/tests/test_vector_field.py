@@ -1,9 +1,13 @@
+from array import array
+
 import pytest
 
 from ix.pg_vector.fields import (
     CosineSimilarity,
     EuclideanDistance,
     InnerProduct,
+    parse_vector,
+    to_vector_literal,
 )
 from ix.pg_vector.tests.pg_vector_test.models import Embedding
 
@@ -25,9 +29,22 @@ class TestVectorField:
         """Test that row can be created with vector field."""
         first_embedding = Embedding.objects.get(key="first")
         assert first_embedding.text == "This is the first test."
-        assert isinstance(first_embedding.embedding, list)
-        assert isinstance(first_embedding.embedding[0], float)
-        assert first_embedding.embedding == [1.1, 2.1, 3.1]
+        assert isinstance(first_embedding.embedding, array)
+        assert first_embedding.embedding.typecode == "f"
+        assert list(first_embedding.embedding) == pytest.approx([1.1, 2.1, 3.1])
+
+    def test_save_array(self, embeddings):
+        """Values read from the database can be written back"""
+        first_embedding = Embedding.objects.get(key="first")
+        first_embedding.embedding[0] = 1.5
+        first_embedding.save()
+
+        first_embedding.refresh_from_db()
+        assert list(first_embedding.embedding) == pytest.approx([1.5, 2.1, 3.1])
+
+    def test_null(self, embeddings):
+        first_embedding = Embedding.objects.get(key="first")
+        assert first_embedding.null_embedding is None
 
     def test_cosine_similarity_lookup(self, embeddings):
         # compare first embedding to itself
@@ -65,6 +82,16 @@ class TestVectorField:
         filtered = results.exclude(key="first")
         assert filtered[0].key == "second"
 
+    def test_compare_to_is_a_parameter(self):
+        """vectors are bound as parameters instead of written into the sql"""
+        queryset = Embedding.objects.annotate(
+            distance=CosineSimilarity("embedding", [1.1, 2.1, 3.1])
+        )
+        sql, params = queryset.query.sql_with_params()
+        assert "1.1" not in sql
+        assert "<=> %s::vector" in sql
+        assert params == ("[1.1,2.1,3.1]",)
+
     @pytest.mark.skip()
     def test_create_with_embedding(self, embeddings):
         Embedding.objects.create_with_embedding(
@@ -73,3 +100,18 @@ class TestVectorField:
         fourth_embedding = Embedding.objects.get(key="fourth")
         assert fourth_embedding.text == "This is the fourth test."
         assert len(fourth_embedding.embedding) == 512
+
+
+class TestVectorFormat:
+    def test_to_vector_literal(self):
+        assert to_vector_literal([1, 2.5, -3e-05]) == "[1.0,2.5,-3e-05]"
+        assert to_vector_literal(array("f", [0.5, 1.0])) == "[0.5,1.0]"
+        assert to_vector_literal(None) is None
+
+    def test_parse_vector(self):
+        assert parse_vector("[0.5,1,-2]") == array("f", [0.5, 1.0, -2.0])
+        assert parse_vector("[]") == array("f")
+
+    def test_round_trip(self):
+        value = array("f", [0.1, 0.2, 0.3])
+        assert parse_vector(to_vector_literal(value)) == value
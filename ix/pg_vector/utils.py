@@ -1,6 +1,166 @@
-from langchain.chat_models import openai
+import hashlib
+import logging
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, Optional
 
+from django.conf import settings
+from django.core.cache import caches
 
-def get_embedding(text, model="text-embedding-ada-002"):
-    text = text.replace("\n", " ")
-    return openai.Embedding.create(input=[text], model=model)["data"][0]["embedding"]
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "text-embedding-ada-002"
+
+
+def normalize_text(text: str) -> str:
+    return text.replace("\n", " ")
+
+
+class EmbeddingCache:
+    """
+    Embeddings keyed by a hash of the model and text.
+
+    An in-process LRU sits in front of a django cache (redis via CACHES). Vectors
+    are stored as 32 bit float arrays, the same precision pgvector stores, which
+    is a fraction of the size of a pickled list. Errors reading or writing the
+    django cache are logged and treated as misses; the cache is an optimization.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._local: OrderedDict[str, array] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        digest = hashlib.sha256(f"{model}\0{text}".encode()).hexdigest()
+        return f"embedding:{digest}"
+
+    @property
+    def backend(self):
+        return caches[settings.EMBEDDING_CACHE_ALIAS]
+
+    def _get_local(self, key: str) -> Optional[array]:
+        with self._lock:
+            value = self._local.get(key)
+            if value is not None:
+                self._local.move_to_end(key)
+            return value
+
+    def _set_local(self, key: str, value: array) -> None:
+        with self._lock:
+            self._local[key] = value
+            self._local.move_to_end(key)
+            while len(self._local) > self.maxsize:
+                self._local.popitem(last=False)
+
+    def get_many(self, model: str, texts: Iterable[str]) -> Dict[str, array]:
+        """Returns cached embeddings for the texts that are cached"""
+        found = {}
+        missing = {}
+        for text in texts:
+            key = self.key(model, text)
+            value = self._get_local(key)
+            if value is not None:
+                found[text] = value
+            else:
+                missing[key] = text
+
+        if missing:
+            try:
+                cached = self.backend.get_many(list(missing))
+            except Exception as e:
+                logger.warning(f"Failed to read embedding cache: {e}")
+                cached = {}
+            for key, data in cached.items():
+                value = array("f")
+                value.frombytes(data)
+                self._set_local(key, value)
+                found[missing[key]] = value
+
+        return found
+
+    def set_many(self, model: str, embeddings: Dict[str, List[float]]) -> None:
+        values = {
+            self.key(model, text): array("f", embedding)
+            for text, embedding in embeddings.items()
+        }
+        for key, value in values.items():
+            self._set_local(key, value)
+        try:
+            self.backend.set_many(
+                {key: value.tobytes() for key, value in values.items()},
+                timeout=settings.EMBEDDING_CACHE_TTL,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to write embedding cache: {e}")
+
+    def clear(self) -> None:
+        """Clear the in-process cache. The django cache is left as is."""
+        with self._lock:
+            self._local.clear()
+
+
+embedding_cache = EmbeddingCache()
+
+
+def create_embeddings(
+    texts: List[str], model: str, timeout: float = None
+) -> List[List[float]]:
+    """Request embeddings from OpenAI in a single call.
+
+    Requests with a timeout aren't retried so callers can fall back quickly.
+    """
+    # imported here to avoid importing openai when models load
+    import openai
+
+    client = openai.OpenAI()
+    if timeout is not None:
+        client = client.with_options(timeout=timeout, max_retries=0)
+    response = client.embeddings.create(input=texts, model=model)
+    return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+
+def get_embeddings(
+    texts: List[str], model: str = DEFAULT_EMBEDDING_MODEL, timeout: float = None
+) -> List[List[float]]:
+    """
+    Embed a list of texts. Cached embeddings are reused, duplicates are embedded
+    once, and the rest are requested in chunks of EMBEDDING_BATCH_SIZE.
+    """
+    texts = [normalize_text(text) for text in texts]
+    embeddings = {
+        text: value.tolist()
+        for text, value in embedding_cache.get_many(model, set(texts)).items()
+    }
+
+    missing = list(dict.fromkeys(text for text in texts if text not in embeddings))
+    batch_size = settings.EMBEDDING_BATCH_SIZE
+    for i in range(0, len(missing), batch_size):
+        chunk = missing[i : i + batch_size]
+        created = dict(zip(chunk, create_embeddings(chunk, model, timeout=timeout)))
+        embedding_cache.set_many(model, created)
+        embeddings.update(created)
+
+    return [embeddings[text] for text in texts]
+
+
+def get_embedding(text, model=DEFAULT_EMBEDDING_MODEL, timeout: float = None):
+    return get_embeddings([text], model=model, timeout=timeout)[0]
+
+
+def reciprocal_rank_fusion(
+    rankings: List[List[Hashable]], k: int = 60
+) -> List[Hashable]:
+    """
+    Merge ranked lists of ids with reciprocal rank fusion. Each id scores the sum
+    of 1 / (k + rank) over the lists it appears in. `k` dampens the weight of top
+    ranks so that an id ranked well by several lists beats one ranked first by a
+    single list.
+    """
+    scores = {}
+    for ranking in rankings:
+        for rank, id in enumerate(ranking, start=1):
+            scores[id] = scores.get(id, 0) + 1 / (k + rank)
+    return sorted(scores, key=scores.get, reverse=True)
@@ -1,3 +1,9 @@
+import asyncio
+import logging
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import (
     Sequence,
     Optional,
@@ -7,7 +13,9 @@ from typing import (
     AsyncIterator,
     Iterator,
     Callable,
+    List,
 )
+from django.conf import settings
 from pydantic.v1 import BaseConfig
 
 from langchain_community.document_loaders.base import BaseLoader
@@ -19,26 +27,194 @@ from langchain_core.runnables.utils import Input
 from ix.utils.pydantic import model_from_signature
 from ix.utils.importlib import import_class
 
+logger = logging.getLogger(__name__)
+
+_loader_executor: Optional[ThreadPoolExecutor] = None
+_loader_executor_lock = threading.Lock()
+
+# returned by next() when a loader's iterator is exhausted
+_DONE = object()
+
+
+def get_loader_executor() -> ThreadPoolExecutor:
+    """Thread pool that runs blocking document loaders for async callers.
+
+    The pool is bounded by DOCUMENT_LOADER_WORKERS so slow loaders can't consume
+    the default executor that the rest of the event loop relies on.
+    """
+    global _loader_executor
+    with _loader_executor_lock:
+        if _loader_executor is None:
+            _loader_executor = ThreadPoolExecutor(
+                max_workers=settings.DOCUMENT_LOADER_WORKERS,
+                thread_name_prefix="ix-document-loader",
+            )
+        return _loader_executor
+
+
+def has_lazy_load(loader: BaseLoader) -> bool:
+    return type(loader).lazy_load is not BaseLoader.lazy_load
+
+
+def has_alazy_load(loader: BaseLoader) -> bool:
+    alazy_load = getattr(type(loader), "alazy_load", None)
+    return alazy_load is not None and alazy_load is not getattr(
+        BaseLoader, "alazy_load", None
+    )
+
+
+async def aiter_documents(loader: BaseLoader) -> AsyncIterator[Document]:
+    """Iterate documents from a loader without blocking the event loop.
+
+    Loaders that implement `alazy_load()` are iterated natively. Otherwise the
+    loader's `lazy_load()` iterator is advanced one document at a time in the
+    loader thread pool, so documents are yielded as they arrive. Loaders that
+    only implement `load()` are loaded in the pool and then yielded.
+    """
+    if has_alazy_load(loader):
+        async for doc in loader.alazy_load():
+            yield doc
+        return
+
+    loop = asyncio.get_running_loop()
+    executor = get_loader_executor()
+    if not has_lazy_load(loader):
+        for doc in await loop.run_in_executor(executor, loader.load):
+            yield doc
+        return
+
+    iterator = await loop.run_in_executor(executor, lambda: iter(loader.lazy_load()))
+    while True:
+        doc = await loop.run_in_executor(executor, next, iterator, _DONE)
+        if doc is _DONE:
+            break
+        yield doc
+
+
+_transform_executor: Optional[ProcessPoolExecutor] = None
+_transform_executor_lock = threading.Lock()
+
+
+def get_transform_executor() -> ProcessPoolExecutor:
+    """Process pool used to transform documents in parallel.
+
+    Workers are spawned rather than forked so they don't inherit the server's
+    threads and connections.
+    """
+    global _transform_executor
+    with _transform_executor_lock:
+        if _transform_executor is None:
+            _transform_executor = ProcessPoolExecutor(
+                max_workers=settings.DOCUMENT_TRANSFORM_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _transform_executor
+
+
+def shutdown_transform_executor() -> None:
+    """Stop the transform process pool. It's recreated on next use."""
+    global _transform_executor
+    with _transform_executor_lock:
+        if _transform_executor is not None:
+            _transform_executor.shutdown()
+            _transform_executor = None
+
+
+def transform_chunk(
+    transformer: BaseDocumentTransformer, documents: List[Document]
+) -> List[Document]:
+    """Transform a chunk of documents in a worker process."""
+    return list(transformer.transform_documents(documents))
+
 
 class RunTransformer(RunnableSerializable[Sequence[Document], Sequence[Document]]):
     """Runnable shim to treat a DocumentTransformer as a Runnable.
 
     BaseDocumentTransformer are not runnables so they need a shim to fit
     into a flow.
+
+    Transforms are run in parallel when `parallel` is set. Documents are sharded
+    into chunks of `parallel_chunk_size` and transformed by a pool of
+    DOCUMENT_TRANSFORM_WORKERS processes. Output order matches input order, and
+    `stream` yields each transformed chunk as soon as it and the chunks before it
+    are done. Transformers that can't be pickled are run serially. Only enable
+    it for transformers that handle each document independently, e.g. text
+    splitters; transformers that compare documents only see their own chunk.
     """
 
     transformer: BaseDocumentTransformer
+    parallel: bool = False
+    parallel_chunk_size: Optional[int] = None
 
     class Config(BaseConfig):
         arbitrary_types_allowed = True
 
+    def get_chunks(self, input: Sequence[Document]) -> List[List[Document]]:
+        """Shard input for the process pool. Returns [] to run serially."""
+        if not self.parallel or settings.DOCUMENT_TRANSFORM_WORKERS < 2:
+            return []
+        documents = list(input)
+        size = self.parallel_chunk_size or settings.DOCUMENT_TRANSFORM_CHUNK_SIZE
+        if len(documents) <= size:
+            return []
+        try:
+            pickle.dumps(self.transformer)
+        except Exception as e:
+            logger.warning(
+                f"{type(self.transformer).__name__} can't be sent to a worker "
+                f"process, transforming documents serially: {e}"
+            )
+            return []
+        return [documents[i : i + size] for i in range(0, len(documents), size)]
+
+    def _iter_chunks(self, input: Sequence[Document]) -> Iterator[List[Document]]:
+        chunks = self.get_chunks(input)
+        if not chunks:
+            yield list(self.transformer.transform_documents(input))
+            return
+
+        executor = get_transform_executor()
+        futures = [
+            executor.submit(transform_chunk, self.transformer, chunk)
+            for chunk in chunks
+        ]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    async def _aiter_chunks(
+        self, input: Sequence[Document]
+    ) -> AsyncIterator[List[Document]]:
+        chunks = self.get_chunks(input)
+        if not chunks:
+            yield list(await self.transformer.atransform_documents(input))
+            return
+
+        loop = asyncio.get_running_loop()
+        executor = get_transform_executor()
+        futures = [
+            loop.run_in_executor(executor, transform_chunk, self.transformer, chunk)
+            for chunk in chunks
+        ]
+        try:
+            for future in futures:
+                yield await future
+        finally:
+            for future in futures:
+                future.cancel()
+
     def invoke(
         self,
         input: Sequence[Document],
         config: Optional[RunnableConfig] = None,
         **kwargs: Any,
     ) -> Sequence[Document]:
-        return self.transformer.transform_documents(input)
+        if not self.parallel:
+            return self.transformer.transform_documents(input)
+        return [doc for chunk in self._iter_chunks(input) for doc in chunk]
 
     async def ainvoke(
         self,
@@ -46,15 +222,45 @@ class RunTransformer(RunnableSerializable[Sequence[Document], Sequence[Document]
         config: Optional[RunnableConfig] = None,
         **kwargs: Any,
     ) -> Sequence[Document]:
-        resp = await self.transformer.atransform_documents(input)
-        return resp
+        if not self.parallel:
+            return await self.transformer.atransform_documents(input)
+        return [doc async for chunk in self._aiter_chunks(input) for doc in chunk]
+
+    def stream(
+        self,
+        input: Sequence[Document],
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Optional[Any],
+    ) -> Iterator[Sequence[Document]]:
+        """Stream transformed documents, one chunk at a time."""
+        yield from self._iter_chunks(input)
+
+    async def astream(
+        self,
+        input: Sequence[Document],
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Optional[Any],
+    ) -> AsyncIterator[Sequence[Document]]:
+        """Stream transformed documents, one chunk at a time."""
+        async for chunk in self._aiter_chunks(input):
+            yield chunk
 
     @classmethod
     def from_config(cls, class_path: str, config: Dict[str, Any]) -> "RunTransformer":
-        """Initialize a RunTransformer from a config dict."""
+        """Initialize a RunTransformer from a config dict.
+
+        `parallel` and `parallel_chunk_size` configure the shim, everything else is
+        passed to the transformer.
+        """
+        config = config.copy()
+        options = {
+            key: config.pop(key)
+            for key in ("parallel", "parallel_chunk_size")
+            if key in config
+        }
         initializer = import_class(class_path)
         transformer = initializer(**config)
-        return cls(transformer=transformer)
+        return cls(transformer=transformer, **options)
 
 
 class RunLoader(RunnableSerializable[Input, Sequence[Document]]):
@@ -114,8 +320,7 @@ class RunLoader(RunnableSerializable[Input, Sequence[Document]]):
         config: Optional[RunnableConfig] = None,
         **kwargs: Any,
     ) -> Sequence[Document]:
-        loader = self.get_loader(input)
-        return loader.load()
+        return [doc async for doc in self.astream(input, config, **kwargs)]
 
     def stream(
         self,
@@ -131,7 +336,7 @@ class RunLoader(RunnableSerializable[Input, Sequence[Document]]):
         loader = self.get_loader(input)
 
         # attempt to use lazy load iterator
-        if loader.lazy_load != BaseLoader.lazy_load:
+        if has_lazy_load(loader):
             for doc in loader.lazy_load():
                 yield doc
         else:
@@ -147,19 +352,17 @@ class RunLoader(RunnableSerializable[Input, Sequence[Document]]):
     ) -> AsyncIterator[Document]:
         """Stream documents from the loader.
 
-        Documents will be streamed from the loader if it supports `BaseLoader.lazy_load()`.
-        Otherwise, documents will be loaded synchronously and then yielded to emulate a stream.
+        Documents are streamed with `alazy_load()` if the loader supports it.
+        Otherwise, the blocking loader runs in the loader thread pool and documents
+        are yielded as they are loaded. See `aiter_documents`.
         """
-        loader = self.get_loader(input)
-
-        # attempt to use lazy load iterator
-        if loader.lazy_load != BaseLoader.lazy_load:
-            for doc in loader.lazy_load():
-                yield doc
-        else:
-            # fall back to loading all at once
-            for doc in loader.load():
-                yield doc
+        # initializing a loader may also do IO
+        loop = asyncio.get_running_loop()
+        loader = await loop.run_in_executor(
+            get_loader_executor(), self.get_loader, input
+        )
+        async for doc in aiter_documents(loader):
+            yield doc
 
     @classmethod
     def from_config(cls, class_path: str, config: Dict[str, Any]) -> "RunLoader":
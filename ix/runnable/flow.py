@@ -31,6 +31,21 @@ def load_chain_id(
     return chain_obj.load_chain(context=context)
 
 
+async def aload_chain_id(
+    chain_id: UUID, context: IxContext, **kwargs
+) -> Runnable[Input, Output]:
+    """Async variant of `load_chain_id`"""
+    chain_obj = await ChainModel.objects.aget(id=chain_id)
+    return await chain_obj.aload_chain(context=context)
+
+
+async def ainit_chain_reference(
+    class_path: str, config: Dict[str, Any]
+) -> Runnable[Input, Output]:
+    """Async node initializer for the Reference component"""
+    return await aload_chain_id(**config)
+
+
 class RunnableEachSequential(RunnableSerializable[List[Input], List[Output]]):
     """Runs a flow for each item in a list sequentially."""
 
@@ -48,7 +63,7 @@ class RunnableEachSequential(RunnableSerializable[List[Input], List[Output]]):
             result = self.workflow.invoke(
                 item, patch_config(config, callbacks=run_manager.get_child()), **kwargs
             )
-            result.append(result)
+            results.append(result)
         return results
 
     def invoke(
@@ -68,7 +83,7 @@ class RunnableEachSequential(RunnableSerializable[List[Input], List[Output]]):
             result = await self.workflow.ainvoke(
                 item, patch_config(config, callbacks=run_manager.get_child()), **kwargs
             )
-            result.append(result)
+            results.append(result)
         return results
 
     async def ainvoke(
@@ -77,6 +92,67 @@ class RunnableEachSequential(RunnableSerializable[List[Input], List[Output]]):
         return await self._acall_with_config(self._ainvoke, input, config, **kwargs)
 
 
+class RunnableEachConcurrent(RunnableSerializable[List[Input], List[Output]]):
+    """Runs a flow for each item in a list concurrently.
+
+    Items are run with `batch` / `abatch`, up to `max_concurrency` at a time, and
+    outputs are returned in input order. With `return_exceptions` an item that
+    fails returns its exception in place of an output instead of failing the
+    other items.
+    """
+
+    workflow: RunnableSerializable[Input, Output]
+    max_concurrency: Optional[int] = None
+    return_exceptions: bool = False
+
+    def _item_config(
+        self, config: RunnableConfig, run_manager: CallbackManagerForChainRun
+    ) -> RunnableConfig:
+        return patch_config(
+            config,
+            callbacks=run_manager.get_child(),
+            max_concurrency=self.max_concurrency,
+        )
+
+    def _invoke(
+        self,
+        inputs: List[Input],
+        run_manager: CallbackManagerForChainRun,
+        config: RunnableConfig,
+        **kwargs: Any,
+    ) -> List[Output]:
+        return self.workflow.batch(
+            inputs,
+            self._item_config(config, run_manager),
+            return_exceptions=self.return_exceptions,
+            **kwargs,
+        )
+
+    def invoke(
+        self, input: List[Input], config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> List[Output]:
+        return self._call_with_config(self._invoke, input, config, **kwargs)
+
+    async def _ainvoke(
+        self,
+        inputs: List[Input],
+        run_manager: AsyncCallbackManagerForChainRun,
+        config: RunnableConfig,
+        **kwargs: Any,
+    ) -> List[Output]:
+        return await self.workflow.abatch(
+            inputs,
+            self._item_config(config, run_manager),
+            return_exceptions=self.return_exceptions,
+            **kwargs,
+        )
+
+    async def ainvoke(
+        self, input: List[Input], config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> List[Output]:
+        return await self._acall_with_config(self._ainvoke, input, config, **kwargs)
+
+
 class MergeList(RunnableSerializable[Input, Output | List[Output]]):
     """Merge values into a list."""
 
@@ -1,9 +1,13 @@
-from typing import Callable
+import asyncio
+import threading
+import time
+from typing import AsyncIterator, Callable, Iterator, List
 
 import pytest
 from langchain.text_splitter import (
     CharacterTextSplitter,
 )
+from langchain_community.document_loaders.base import BaseLoader
 from langchain_community.document_loaders.generic import GenericLoader
 from langchain_core.documents import Document
 from pydantic import BaseModel
@@ -20,7 +24,7 @@ from ix.chains.tests.fake import (
     afake_root_edge,
 )
 from ix.chains.tests.test_config_loader import unpack_chain_flow
-from ix.runnable.documents import RunTransformer, RunLoader
+from ix.runnable.documents import RunTransformer, RunLoader, aiter_documents
 
 
 @pytest.mark.django_db
@@ -72,6 +76,104 @@ class TestRunTransformer:
             Document(page_content="document", metadata={"test": 123}),
         ]
 
+    async def test_parallel_config(self, aix_context: IxContext):
+        """parallel options configured in the editor reach the shim"""
+        chain = await afake_chain()
+        root = await afake_root(chain=chain)
+        node = await afake_chain_node(
+            chain=chain,
+            config={
+                "class_path": CHARACTER_SPLITTER_CLASS_PATH,
+                "config": dict(chunk_size=1, parallel=True, parallel_chunk_size=10),
+            },
+        )
+        await afake_root_edge(chain=chain, root=root, target=node)
+
+        runnable = await chain.aload_chain(context=aix_context)
+        component = unpack_chain_flow(runnable)
+        assert component.parallel is True
+        assert component.parallel_chunk_size == 10
+        assert component.transformer._chunk_size == 1
+
+
+def numbered_documents(count: int) -> List[Document]:
+    return [
+        Document(page_content=f"a{i} b{i}", metadata={"index": i}) for i in range(count)
+    ]
+
+
+class UnpicklableSplitter(CharacterTextSplitter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.callback = lambda: None
+
+
+class TestParallelRunTransformer:
+    @pytest.fixture(autouse=True)
+    def workers(self, settings):
+        settings.DOCUMENT_TRANSFORM_WORKERS = 2
+        settings.DOCUMENT_TRANSFORM_CHUNK_SIZE = 3
+
+    def splitter(self, **kwargs):
+        return CharacterTextSplitter(
+            separator=" ", chunk_size=1, chunk_overlap=0, **kwargs
+        )
+
+    def test_invoke(self):
+        documents = numbered_documents(10)
+        expected = self.splitter().transform_documents(documents)
+        runnable = RunTransformer(transformer=self.splitter(), parallel=True)
+        assert runnable.get_chunks(documents) != []
+        assert runnable.invoke(documents) == expected
+
+    def test_stream(self):
+        documents = numbered_documents(10)
+        runnable = RunTransformer(
+            transformer=self.splitter(), parallel=True, parallel_chunk_size=4
+        )
+        chunks = list(runnable.stream(documents))
+        assert [len(chunk) for chunk in chunks] == [8, 8, 4]
+        assert [doc for chunk in chunks for doc in chunk] == (
+            self.splitter().transform_documents(documents)
+        )
+
+    async def test_ainvoke(self):
+        documents = numbered_documents(10)
+        expected = self.splitter().transform_documents(documents)
+        runnable = RunTransformer(transformer=self.splitter(), parallel=True)
+        assert await runnable.ainvoke(documents) == expected
+
+        chunks = [chunk async for chunk in runnable.astream(documents)]
+        assert len(chunks) == 4
+        assert [doc for chunk in chunks for doc in chunk] == expected
+
+    def test_serial(self):
+        documents = numbered_documents(10)
+        runnable = RunTransformer(transformer=self.splitter())
+        assert runnable.get_chunks(documents) == []
+        assert list(runnable.stream(documents)) == [
+            self.splitter().transform_documents(documents)
+        ]
+
+    def test_small_input_is_serial(self):
+        runnable = RunTransformer(transformer=self.splitter(), parallel=True)
+        assert runnable.get_chunks(numbered_documents(3)) == []
+
+    def test_unpicklable_is_serial(self):
+        documents = numbered_documents(10)
+        transformer = UnpicklableSplitter(separator=" ", chunk_size=1, chunk_overlap=0)
+        runnable = RunTransformer(transformer=transformer, parallel=True)
+        assert runnable.get_chunks(documents) == []
+        assert len(runnable.invoke(documents)) == 20
+
+    def test_from_config(self):
+        runnable = RunTransformer.from_config(
+            "langchain.text_splitter.CharacterTextSplitter",
+            {"chunk_size": 1, "chunk_overlap": 0, "parallel": True},
+        )
+        assert runnable.parallel is True
+        assert runnable.transformer._chunk_size == 1
+
 
 @pytest.mark.django_db
 class TestRunLoader:
@@ -170,3 +272,86 @@ class TestRunLoader:
         assert len(result) == 1
         assert isinstance(result[0], Document)
         assert result[0].page_content == "this is a test document"
+
+
+class SlowLoader(BaseLoader):
+    """Blocking loader that sleeps before each document."""
+
+    def __init__(self, count: int = 3, delay: float = 0.05):
+        self.count = count
+        self.delay = delay
+        self.threads = set()
+
+    def lazy_load(self) -> Iterator[Document]:
+        for i in range(self.count):
+            self.threads.add(threading.get_ident())
+            time.sleep(self.delay)
+            yield Document(page_content=f"doc-{i}")
+
+    def load(self) -> List[Document]:
+        return list(self.lazy_load())
+
+
+class EagerLoader(BaseLoader):
+    """Loader that only implements load()"""
+
+    def load(self) -> List[Document]:
+        return [Document(page_content="doc-0"), Document(page_content="doc-1")]
+
+
+class AsyncLoader(BaseLoader):
+    """Loader with a native async iterator"""
+
+    def load(self) -> List[Document]:
+        raise AssertionError("load() should not be called")
+
+    async def alazy_load(self) -> AsyncIterator[Document]:
+        for i in range(2):
+            await asyncio.sleep(0)
+            yield Document(page_content=f"async-{i}")
+
+
+class TestAiterDocuments:
+    async def test_blocking_loader_runs_in_thread(self):
+        loader = SlowLoader(count=4, delay=0.05)
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(tick())
+        try:
+            documents = [doc async for doc in aiter_documents(loader)]
+        finally:
+            ticker.cancel()
+
+        assert [doc.page_content for doc in documents] == [f"doc-{i}" for i in range(4)]
+        assert threading.get_ident() not in loader.threads
+        # the event loop kept running while documents loaded
+        assert ticks >= 10
+
+    async def test_yields_as_loaded(self):
+        loader = SlowLoader(count=3, delay=0.05)
+        documents = aiter_documents(loader)
+        first = await documents.__anext__()
+        assert first.page_content == "doc-0"
+        await documents.aclose()
+
+    async def test_load_only(self):
+        documents = [doc async for doc in aiter_documents(EagerLoader())]
+        assert [doc.page_content for doc in documents] == ["doc-0", "doc-1"]
+
+    async def test_native_async(self):
+        documents = [doc async for doc in aiter_documents(AsyncLoader())]
+        assert [doc.page_content for doc in documents] == ["async-0", "async-1"]
+
+    async def test_run_loader(self):
+        runnable = RunLoader(initializer=SlowLoader, config={"count": 2})
+        result = await runnable.ainvoke(input={"delay": 0})
+        assert [doc.page_content for doc in result] == ["doc-0", "doc-1"]
+
+        streamed = [doc async for doc in runnable.astream(input={})]
+        assert [doc.page_content for doc in streamed] == ["doc-0", "doc-1"]
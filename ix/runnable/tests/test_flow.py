@@ -1,8 +1,15 @@
+from typing import Any, Optional
 from uuid import uuid4
 
 import pytest
-from langchain_core.runnables import RunnableParallel
+from langchain.schema.runnable.base import RunnableEach
+from langchain_core.runnables import (
+    RunnableConfig,
+    RunnableParallel,
+    RunnableSerializable,
+)
 
+from ix.chains.components.lcel import init_each
 from ix.chains.fixture_src.flow import CHAIN_REF_CLASS_PATH
 from ix.chains.loaders.context import IxContext
 from ix.chains.models import Chain
@@ -12,8 +19,10 @@ from ix.chains.tests.fake import (
     afake_chain_node,
     afake_chain_edge,
 )
+from ix.chains.tests.mock_concurrency import MockDelay
 from ix.chains.tests.mock_runnable import MockRunnable
 from ix.conftest import aload_fixture
+from ix.runnable.flow import RunnableEachConcurrent, RunnableEachSequential
 from ix.runnable.ix import IxNode
 
 
@@ -118,3 +127,77 @@ class TestRunnableReference:
         ix_node = runnable.steps[1]
         assert isinstance(ix_node, IxNode)
         assert ix_node.node_id == chain_ref.id
+
+
+class Square(RunnableSerializable[int, int], MockDelay):
+    """Squares input after a delay. Fails on negative input."""
+
+    def invoke(
+        self, input: int, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> int:
+        if input < 0:
+            raise ValueError(f"negative input: {input}")
+        self._wait()
+        return input * input
+
+    async def ainvoke(
+        self, input: int, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> int:
+        if input < 0:
+            raise ValueError(f"negative input: {input}")
+        await self._await(input)
+        return input * input
+
+
+class TestRunnableEachSequential:
+    def test_invoke(self):
+        workflow = Square()
+        runnable = RunnableEachSequential(workflow=workflow)
+        assert runnable.invoke([1, 2, 3]) == [1, 4, 9]
+        assert workflow.max_running == 1
+
+    async def test_ainvoke(self):
+        workflow = Square()
+        runnable = RunnableEachSequential(workflow=workflow)
+        assert await runnable.ainvoke([1, 2, 3]) == [1, 4, 9]
+        assert workflow.max_running == 1
+
+
+class TestRunnableEachConcurrent:
+    def test_invoke(self):
+        workflow = Square()
+        runnable = RunnableEachConcurrent(workflow=workflow, max_concurrency=2)
+        assert runnable.invoke([1, 2, 3, 4]) == [1, 4, 9, 16]
+        assert workflow.max_running == 2
+
+    async def test_ainvoke(self):
+        workflow = Square()
+        runnable = RunnableEachConcurrent(workflow=workflow, max_concurrency=3)
+        assert await runnable.ainvoke([0, 1, 2, 3, 4]) == [0, 1, 4, 9, 16]
+        assert workflow.max_running == 3
+
+    async def test_error_isolation(self):
+        runnable = RunnableEachConcurrent(workflow=Square(), return_exceptions=True)
+        result = await runnable.ainvoke([1, -1, 3])
+        assert result[0] == 1
+        assert isinstance(result[1], ValueError)
+        assert result[2] == 9
+
+    async def test_raise_exceptions(self):
+        runnable = RunnableEachConcurrent(workflow=Square())
+        with pytest.raises(ValueError):
+            await runnable.ainvoke([1, -1, 3])
+
+
+class TestInitEach:
+    def test_default(self):
+        assert isinstance(init_each(Square()), RunnableEach)
+
+    def test_sequential(self):
+        assert isinstance(init_each(Square(), sequential=True), RunnableEachSequential)
+
+    def test_concurrent(self):
+        runnable = init_each(Square(), max_concurrency=2, return_exceptions=True)
+        assert isinstance(runnable, RunnableEachConcurrent)
+        assert runnable.max_concurrency == 2
+        assert runnable.return_exceptions is True
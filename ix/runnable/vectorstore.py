@@ -55,7 +55,7 @@ class AddDocuments(RunnableSerializable[Sequence[Document], List[str]]):
         config: Optional[RunnableConfig] = None,
         **kwargs: Any,
     ) -> List[str]:
-        return self.vector_store.add_documents(documents=input)
+        return self.vectorstore.add_documents(documents=input)
 
     async def ainvoke(
         self,
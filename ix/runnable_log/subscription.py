@@ -1,4 +1,5 @@
 import logging
+from typing import List
 from uuid import UUID
 
 import graphene
@@ -29,11 +30,32 @@ class ExecutionType(graphene.ObjectType):
     message = graphene.String(required=False)
 
 
+class ExecutionBatchType(graphene.ObjectType):
+    """A batch of execution events buffered by the runnable log writer."""
+
+    executions = graphene.List(ExecutionType)
+
+
 class RunEvent(graphene.Union):
     """Any event during a run from start to finish."""
 
     class Meta:
-        types = (ExecutionType, RunStartType)
+        types = (ExecutionType, ExecutionBatchType, RunStartType)
+
+
+def to_execution_type(datum: dict) -> ExecutionType:
+    return ExecutionType(
+        id=datum.get("id"),
+        user_id=datum.get("user_id"),
+        task_id=datum.get("task_id"),
+        node_id=datum.get("node_id"),
+        started_at=datum.get("started_at"),
+        finished_at=datum.get("finished_at", None),
+        completed=datum.get("completed"),
+        inputs=datum.get("inputs", None),
+        outputs=datum.get("outputs", None),
+        message=datum.get("message", None),
+    )
 
 
 class RunEventSubscription(Subscription):
@@ -59,17 +81,10 @@ class RunEventSubscription(Subscription):
         if event_type == "run":
             event = RunStartType(**datum)
         elif event_type == "execution":
-            event = ExecutionType(
-                id=datum.get("id"),
-                user_id=datum.get("user_id"),
-                task_id=datum.get("task_id"),
-                node_id=datum.get("node_id"),
-                started_at=datum.get("started_at"),
-                finished_at=datum.get("finished_at", None),
-                completed=datum.get("completed"),
-                inputs=datum.get("inputs", None),
-                outputs=datum.get("outputs", None),
-                message=datum.get("message", None),
+            event = to_execution_type(datum)
+        elif event_type == "executions":
+            event = ExecutionBatchType(
+                executions=[to_execution_type(execution) for execution in datum]
             )
         else:
             raise ValueError(f"Unknown event type: {event_type}")
@@ -101,3 +116,11 @@ class RunEventSubscription(Subscription):
             group=f"run_event_{chain_id}",
             payload={"event_type": "execution", "event": event},
         )
+
+    @classmethod
+    async def aon_executions(cls, chain_id: str | UUID, events: List[dict]):
+        """Called to send a batch of execution events."""
+        await cls.broadcast_async(
+            group=f"run_event_{chain_id}",
+            payload={"event_type": "executions", "event": events},
+        )
@@ -0,0 +1,105 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from ix.runnable_log.writer import RunnableLogWriter, get_log_writer
+
+
+def fake_record(**kwargs) -> dict:
+    return {"id": str(uuid4()), "node_id": str(uuid4()), "completed": True, **kwargs}
+
+
+@pytest.fixture
+def mock_bulk_create(mocker):
+    return mocker.patch(
+        "ix.runnable_log.writer.RunnableExecution.objects.abulk_create",
+        new_callable=mocker.AsyncMock,
+    )
+
+
+@pytest.fixture
+def mock_broadcast(mocker):
+    return mocker.patch(
+        "ix.runnable_log.writer.RunEventSubscription.aon_executions",
+        new_callable=mocker.AsyncMock,
+    )
+
+
+class TestRunnableLogWriter:
+    async def test_flush_on_interval(self, mock_bulk_create, mock_broadcast):
+        writer = RunnableLogWriter(batch_size=10, flush_interval=0.01)
+        await writer.alog("chain", fake_record())
+        await writer.alog("chain", fake_record())
+
+        # nothing written inline
+        assert writer.pending == 2
+        mock_bulk_create.assert_not_called()
+
+        await asyncio.sleep(0.05)
+        assert writer.pending == 0
+        mock_bulk_create.assert_awaited_once()
+        assert len(mock_bulk_create.call_args.args[0]) == 2
+        mock_broadcast.assert_awaited_once()
+
+    async def test_flush_on_batch_size(self, mock_bulk_create, mock_broadcast):
+        writer = RunnableLogWriter(batch_size=2, flush_interval=60)
+        await writer.alog("chain", fake_record())
+        await writer.alog("chain", fake_record())
+        await asyncio.sleep(0)
+
+        mock_bulk_create.assert_awaited_once()
+        assert writer.pending == 0
+
+    async def test_coalesce_events(self, mock_bulk_create, mock_broadcast):
+        """start and end of an execution are sent as a single event per batch"""
+        writer = RunnableLogWriter(batch_size=10, flush_interval=60)
+        record = fake_record(completed=False)
+        writer.on_start("chain_a", record)
+        await writer.alog("chain_a", {**record, "completed": True})
+        await writer.alog("chain_b", fake_record())
+        await writer.aflush()
+
+        assert mock_broadcast.await_count == 2
+        events = {
+            call.kwargs["chain_id"]: call.kwargs["events"]
+            for call in mock_broadcast.call_args_list
+        }
+        assert events["chain_a"] == [{**record, "completed": True}]
+        assert len(events["chain_b"]) == 1
+
+    async def test_backpressure(self, mock_bulk_create, mock_broadcast):
+        writer = RunnableLogWriter(batch_size=2, flush_interval=60, max_pending=2)
+
+        # block the size triggered flush so records accumulate
+        await writer._lock.acquire()
+        await writer.alog("chain", fake_record())
+        await writer.alog("chain", fake_record())
+        blocked = asyncio.create_task(writer.alog("chain", fake_record()))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        assert writer.pending == 2
+
+        writer._lock.release()
+        await blocked
+        await writer.aflush()
+        assert sum(len(c.args[0]) for c in mock_bulk_create.call_args_list) == 3
+
+    async def test_unbuffered(self, mocker, mock_bulk_create, mock_broadcast):
+        mock_create = mocker.patch(
+            "ix.runnable_log.writer.RunnableExecution.objects.acreate",
+            new_callable=mocker.AsyncMock,
+        )
+        mock_send = mocker.patch(
+            "ix.runnable_log.writer.RunEventSubscription.aon_execution",
+            new_callable=mocker.AsyncMock,
+        )
+        writer = RunnableLogWriter(batch_size=1)
+        await writer.alog("chain", fake_record())
+
+        mock_create.assert_awaited_once()
+        mock_send.assert_awaited_once()
+        assert writer.pending == 0
+
+    async def test_get_log_writer(self):
+        assert get_log_writer() is get_log_writer()
@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import weakref
+from typing import Dict, List
+from uuid import UUID
+
+from django.conf import settings
+
+from ix.runnable_log.models import RunnableExecution
+from ix.runnable_log.subscription import RunEventSubscription
+
+logger = logging.getLogger(__name__)
+
+
+class RunnableLogWriter:
+    """
+    Write-behind sink for RunnableExecution records and their run events.
+
+    Records are buffered and written with `abulk_create` when `batch_size`
+    records are pending or `flush_interval` seconds after the first pending
+    record, whichever comes first. Run events are coalesced per chain into a
+    single batched frame. When a start and end event for the same execution
+    are in the same batch only the latest state is sent.
+
+    Memory is bounded by `max_pending`. Once reached, callers wait for the
+    buffer to be flushed before their record is accepted.
+
+    A `batch_size` of 1 disables buffering. Records are written and events
+    broadcast inline as they are logged.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = None,
+        flush_interval: float = None,
+        max_pending: int = None,
+    ):
+        self.batch_size = batch_size or settings.RUNNABLE_LOG_BATCH_SIZE
+        self.flush_interval = (
+            settings.RUNNABLE_LOG_FLUSH_INTERVAL
+            if flush_interval is None
+            else flush_interval
+        )
+        self.max_pending = max(
+            max_pending or settings.RUNNABLE_LOG_MAX_PENDING, self.batch_size
+        )
+        self._records: List[dict] = []
+        self._events: Dict[str, Dict[str, dict]] = {}
+        self._timer: asyncio.Task | None = None
+        self._flush_task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def buffered(self) -> bool:
+        return self.batch_size > 1
+
+    @property
+    def pending(self) -> int:
+        return len(self._records)
+
+    def on_start(self, chain_id: str | UUID, event: dict) -> None:
+        """Queue the start event for an execution."""
+        if not self.buffered:
+            RunEventSubscription.on_execution(chain_id=chain_id, event=event)
+            return
+        self._queue_event(chain_id, event)
+        self._schedule()
+
+    async def alog(self, chain_id: str | UUID, record: dict) -> None:
+        """Queue a finished execution to be written and broadcast."""
+        if not self.buffered:
+            await asyncio.gather(
+                RunEventSubscription.aon_execution(chain_id=chain_id, event=record),
+                RunnableExecution.objects.acreate(**record),
+            )
+            return
+
+        # backpressure: wait for the buffer to drain before accepting more
+        while self.pending >= self.max_pending:
+            await self.aflush()
+
+        self._records.append(dict(record))
+        self._queue_event(chain_id, record)
+
+        if self.pending >= self.batch_size:
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self.aflush())
+        else:
+            self._schedule()
+
+    async def aflush(self) -> None:
+        """Write all pending records and broadcast pending events."""
+        async with self._lock:
+            records, self._records = self._records, []
+            events, self._events = self._events, {}
+            if self._timer and self._timer is not asyncio.current_task():
+                self._timer.cancel()
+            self._timer = None
+
+            if records:
+                try:
+                    await RunnableExecution.objects.abulk_create(
+                        [RunnableExecution(**record) for record in records]
+                    )
+                except Exception:
+                    logger.exception(
+                        f"Failed to write {len(records)} runnable executions"
+                    )
+
+            for chain_id, chain_events in events.items():
+                try:
+                    await RunEventSubscription.aon_executions(
+                        chain_id=chain_id, events=list(chain_events.values())
+                    )
+                except Exception:
+                    logger.exception(f"Failed to broadcast run events chain={chain_id}")
+
+    def _queue_event(self, chain_id: str | UUID, event: dict) -> None:
+        # events are keyed by execution id so the latest state replaces the start
+        self._events.setdefault(str(chain_id), {})[event["id"]] = dict(event)
+
+    def _schedule(self) -> None:
+        if self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.aflush()
+
+
+_writers: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_log_writer() -> RunnableLogWriter:
+    """Return the log writer for the running event loop.
+
+    Buffers and flush timers are bound to an event loop, so each loop has its
+    own writer.
+    """
+    loop = asyncio.get_running_loop()
+    writer = _writers.get(loop)
+    if writer is None:
+        writer = RunnableLogWriter()
+        _writers[loop] = writer
+    return writer
+
+
+async def aflush_log() -> None:
+    """Flush pending execution logs for the running event loop."""
+    writer = _writers.get(asyncio.get_running_loop())
+    if writer is not None:
+        await writer.aflush()
@@ -94,10 +94,14 @@ class ChatMessageTokenSubscription(channels_graphql_ws.Subscription):
 
     This subscription streams messages tokens as they are generated by the
     agent. The stream only includes the message_id and text.
+
+    Consecutive tokens are coalesced into a single frame. `index` and `end_index`
+    are the range of token indexes the text covers.
     """
 
     msg_id = graphene.UUID()
     index = graphene.Int()
+    end_index = graphene.Int()
     text = graphene.String()
 
     class Arguments:
@@ -120,11 +124,19 @@ class ChatMessageTokenSubscription(channels_graphql_ws.Subscription):
         return ChatMessageTokenSubscription(
             msg_id=payload.get("msg_id"),
             index=payload.get("index"),
+            end_index=payload.get("end_index", payload.get("index")),
             text=payload.get("text"),
         )
 
     @classmethod
-    async def on_new_token(cls, task: Task, message_id: UUID, index: int, text: str):
+    async def on_new_token(
+        cls,
+        task: Task,
+        message_id: UUID,
+        index: int,
+        text: str,
+        end_index: int = None,
+    ):
         """
         Generic handler for new message tokens.
         """
@@ -134,6 +146,7 @@ class ChatMessageTokenSubscription(channels_graphql_ws.Subscription):
             payload={
                 "msg_id": str(message_id),
                 "index": index,
+                "end_index": end_index if end_index is not None else index,
                 "text": text,
             },
         )
@@ -0,0 +1,75 @@
+import copy
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from django.conf import settings
+
+
+SecretKey = Tuple[str, str]
+
+
+class SecretCache:
+    """
+    Per-process cache of resolved secret values keyed by (user_id, secret_id).
+
+    Entries expire after `ttl` seconds. Writes and deletes through `Secret`
+    invalidate the entry in the current process, other processes see the
+    change when their entry expires. Values are copied in and out so callers
+    can't modify the cached value.
+    """
+
+    def __init__(self, ttl: float = None):
+        self._ttl = ttl
+        self._values: Dict[SecretKey, Tuple[float, dict]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> float:
+        if self._ttl is not None:
+            return self._ttl
+        return settings.SECRET_CACHE_TTL
+
+    @staticmethod
+    def key(user_id: UUID | str, secret_id: UUID | str) -> SecretKey:
+        return str(user_id), str(secret_id)
+
+    def get(self, user_id: UUID | str, secret_id: UUID | str) -> Optional[dict]:
+        key = self.key(user_id, secret_id)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._values[key]
+                return None
+            return copy.deepcopy(value)
+
+    def set(self, user_id: UUID | str, secret_id: UUID | str, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        key = self.key(user_id, secret_id)
+        with self._lock:
+            self._values[key] = (time.monotonic() + self.ttl, copy.deepcopy(value))
+
+    def invalidate(self, user_id: UUID | str, secret_id: UUID | str) -> None:
+        with self._lock:
+            self._values.pop(self.key(user_id, secret_id), None)
+
+    def invalidate_user(self, user_id: UUID | str) -> None:
+        user_id = str(user_id)
+        with self._lock:
+            for key in [key for key in self._values if key[0] == user_id]:
+                del self._values[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+secret_cache = SecretCache()
@@ -1,6 +1,10 @@
+import asyncio
 import uuid
+from typing import Dict, Iterable
+
 from django.db import models
 from ix.ix_users.models import OwnedModel
+from ix.secrets.cache import secret_cache
 
 
 class SecretType(OwnedModel):
@@ -34,6 +38,9 @@ class Secret(OwnedModel):
     enables users to configure up tp 2,147,483,647 accounts for the same service.
 
     Note: when resolving fetch directly from vault using the path and index
+
+    Resolved values are cached per user for SECRET_CACHE_TTL seconds. Writes
+    and deletes invalidate the cached value.
     """
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -58,25 +65,55 @@ class Secret(OwnedModel):
         return SecretValueClient()
 
     def read(self):
-        return self.client.read(self.path)
+        value = secret_cache.get(self.user_id, self.id)
+        if value is None:
+            value = self.client.read(self.path)
+            secret_cache.set(self.user_id, self.id, value)
+        return value
 
     def write(self, value):
-        return self.client.write(self.path, value)
+        try:
+            return self.client.write(self.path, value)
+        finally:
+            secret_cache.invalidate(self.user_id, self.id)
 
     def delete_secure(self):
-        return self.client.delete(self.path)
+        try:
+            return self.client.delete(self.path)
+        finally:
+            secret_cache.invalidate(self.user_id, self.id)
 
     async def aread(self):
-        client = await self.get_client()
-        return await client.aread(self.path)
+        value = secret_cache.get(self.user_id, self.id)
+        if value is None:
+            client = await self.get_client()
+            value = await client.aread(self.path)
+            secret_cache.set(self.user_id, self.id, value)
+        return value
 
     async def awrite(self, value):
         client = await self.get_client()
-        return await client.awrite(self.path, value)
+        try:
+            return await client.awrite(self.path, value)
+        finally:
+            secret_cache.invalidate(self.user_id, self.id)
 
     async def adelete_secure(self):
         client = await self.get_client()
-        return await client.adelete(self.path)
+        try:
+            return await client.adelete(self.path)
+        finally:
+            secret_cache.invalidate(self.user_id, self.id)
+
+    @classmethod
+    async def aread_many(cls, secrets: Iterable["Secret"]) -> Dict[str, dict]:
+        """Read the values of multiple secrets concurrently.
+
+        Returns a dict of secret_id -> value.
+        """
+        secrets = list(secrets)
+        values = await asyncio.gather(*[secret.aread() for secret in secrets])
+        return {str(secret.id): value for secret, value in zip(secrets, values)}
 
 
 class MissingSecret(Exception):
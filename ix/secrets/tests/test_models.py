@@ -0,0 +1,103 @@
+import pytest
+
+from ix.secrets.cache import SecretCache, secret_cache
+from ix.secrets.models import Secret, SecretValueClient
+from ix.secrets.tests.fake import afake_secret, fake_secret
+
+USER_ID = "00000000-0000-0000-0000-000000000001"
+SECRET_ID = "00000000-0000-0000-0000-000000000002"
+
+
+class TestSecretCache:
+    def test_get_set(self):
+        cache = SecretCache(ttl=60)
+        assert cache.get(USER_ID, SECRET_ID) is None
+
+        cache.set(USER_ID, SECRET_ID, {"api_key": "1234"})
+        assert cache.get(USER_ID, SECRET_ID) == {"api_key": "1234"}
+
+        # values are keyed per user
+        assert cache.get(SECRET_ID, SECRET_ID) is None
+
+    def test_value_is_copied(self):
+        cache = SecretCache(ttl=60)
+        value = {"api_key": "1234"}
+        cache.set(USER_ID, SECRET_ID, value)
+        value["api_key"] = "changed"
+        cache.get(USER_ID, SECRET_ID)["api_key"] = "changed"
+
+        assert cache.get(USER_ID, SECRET_ID) == {"api_key": "1234"}
+
+    def test_expires(self, mocker):
+        cache = SecretCache(ttl=60)
+        mock_time = mocker.patch("ix.secrets.cache.time.monotonic", return_value=0)
+        cache.set(USER_ID, SECRET_ID, {"api_key": "1234"})
+
+        mock_time.return_value = 59
+        assert cache.get(USER_ID, SECRET_ID) == {"api_key": "1234"}
+        mock_time.return_value = 60
+        assert cache.get(USER_ID, SECRET_ID) is None
+        assert len(cache) == 0
+
+    def test_disabled(self):
+        cache = SecretCache(ttl=0)
+        cache.set(USER_ID, SECRET_ID, {"api_key": "1234"})
+        assert cache.get(USER_ID, SECRET_ID) is None
+
+    def test_invalidate(self):
+        cache = SecretCache(ttl=60)
+        cache.set(USER_ID, SECRET_ID, {"api_key": "1234"})
+        cache.set(USER_ID, USER_ID, {"api_key": "5678"})
+
+        cache.invalidate(USER_ID, SECRET_ID)
+        assert cache.get(USER_ID, SECRET_ID) is None
+        assert cache.get(USER_ID, USER_ID) == {"api_key": "5678"}
+
+        cache.invalidate_user(USER_ID)
+        assert len(cache) == 0
+
+
+@pytest.mark.django_db
+class TestSecret:
+    def test_read_is_cached(self, mocker):
+        secret = fake_secret()
+        secret.write({"api_key": "1234"})
+        spy_read = mocker.spy(SecretValueClient, "read")
+
+        assert secret.read() == {"api_key": "1234"}
+        assert secret.read() == {"api_key": "1234"}
+        assert spy_read.call_count == 1
+
+    def test_write_invalidates(self):
+        secret = fake_secret()
+        secret.write({"api_key": "1234"})
+        assert secret.read() == {"api_key": "1234"}
+
+        secret.write({"api_key": "5678"})
+        assert secret_cache.get(secret.user_id, secret.id) is None
+        assert secret.read() == {"api_key": "5678"}
+
+    def test_delete_invalidates(self):
+        secret = fake_secret()
+        secret.write({"api_key": "1234"})
+        secret.read()
+
+        secret.delete_secure()
+        assert secret_cache.get(secret.user_id, secret.id) is None
+
+    async def test_aread_many(self, mocker):
+        secret1 = await afake_secret()
+        secret2 = await afake_secret()
+        await secret1.awrite({"api_key": "1234"})
+        await secret2.awrite({"api_key": "5678"})
+
+        values = await Secret.aread_many([secret1, secret2])
+        assert values == {
+            str(secret1.id): {"api_key": "1234"},
+            str(secret2.id): {"api_key": "5678"},
+        }
+
+        # second read is served from the cache
+        spy_aread = mocker.spy(SecretValueClient, "aread")
+        assert await Secret.aread_many([secret1, secret2]) == values
+        assert spy_aread.call_count == 0
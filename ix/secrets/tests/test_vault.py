@@ -1,4 +1,5 @@
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 import hvac
 
 import pytest
@@ -240,3 +241,29 @@ class TestVaultIntegration:
         client_with_token.write(path, DATA)
         read_data_with_token = client_with_token.read(path)
         assert DATA == read_data_with_token
+
+
+class TestClientPool:
+    @pytest.fixture(autouse=True)
+    def clear(self):
+        vault.clear_clients()
+        yield
+        vault.clear_clients()
+
+    def test_reused(self):
+        assert get_client(TOKEN) is get_client(TOKEN)
+        assert get_client(TOKEN) is not get_client("other_token")
+
+    def test_per_thread(self):
+        client = get_client(TOKEN)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(get_client, TOKEN).result()
+        assert other is not client
+
+    def test_evicted(self, settings, mocker):
+        settings.VAULT_CLIENT_POOL_SIZE = 1
+        client = get_client(TOKEN)
+        close = mocker.spy(client.adapter, "close")
+        get_client("other_token")
+        close.assert_called_once()
+        assert get_client(TOKEN) is not client
@@ -1,6 +1,10 @@
+import hashlib
+import threading
+from collections import OrderedDict
 from functools import cached_property
 
 import hvac
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from hvac import Client
 from hvac.exceptions import InvalidPath
@@ -18,14 +22,51 @@ def get_token_store_client():
     return get_client(settings.VAULT_TOKEN__USER_TOKENS)
 
 
+# requests.Session isn't thread safe, so clients are pooled per thread. Each
+# thread keeps its most recently used VAULT_CLIENT_POOL_SIZE clients, keyed by a
+# hash of the token so tokens aren't held as keys.
+_local = threading.local()
+
+
+def _get_pool() -> "OrderedDict[str, Client]":
+    pool = getattr(_local, "clients", None)
+    if pool is None:
+        pool = _local.clients = OrderedDict()
+    return pool
+
+
 def get_client(token):
-    """Get vault client for a user, using their token"""
-    return Client(
+    """Get vault client for a user, using their token
+
+    Clients are pooled per thread and token so the underlying HTTP session and
+    its TLS connections are reused between requests.
+    """
+    pool = _get_pool()
+    key = hashlib.sha256(token.encode()).hexdigest()
+    client = pool.get(key)
+    if client is not None:
+        pool.move_to_end(key)
+        return client
+
+    client = Client(
         url=settings.VAULT_SERVER,
         token=token,
         cert=(settings.VAULT_CLIENT_CRT, settings.VAULT_CLIENT_KEY),
         verify=settings.VAULT_TLS_VERIFY,
     )
+    pool[key] = client
+    while len(pool) > settings.VAULT_CLIENT_POOL_SIZE:
+        _, evicted = pool.popitem(last=False)
+        evicted.adapter.close()
+    return client
+
+
+def clear_clients():
+    """Close and remove the current thread's pooled clients"""
+    pool = _get_pool()
+    for client in pool.values():
+        client.adapter.close()
+    pool.clear()
 
 
 def create_user_policy(user_id):
@@ -178,3 +219,14 @@ class UserVaultClient:
         self.client.secrets.kv.v2.destroy_secret_versions(
             path=path, versions=version_ids
         )
+
+    # hvac is synchronous. Requests run in worker threads so multiple reads can
+    # be in flight at once.
+    async def awrite(self, path, data):
+        return await sync_to_async(self.write, thread_sensitive=False)(path, data)
+
+    async def aread(self, path):
+        return await sync_to_async(self.read, thread_sensitive=False)(path)
+
+    async def adelete(self, path):
+        return await sync_to_async(self.delete, thread_sensitive=False)(path)
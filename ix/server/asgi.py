@@ -24,6 +24,7 @@ import django
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ix.server.settings")
 django.setup()
 from ix.server.fast_api import app as fast_api_app  # noqa: E402
+from ix.chains.loaders.warmup import warmup_from_settings  # noqa: E402
 
 
 class GraphqlWsConsumer(channels_graphql_ws.GraphqlWsConsumer):
@@ -56,6 +57,7 @@ graphql_application = URLRouter(
 )
 
 django_application = get_asgi_application()
+warmup_from_settings()
 http_application = Starlette(
     routes=[
         Mount("/api", fast_api_app),  # FastAPI handles requests at /fastapi
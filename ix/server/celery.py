@@ -1,5 +1,6 @@
 import os
 from celery import Celery
+from celery.signals import worker_process_init
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ix.server.settings")
@@ -27,3 +28,11 @@ app.conf.update(
 @app.task(bind=True)
 def debug_task(self):
     print(f"Celery debug task: {self.request!r}")
+
+
+@worker_process_init.connect
+def warmup_worker(**kwargs):
+    """Import node types in each worker process before it receives tasks"""
+    from ix.chains.loaders.warmup import warmup_from_settings
+
+    warmup_from_settings()
@@ -16,6 +16,7 @@ from ix.api.secrets.endpoints import router as secrets_router
 from ix.api.workspace.endpoints import router as workspace_router
 
 from ix.runnable_log.endpoints import router as runnable_log_router
+from ix.utils.graphene.pagination import InvalidCursor
 
 app = FastAPI(
     title="IX agent editor API",
@@ -62,6 +63,11 @@ def custom_openapi():
 app.openapi = custom_openapi
 
 
+@app.exception_handler(InvalidCursor)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+
 @app.exception_handler(Exception)
 async def exception_handler(request: Request, exc: Exception):
     error_message = str(exc)
@@ -259,7 +259,117 @@ VAULT_CLIENT_CRT = "/var/vault/certs/client.crt"
 VAULT_CLIENT_KEY = "/var/vault/certs/client.key"
 VAULT_TLS_VERIFY = False
 VAULT_BASE_PATH = os.environ.get("VAULT_BASE_PATH", "ix")
+# vault clients kept per thread, each holds an HTTP session
+VAULT_CLIENT_POOL_SIZE = int(os.environ.get("VAULT_CLIENT_POOL_SIZE", 16))
+
+# Seconds resolved secret values are cached per process. Set to 0 to disable.
+SECRET_CACHE_TTL = float(os.environ.get("SECRET_CACHE_TTL", 300))
 
 WORKSPACE_DIR = os.environ.get("WORKSPACE_DIR", "/var/app/workdir/")
 
 RUNNABLE_LOG_ENABLED = os.environ.get("RUNNABLE_LOG_ENABLED", "1") in TRUTHY_VALUES
+
+# Max number of compiled chain flows cached per process. Set to 0 to disable.
+CHAIN_FLOW_CACHE_SIZE = int(os.environ.get("CHAIN_FLOW_CACHE_SIZE", 128))
+
+# Runnable executions are buffered and written in batches. Flushed when the batch
+# is full or after the flush interval (seconds). Set batch size to 1 to write inline.
+RUNNABLE_LOG_BATCH_SIZE = int(os.environ.get("RUNNABLE_LOG_BATCH_SIZE", 50))
+RUNNABLE_LOG_FLUSH_INTERVAL = float(os.environ.get("RUNNABLE_LOG_FLUSH_INTERVAL", 0.5))
+RUNNABLE_LOG_MAX_PENDING = int(os.environ.get("RUNNABLE_LOG_MAX_PENDING", 1000))
+
+# Streamed tokens are coalesced into a single frame per message. A frame is sent
+# when this many tokens are pending or after the interval (seconds).
+CHAT_STREAM_COALESCE_TOKENS = int(os.environ.get("CHAT_STREAM_COALESCE_TOKENS", 16))
+CHAT_STREAM_COALESCE_INTERVAL = float(
+    os.environ.get("CHAT_STREAM_COALESCE_INTERVAL", 0.05)
+)
+
+# Threads used to initialize independent subgraphs (maps, branches) when loading a
+# chain synchronously. Off (0) by default. Worker threads use their own database
+# connections, so they can't see rows the caller hasn't committed.
+CHAIN_LOAD_WORKERS = int(os.environ.get("CHAIN_LOAD_WORKERS", 0))
+
+# Comma separated class paths of sinks that receive per-node load profiles, e.g.
+# ix.chains.loaders.profiling.LoggingLoadProfileSink. Profiling is off when empty.
+CHAIN_LOAD_PROFILE_SINKS = [
+    path for path in os.environ.get("CHAIN_LOAD_PROFILE_SINKS", "").split(",") if path
+]
+
+# Import every NodeType class when a server or worker process starts so the first
+# chat doesn't pay for importing langchain. One of: background, sync, off.
+NODE_TYPE_IMPORT_WARMUP = os.environ.get("NODE_TYPE_IMPORT_WARMUP", "background")
+
+# Embeddings are cached by a hash of model and text in this cache, with an
+# in-process LRU in front of it. Uncached texts are embedded in batches.
+EMBEDDING_CACHE_ALIAS = os.environ.get("EMBEDDING_CACHE_ALIAS", "default")
+EMBEDDING_CACHE_TTL = int(os.environ.get("EMBEDDING_CACHE_TTL", 60 * 60 * 24 * 30))
+EMBEDDING_BATCH_SIZE = int(os.environ.get("EMBEDDING_BATCH_SIZE", 100))
+
+# Number of results from each of full text and vector search combined by hybrid
+# component search.
+NODE_TYPE_SEARCH_CANDIDATES = int(os.environ.get("NODE_TYPE_SEARCH_CANDIDATES", 100))
+
+# Seconds hybrid component search waits to embed the search text before falling
+# back to full text search. The request isn't retried.
+NODE_TYPE_SEARCH_EMBEDDING_TIMEOUT = float(
+    os.environ.get("NODE_TYPE_SEARCH_EMBEDDING_TIMEOUT", 2)
+)
+
+# Vectorstores stream documents from their loader and ingest them in batches of
+# this many documents, with up to INGEST_CONCURRENCY batches written at once.
+# Progress is saved in the embedding cache so an interrupted ingest resumes where
+# it stopped. Set the batch size to 0 to load and ingest all documents at once.
+VECTORSTORE_INGEST_BATCH_SIZE = int(
+    os.environ.get("VECTORSTORE_INGEST_BATCH_SIZE", 500)
+)
+VECTORSTORE_INGEST_CONCURRENCY = int(
+    os.environ.get("VECTORSTORE_INGEST_CONCURRENCY", 2)
+)
+VECTORSTORE_INGEST_PROGRESS_TTL = int(
+    os.environ.get("VECTORSTORE_INGEST_PROGRESS_TTL", 60 * 60 * 24)
+)
+
+# Threads used to run blocking document loaders for async flows.
+DOCUMENT_LOADER_WORKERS = int(os.environ.get("DOCUMENT_LOADER_WORKERS", 4))
+
+# Processes used by document transformers that have `parallel` set. Documents are
+# sent to workers in chunks of DOCUMENT_TRANSFORM_CHUNK_SIZE.
+DOCUMENT_TRANSFORM_WORKERS = int(
+    os.environ.get("DOCUMENT_TRANSFORM_WORKERS", os.cpu_count() or 1)
+)
+DOCUMENT_TRANSFORM_CHUNK_SIZE = int(
+    os.environ.get("DOCUMENT_TRANSFORM_CHUNK_SIZE", 100)
+)
+
+# Message history windows are kept per task in this cache and updated with only
+# the messages written since the last read. Set the alias to "" to keep windows
+# in an in-process LRU instead. Windows are cut to the newest messages that fit
+# MESSAGE_HISTORY_TOKEN_BUDGET. Set the budget to 0 to keep all messages. Token
+# counts are saved with each message, counted with the MESSAGE_HISTORY_TOKEN_MODEL
+# tokenizer.
+MESSAGE_HISTORY_CACHE_ALIAS = os.environ.get("MESSAGE_HISTORY_CACHE_ALIAS", "default")
+MESSAGE_HISTORY_CACHE_TTL = int(
+    os.environ.get("MESSAGE_HISTORY_CACHE_TTL", 60 * 60 * 24)
+)
+MESSAGE_HISTORY_TOKEN_BUDGET = int(os.environ.get("MESSAGE_HISTORY_TOKEN_BUDGET", 8000))
+MESSAGE_HISTORY_TOKEN_MODEL = os.environ.get(
+    "MESSAGE_HISTORY_TOKEN_MODEL", "gpt-3.5-turbo-0301"
+)
+
+# Seconds formatted artifacts are cached per chat by ArtifactMemory. Saving an
+# artifact invalidates its chat's entries. Set to 0 to disable.
+ARTIFACT_MEMORY_CACHE_TTL = float(os.environ.get("ARTIFACT_MEMORY_CACHE_TTL", 30))
+
+# Artifact files are uploaded and downloaded in chunks of these sizes (bytes).
+# When ARTIFACT_ACCEL_REDIRECT_PREFIX is set, downloads of files in WORKSPACE_DIR
+# are handed to nginx with X-Accel-Redirect to this internal location, so nginx
+# sends them with sendfile and handles range requests. nginx.conf serves
+# WORKSPACE_DIR at /workdir/ for this.
+ARTIFACT_UPLOAD_CHUNK_SIZE = int(
+    os.environ.get("ARTIFACT_UPLOAD_CHUNK_SIZE", 1024 * 1024)
+)
+ARTIFACT_DOWNLOAD_CHUNK_SIZE = int(
+    os.environ.get("ARTIFACT_DOWNLOAD_CHUNK_SIZE", 256 * 1024)
+)
+ARTIFACT_ACCEL_REDIRECT_PREFIX = os.environ.get("ARTIFACT_ACCEL_REDIRECT_PREFIX", "")
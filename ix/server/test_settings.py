@@ -20,3 +20,12 @@ INSTALLED_APPS += [  # noqa:F405
 
 
 VAULT_BASE_PATH = "test"
+
+# write runnable log inline so records are available when tests complete
+RUNNABLE_LOG_BATCH_SIZE = 1
+
+# node types are created by each test
+NODE_TYPE_IMPORT_WARMUP = "off"
+
+# message history windows are kept in process, tests don't have redis
+MESSAGE_HISTORY_CACHE_ALIAS = ""
@@ -6,8 +6,12 @@ class TaskAppConfig(AppConfig):
 
     def ready(self):
         from django.db.models.signals import post_save
+        from ix.memory.cache import invalidate_artifact_memory
         from ix.schema.subscriptions import ChatArtifactSubscription
         from ix.task_log.models import Artifact
 
         # attach signal handler to report new artifacts to subscribed chat clients
         post_save.connect(ChatArtifactSubscription.new_artifact, sender=Artifact)
+
+        # drop cached artifact memory of the artifact's chat
+        post_save.connect(invalidate_artifact_memory, sender=Artifact)
@@ -0,0 +1,292 @@
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Union
+from uuid import UUID
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Q
+
+from ix.task_log.models import TaskLogMessage
+from ix.utils.count_tokens import count_message_tokens
+from ix.utils.graphene.pagination import keyset_filter
+
+logger = logging.getLogger(__name__)
+
+# Messages useful for humans and debugging, but aren't included in the prompt context
+EXCLUDED_MSG_TYPES = {
+    "AUTH_REQUEST",
+    "AUTHORIZE",
+    "AUTONOMOUS",
+    "FEEDBACK_REQUEST",
+    "THOUGHT",
+    "SYSTEM",
+}
+
+HISTORY_ORDERING = ("created_at", "id")
+
+TokenCounter = Callable[[Dict[str, Any]], int]
+
+
+def count_history_message_tokens(message: Dict[str, Any]) -> int:
+    """Token count of a message formatted with `TaskLogMessage.as_message`"""
+    return count_message_tokens([message], settings.MESSAGE_HISTORY_TOKEN_MODEL)[0]
+
+
+@dataclass
+class HistoryWindow:
+    """
+    The most recent context messages of a task and its subtasks, oldest first,
+    formatted with `TaskLogMessage.as_message`. `tokens` and `types` hold the
+    token count and content type of each message.
+
+    `last_created_at` and `last_id` are the position of the last message read,
+    excluded types included, so updates only read messages after it.
+    """
+
+    messages: List[Dict[str, Any]] = field(default_factory=list)
+    tokens: List[int] = field(default_factory=list)
+    types: List[str] = field(default_factory=list)
+    last_created_at: Optional[datetime] = None
+    last_id: Optional[UUID] = None
+
+    # latest AUTONOMOUS toggle, None until one is read
+    autonomous: Optional[bool] = None
+
+    @property
+    def total_tokens(self) -> int:
+        return sum(self.tokens)
+
+    def copy(self) -> "HistoryWindow":
+        return replace(
+            self,
+            messages=list(self.messages),
+            tokens=list(self.tokens),
+            types=list(self.types),
+        )
+
+    def append(self, message: Dict[str, Any], token_count: int, type: str) -> None:
+        self.messages.append(message)
+        self.tokens.append(token_count)
+        self.types.append(type)
+
+    def evict(self, token_budget: int) -> int:
+        """
+        Drop the oldest messages until the window fits the budget. The newest
+        message is always kept. Returns the number of messages dropped.
+        """
+        if not token_budget:
+            return 0
+        total = self.total_tokens
+        dropped = 0
+        while total > token_budget and len(self.messages) - dropped > 1:
+            total -= self.tokens[dropped]
+            dropped += 1
+        if dropped:
+            del self.messages[:dropped]
+            del self.tokens[:dropped]
+            del self.types[:dropped]
+        return dropped
+
+
+class MessageHistoryCache:
+    """
+    Windowed message history per task, maintained incrementally. A task's window
+    includes the messages of its subtasks, so a chat's window includes the
+    replies written by each run's subtask.
+
+    A task's window is first loaded from its newest messages back until the token
+    budget is full. Each update then reads only the messages written after the
+    window's last position, ordered by (created_at, id), appends them
+    and evicts the oldest messages beyond the token budget. Token counts are read
+    from `TaskLogMessage.token_count`, so messages aren't encoded again; messages
+    saved without a count are counted with `token_counter`.
+
+    Windows are stored in the django cache named by MESSAGE_HISTORY_CACHE_ALIAS so
+    they're shared by workers, or in an in-process LRU when the alias is empty.
+    Errors reading or writing the django cache are logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        token_counter: TokenCounter = count_history_message_tokens,
+    ):
+        self.maxsize = maxsize
+        self.token_counter = token_counter
+        self._local: OrderedDict[str, HistoryWindow] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(task_id: Union[str, UUID]) -> str:
+        return f"message_history:{task_id}"
+
+    @property
+    def backend(self):
+        alias = settings.MESSAGE_HISTORY_CACHE_ALIAS
+        return caches[alias] if alias else None
+
+    def get(self, task_id: Union[str, UUID]) -> Optional[HistoryWindow]:
+        """Returns the cached window for a task without reading new messages"""
+        key = self.key(task_id)
+        backend = self.backend
+        if backend is None:
+            with self._lock:
+                window = self._local.get(key)
+                if window is None:
+                    return None
+                self._local.move_to_end(key)
+                return window.copy()
+
+        try:
+            return backend.get(key)
+        except Exception as e:
+            logger.warning(f"Failed to read message history cache: {e}")
+            return None
+
+    def set(self, task_id: Union[str, UUID], window: HistoryWindow) -> None:
+        key = self.key(task_id)
+        backend = self.backend
+        if backend is None:
+            with self._lock:
+                self._local[key] = window.copy()
+                self._local.move_to_end(key)
+                while len(self._local) > self.maxsize:
+                    self._local.popitem(last=False)
+            return
+
+        try:
+            backend.set(key, window, timeout=settings.MESSAGE_HISTORY_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Failed to write message history cache: {e}")
+
+    def invalidate(self, task_id: Union[str, UUID]) -> None:
+        """Drop a task's window, e.g. after its messages are deleted"""
+        key = self.key(task_id)
+        backend = self.backend
+        if backend is None:
+            with self._lock:
+                self._local.pop(key, None)
+            return
+
+        try:
+            backend.delete(key)
+        except Exception as e:
+            logger.warning(f"Failed to clear message history cache: {e}")
+
+    async def ainvalidate(self, task_id: Union[str, UUID]) -> None:
+        await sync_to_async(self.invalidate)(task_id)
+
+    def clear(self) -> None:
+        """Clear the in-process cache. The django cache is left as is."""
+        with self._lock:
+            self._local.clear()
+
+    def get_token_count(
+        self, message: TaskLogMessage, formatted: Dict[str, Any]
+    ) -> int:
+        """Token count saved with the message, or counted if it wasn't saved"""
+        if message.token_count is not None:
+            return message.token_count
+        return self.token_counter(formatted)
+
+    def query(self, task_id: Union[str, UUID]):
+        """Messages of the task and its subtasks, as the chat lists them"""
+        return TaskLogMessage.objects.filter(
+            Q(task_id=task_id) | Q(task__root_id=task_id)
+        )
+
+    def load(self, task_id: Union[str, UUID]) -> HistoryWindow:
+        """
+        Build a window from the newest messages back, stopping once the token
+        budget is full so older messages aren't read.
+        """
+        token_budget = settings.MESSAGE_HISTORY_TOKEN_BUDGET
+        window = HistoryWindow()
+        messages = []
+        tokens = []
+        types = []
+        total = 0
+        newest = self.query(task_id).order_by("-created_at", "-id")
+        for message in newest.iterator(chunk_size=100):
+            if window.last_created_at is None:
+                window.last_created_at = message.created_at
+                window.last_id = message.id
+            content_type = message.content["type"]
+            if content_type in EXCLUDED_MSG_TYPES:
+                continue
+            formatted = message.as_message()
+            token_count = self.get_token_count(message, formatted)
+            if token_budget and messages and total + token_count > token_budget:
+                break
+            messages.append(formatted)
+            tokens.append(token_count)
+            types.append(content_type)
+            total += token_count
+        window.messages = messages[::-1]
+        window.tokens = tokens[::-1]
+        window.types = types[::-1]
+
+        toggle = (
+            self.query(task_id)
+            .filter(content__type="AUTONOMOUS")
+            .order_by("-created_at", "-id")
+            .first()
+        )
+        if toggle is not None:
+            window.autonomous = bool(toggle.content["enabled"])
+
+        logger.debug(
+            f"Loaded message history task_id={task_id} window={len(window.messages)} "
+            f"tokens={window.total_tokens}"
+        )
+        return window
+
+    def update(self, task_id: Union[str, UUID]) -> HistoryWindow:
+        """Append messages written since the last update and return the window"""
+        window = self.get(task_id)
+        if window is None:
+            window = self.load(task_id)
+            self.set(task_id, window)
+            return window
+
+        query = self.query(task_id).order_by(*HISTORY_ORDERING)
+        if window.last_created_at is not None:
+            query = query.filter(
+                keyset_filter(
+                    HISTORY_ORDERING, (window.last_created_at, window.last_id)
+                )
+            )
+        messages = list(query)
+        if not messages:
+            return window
+
+        for message in messages:
+            content_type = message.content["type"]
+            if content_type == "AUTONOMOUS":
+                window.autonomous = bool(message.content["enabled"])
+            if content_type not in EXCLUDED_MSG_TYPES:
+                formatted = message.as_message()
+                token_count = self.get_token_count(message, formatted)
+                window.append(formatted, token_count, content_type)
+        window.last_created_at = messages[-1].created_at
+        window.last_id = messages[-1].id
+        evicted = window.evict(settings.MESSAGE_HISTORY_TOKEN_BUDGET)
+
+        logger.debug(
+            f"Updated message history task_id={task_id} read={len(messages)} "
+            f"evicted={evicted} window={len(window.messages)} "
+            f"tokens={window.total_tokens}"
+        )
+        self.set(task_id, window)
+        return window
+
+    async def aupdate(self, task_id: Union[str, UUID]) -> HistoryWindow:
+        return await sync_to_async(self.update)(task_id)
+
+
+message_history_cache = MessageHistoryCache()
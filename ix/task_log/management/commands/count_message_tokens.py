@@ -0,0 +1,52 @@
+from itertools import islice
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ix.task_log.models import TaskLogMessage
+from ix.utils.count_tokens import count_message_tokens
+
+
+class Command(BaseCommand):
+    """
+    Counts tokens for messages saved before token counts were stored. Messages
+    are encoded in batches and written with bulk_update.
+
+    Example:
+        ./manage.py count_message_tokens --batch-size 1000
+    """
+
+    help = "Stores token counts for messages that don't have one."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--model", default=None)
+
+    def handle(self, *args, **options):
+        model = options["model"] or settings.MESSAGE_HISTORY_TOKEN_MODEL
+        batch_size = options["batch_size"]
+        messages = (
+            TaskLogMessage.objects.filter(token_count__isnull=True)
+            .order_by("created_at", "id")
+            .iterator(chunk_size=batch_size)
+        )
+
+        total = 0
+        while batch := list(islice(messages, batch_size)):
+            counted = []
+            formatted = []
+            for message in batch:
+                try:
+                    formatted.append(message.as_message())
+                except (KeyError, TypeError) as e:
+                    self.stderr.write(f"Skipping message={message.id}: {e}")
+                    continue
+                counted.append(message)
+
+            token_counts = count_message_tokens(formatted, model)
+            for message, token_count in zip(counted, token_counts):
+                message.token_count = token_count
+            TaskLogMessage.objects.bulk_update(counted, ["token_count"])
+            total += len(counted)
+
+        self.stdout.write(f"Counted tokens for {total} messages")
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.6 on 2026-10-18 18:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task_log", "0012_task_root_tasklogmessage_root"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="tasklogmessage",
+            index=models.Index(
+                fields=["task", "created_at", "id"], name="task_log_message_keyset_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.6 on 2026-10-18 18:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task_log", "0013_tasklogmessage_keyset_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tasklogmessage",
+            name="token_count",
+            field=models.PositiveIntegerField(blank=True, default=None, null=True),
+        ),
+    ]
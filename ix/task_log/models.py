@@ -1,13 +1,18 @@
 import json
+import logging
 import uuid
 from typing import TypedDict, Optional, List
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import models
 from ix.agents.models import Agent
 from ix.chains.models import Chain
 from ix.commands.filesystem import read_file
 from ix.ix_users.models import OwnedModel
+from ix.utils.count_tokens import count_message_tokens
+
+logger = logging.getLogger(__name__)
 
 
 class Task(models.Model):
@@ -116,12 +121,39 @@ class TaskLogMessage(models.Model):
     role = models.CharField(max_length=16, choices=ROLE_CHOICES)
     content = models.JSONField()
 
+    # tokens used by `as_message()`, counted when the content is saved
+    token_count = models.PositiveIntegerField(null=True, blank=True, default=None)
+
     class Meta:
         ordering = ["created_at"]
+        indexes = [
+            # keyset pagination of a task's messages
+            models.Index(
+                fields=["task", "created_at", "id"],
+                name="task_log_message_keyset_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"TaskLogMessage {self.id} ({self.role}, {self.content['type']})"
 
+    def count_tokens(self) -> Optional[int]:
+        try:
+            return count_message_tokens(
+                [self.as_message()], settings.MESSAGE_HISTORY_TOKEN_MODEL
+            )[0]
+        except Exception as e:
+            logger.warning(f"Failed to count tokens for message={self.id}: {e}")
+            return None
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "content" in update_fields:
+            self.token_count = self.count_tokens()
+            if update_fields is not None:
+                kwargs["update_fields"] = [*update_fields, "token_count"]
+        super().save(*args, **kwargs)
+
     def as_message(self):
         content = self.content.copy()
         content_type = content.pop("type")
@@ -140,6 +172,8 @@ class TaskLogMessage(models.Model):
             content_str = content["feedback"]
         elif content_type == "THINK":
             content_str = content["input"]
+        elif content_type == "ASSISTANT":
+            content_str = content["text"]
         else:
             # default to dumping json datum
             content_str = json.dumps(content, sort_keys=True)
@@ -0,0 +1,242 @@
+import pytest
+from langchain.schema.messages import AIMessage, HumanMessage
+
+from ix.memory.task_log import TaskLogMessageHistory
+from ix.task_log.history import HistoryWindow, MessageHistoryCache
+from ix.task_log.models import TaskLogMessage
+from ix.task_log.tests.fake import (
+    fake_autonomous_toggle,
+    fake_chat,
+    fake_feedback,
+    fake_task,
+    fake_task_log_msg,
+    fake_think,
+)
+
+
+def count_words(message) -> int:
+    return len(str(message["content"]).split())
+
+
+def command(text: str) -> dict:
+    return {"type": "FEEDBACK", "feedback": text}
+
+
+def count_message_words(message: TaskLogMessage) -> int:
+    return count_words(message.as_message())
+
+
+@pytest.fixture
+def cache(settings, mocker):
+    settings.MESSAGE_HISTORY_CACHE_ALIAS = ""
+    settings.MESSAGE_HISTORY_TOKEN_BUDGET = 0
+    mocker.patch.object(TaskLogMessage, "count_tokens", count_message_words)
+    yield MessageHistoryCache(token_counter=count_words)
+
+
+class TestHistoryWindow:
+    def window(self, *tokens: int) -> HistoryWindow:
+        window = HistoryWindow()
+        for i, token_count in enumerate(tokens):
+            window.append({"role": "user", "content": str(i)}, token_count, "FEEDBACK")
+        return window
+
+    def test_evict(self):
+        window = self.window(3, 2, 2, 1)
+        assert window.evict(4) == 2
+        assert window.messages == [
+            {"role": "user", "content": "2"},
+            {"role": "user", "content": "3"},
+        ]
+        assert window.tokens == [2, 1]
+        assert window.types == ["FEEDBACK", "FEEDBACK"]
+
+    def test_evict_keeps_newest(self):
+        window = self.window(3, 10)
+        assert window.evict(5) == 1
+        assert window.tokens == [10]
+
+    def test_evict_no_budget(self):
+        window = self.window(3, 10)
+        assert window.evict(0) == 0
+        assert window.tokens == [3, 10]
+
+    def test_copy(self):
+        window = self.window(1)
+        copy = window.copy()
+        copy.append({"role": "user", "content": "x"}, 1, "FEEDBACK")
+        assert len(window.messages) == 1
+
+
+def test_lru(settings):
+    settings.MESSAGE_HISTORY_CACHE_ALIAS = ""
+    cache = MessageHistoryCache(maxsize=1, token_counter=count_words)
+    cache.set("a", HistoryWindow())
+    cache.set("b", HistoryWindow())
+    assert cache.get("a") is None
+    assert cache.get("b") == HistoryWindow()
+
+
+@pytest.mark.django_db
+class TestMessageHistoryCache:
+    def test_update(self, cache, task):
+        msg1 = fake_task_log_msg(task=task, content=command("one"))
+        window = cache.update(task.id)
+        assert window.messages == [msg1.as_message()]
+        assert window.last_id == msg1.id
+
+        # only new messages are read
+        msg2 = fake_task_log_msg(task=task, content=command("two"))
+        window = cache.update(task.id)
+        assert window.messages == [msg1.as_message(), msg2.as_message()]
+        assert window.tokens == [1, 1]
+
+    def test_saved_token_count(self, cache, task, mocker):
+        msg = fake_task_log_msg(task=task, content=command("one two"))
+        assert msg.token_count == 2
+
+        # saved counts are used, messages aren't counted again
+        cache.token_counter = mocker.Mock()
+        assert cache.update(task.id).tokens == [2]
+        cache.token_counter.assert_not_called()
+
+    def test_missing_token_count(self, cache, task):
+        msg = fake_task_log_msg(task=task, content=command("one two"))
+        TaskLogMessage.objects.filter(id=msg.id).update(token_count=None)
+        assert cache.update(task.id).tokens == [2]
+
+    def test_update_no_new_messages(self, cache, task):
+        fake_task_log_msg(task=task, content=command("one"))
+        window = cache.update(task.id)
+        assert cache.update(task.id) == window
+
+    def test_excluded_types(self, cache, task):
+        fake_task_log_msg(task=task, content={"type": "SYSTEM", "message": "x"})
+        msg = fake_task_log_msg(task=task, content=command("one"))
+        window = cache.update(task.id)
+        assert window.messages == [msg.as_message()]
+        assert window.last_id == msg.id
+
+    def test_load_token_budget(self, cache, task, settings):
+        settings.MESSAGE_HISTORY_TOKEN_BUDGET = 4
+        fake_task_log_msg(task=task, content=command("one two"))
+        msg2 = fake_task_log_msg(task=task, content=command("three four"))
+        msg3 = fake_task_log_msg(task=task, content=command("five six"))
+        window = cache.update(task.id)
+        assert window.messages == [msg2.as_message(), msg3.as_message()]
+        assert window.last_id == msg3.id
+
+    def test_update_token_budget(self, cache, task, settings):
+        settings.MESSAGE_HISTORY_TOKEN_BUDGET = 4
+        fake_task_log_msg(task=task, content=command("one two"))
+        cache.update(task.id)
+
+        msg2 = fake_task_log_msg(task=task, content=command("three four"))
+        msg3 = fake_task_log_msg(task=task, content=command("five six"))
+        window = cache.update(task.id)
+        assert window.messages == [msg2.as_message(), msg3.as_message()]
+        assert window.total_tokens == 4
+
+    def test_autonomous(self, cache, task):
+        assert cache.update(task.id).autonomous is None
+        fake_autonomous_toggle(enabled=1, task=task)
+        assert cache.update(task.id).autonomous is True
+        fake_autonomous_toggle(enabled=0, task=task)
+        assert cache.update(task.id).autonomous is False
+
+        # initial load reads the latest toggle
+        cache.invalidate(task.id)
+        assert cache.update(task.id).autonomous is False
+
+    def test_invalidate(self, cache, task):
+        fake_task_log_msg(task=task, content=command("one"))
+        cache.update(task.id)
+        task.messages.all().delete()
+        cache.invalidate(task.id)
+        assert cache.update(task.id).messages == []
+
+
+@pytest.mark.django_db
+class TestTokenCount:
+    @pytest.fixture(autouse=True)
+    def word_counts(self, mocker):
+        mocker.patch.object(TaskLogMessage, "count_tokens", count_message_words)
+
+    def test_counted_on_create(self, task):
+        msg = fake_task_log_msg(task=task, content=command("one two"))
+        msg.refresh_from_db()
+        assert msg.token_count == 2
+
+    def test_counted_on_content_update(self, task):
+        msg = fake_task_log_msg(
+            task=task,
+            role="ASSISTANT",
+            content={"type": "ASSISTANT", "text": "", "stream": True},
+        )
+        msg.content["text"] = "one two three"
+        msg.save(update_fields=["content"])
+        msg.refresh_from_db()
+        assert msg.token_count == 3
+
+
+@pytest.mark.django_db
+def test_token_count_error(task):
+    # messages are saved without a count if they can't be counted
+    msg = fake_task_log_msg(task=task, content={"type": "FEEDBACK"})
+    assert msg.token_count is None
+
+
+@pytest.mark.django_db
+class TestTaskLogMessageHistory:
+    @pytest.fixture(autouse=True)
+    def cache(self, mocker, cache):
+        mocker.patch("ix.memory.task_log.message_history_cache", cache)
+        yield cache
+
+    def test_messages(self, task):
+        chat = fake_chat(task=task)
+        fake_think(task=task)
+        fake_task_log_msg(
+            task=task,
+            role="ASSISTANT",
+            content={"type": "ASSISTANT", "text": "hi there"},
+        )
+
+        history = TaskLogMessageHistory(session_id=f"chat_{chat.id}")
+        assert history.messages == [
+            HumanMessage(content="create a django app for cat memes"),
+            AIMessage(content="hi there"),
+        ]
+
+        # messages are written by the chat, not the memory
+        history.add_ai_message("ignored")
+        assert len(history.messages) == 2
+
+    def test_subtask_replies(self, task):
+        # each run writes its reply to a subtask of the chat's task
+        chat = fake_chat(task=task)
+        subtask = fake_task(parent=task)
+        fake_task_log_msg(
+            task=subtask,
+            role="ASSISTANT",
+            content={"type": "ASSISTANT", "text": "hi there"},
+        )
+
+        history = TaskLogMessageHistory(session_id=f"chat_{chat.id}")
+        assert history.messages == [
+            HumanMessage(content="create a django app for cat memes"),
+            AIMessage(content="hi there"),
+        ]
+
+        # replies written after the window is cached are read on update
+        fake_task_log_msg(
+            task=fake_task(parent=task),
+            role="ASSISTANT",
+            content={"type": "ASSISTANT", "text": "again"},
+        )
+        assert history.messages[-1] == AIMessage(content="again")
+
+    def test_task_scope(self, task):
+        fake_feedback(task=task, feedback="hello", message_id=-1)
+        history = TaskLogMessageHistory(session_id=f"prefix_task_{task.id}")
+        assert history.messages == [HumanMessage(content="hello")]
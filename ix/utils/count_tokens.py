@@ -1,73 +1,92 @@
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
+
 import tiktoken
 
+logger = logging.getLogger(__name__)
 
-def num_tokens_from_messages(messages, model="gpt-3.5-turbo-0301"):
-    """Returns the number of tokens used by a list of messages."""
+DEFAULT_MODEL = "gpt-3.5-turbo-0301"
+DEFAULT_ENCODING = "cl100k_base"
+
+# every reply is primed with <|start|>assistant<|message|>
+REPLY_PRIMING_TOKENS = 3
+
+# texts encoded at once before threads are worth starting for a batch
+BATCH_THREAD_THRESHOLD = 32
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str) -> tiktoken.Encoding:
+    """
+    Encoding for a model, loaded once per process. Models tiktoken doesn't know
+    use cl100k_base, the encoding of current chat models.
+    """
     try:
-        encoding = tiktoken.encoding_for_model(model)
+        return tiktoken.encoding_for_model(model)
     except KeyError:
-        print("Warning: model not found. Using cl100k_base encoding.")
-        encoding = tiktoken.get_encoding("cl100k_base")
-    if model == "gpt-3.5-turbo":
-        print(
-            "Warning: gpt-3.5-turbo may change over time. Returning num tokens assuming gpt-3.5-turbo-0301."
-        )
-        return num_tokens_from_messages(messages, model="gpt-3.5-turbo-0301")
-    elif model == "gpt-4":
-        print(
-            "Warning: gpt-4 may change over time. Returning num tokens assuming gpt-4-0314."
-        )
-        return num_tokens_from_messages(messages, model="gpt-4-0314")
-    elif model == "gpt-3.5-turbo-0301":
-        tokens_per_message = (
-            4  # every message follows <|start|>{role/name}\n{content}<|end|>\n
-        )
-        tokens_per_name = -1  # if there's a name, the role is omitted
-    elif model == "gpt-4-0314":
-        tokens_per_message = 3
-        tokens_per_name = 1
-    else:
-        raise NotImplementedError(
-            f"""num_tokens_from_messages() is not implemented for model {model}. See
-            https://github.com/openai/openai-python/blob/main/chatml.md for information
-            on how messages are converted to tokens."""
-        )
-    num_tokens = 0
-    for message in messages:
-        num_tokens += tokens_per_message
+        logger.debug(f"no encoding for model={model}, using {DEFAULT_ENCODING}")
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+
+
+def get_message_overhead(model: str) -> Tuple[int, int]:
+    """
+    Tokens added per message and per `name` key by the chat format. See
+    https://github.com/openai/openai-python/blob/main/chatml.md
+    """
+    if model in {"gpt-3.5-turbo-0301", "gpt-35-turbo-0301"}:
+        # every message follows <|start|>{role/name}\n{content}<|end|>\n
+        # if there's a name, the role is omitted
+        return 4, -1
+    return 3, 1
+
+
+def count_tokens(text: str, model: str = DEFAULT_MODEL) -> int:
+    """Returns the number of tokens in a string."""
+    return len(get_encoding(model).encode_ordinary(text))
+
+
+def count_tokens_batch(texts: Sequence[str], model: str = DEFAULT_MODEL) -> List[int]:
+    """Returns the number of tokens in each string. Large batches are encoded
+    by tiktoken's thread pool."""
+    encoding = get_encoding(model)
+    if len(texts) < BATCH_THREAD_THRESHOLD:
+        return [len(encoding.encode_ordinary(text)) for text in texts]
+    return [len(tokens) for tokens in encoding.encode_ordinary_batch(list(texts))]
+
+
+def to_text(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def count_message_tokens(
+    messages: Sequence[Dict[str, Any]], model: str = DEFAULT_MODEL
+) -> List[int]:
+    """
+    Returns the number of tokens used by each message, including the chat format
+    overhead. The values of all messages are encoded as one batch.
+    """
+    tokens_per_message, tokens_per_name = get_message_overhead(model)
+    counts = [tokens_per_message] * len(messages)
+    texts = []
+    owners = []
+    for i, message in enumerate(messages):
         for key, value in message.items():
-            num_tokens += len(encoding.encode(value))
+            texts.append(to_text(value))
+            owners.append(i)
             if key == "name":
-                num_tokens += tokens_per_name
-    num_tokens += 3  # every reply is primed with <|start|>assistant<|message|>
-    return num_tokens
+                counts[i] += tokens_per_name
 
+    for i, token_count in zip(owners, count_tokens_batch(texts, model)):
+        counts[i] += token_count
+    return counts
 
-def count_tokens(text, model="gpt-3.5-turbo-0301"):
-    """Returns the number of tokens in a string."""
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        print("Warning: model not found. Using cl100k_base encoding.")
-        encoding = tiktoken.get_encoding("cl100k_base")
-    if model == "gpt-3.5-turbo":
-        print(
-            "Warning: gpt-3.5-turbo may change over time. Returning num tokens assuming gpt-3.5-turbo-0301."
-        )
-        return count_tokens(text, model="gpt-3.5-turbo-0301")
-    elif model == "gpt-4":
-        print(
-            "Warning: gpt-4 may change over time. Returning num tokens assuming gpt-4-0314."
-        )
-        return count_tokens(text, model="gpt-4-0314")
-    elif model == "gpt-3.5-turbo-0301":
-        pass
-    elif model == "gpt-4-0314":
-        pass
-    else:
-        raise NotImplementedError(
-            f"""num_tokens_from_messages() is not implemented for model {model}. See
-            https://github.com/openai/openai-python/blob/main/chatml.md for information
-            on how messages are converted to tokens."""
-        )
-    return len(encoding.encode(text))
+
+def num_tokens_from_messages(
+    messages: Sequence[Dict[str, Any]], model: str = DEFAULT_MODEL
+) -> int:
+    """Returns the number of tokens used by a list of messages."""
+    return sum(count_message_tokens(messages, model)) + REPLY_PRIMING_TOKENS
@@ -1,8 +1,14 @@
-from typing import List, TypeVar, Generic
+import base64
+import binascii
+import datetime
+import json
+from typing import Any, List, Literal, Optional, Sequence, Tuple, TypeVar, Generic
 
+from asgiref.sync import sync_to_async
 from pydantic import BaseModel
 from django.core.paginator import Paginator
-from django.db.models import QuerySet
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q, QuerySet
 from graphene import Int, ObjectType, Boolean
 
 
@@ -108,3 +114,149 @@ class QueryPage(BaseModel, Generic[T]):
             has_previous=page.has_previous(),
             objects=objects,
         )
+
+
+CountMode = Literal["none", "estimate", "exact"]
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """DjangoJSONEncoder truncates datetimes to milliseconds, cursors need them
+    exactly or rows sharing a millisecond are skipped."""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    data = json.dumps(list(values), cls=CursorEncoder)
+    return base64.urlsafe_b64encode(data.encode()).decode()
+
+
+def decode_cursor(cursor: str, queryset: QuerySet, ordering: Sequence[str]) -> list:
+    """Decode a cursor into the values of the ordering fields"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor(f"invalid cursor: {cursor}")
+    if not isinstance(values, list) or len(values) != len(ordering):
+        raise InvalidCursor(f"invalid cursor: {cursor}")
+
+    opts = queryset.model._meta
+    try:
+        return [
+            opts.get_field(field.lstrip("-")).to_python(value)
+            for field, value in zip(ordering, values)
+        ]
+    except Exception:
+        raise InvalidCursor(f"invalid cursor: {cursor}")
+
+
+def keyset_filter(ordering: Sequence[str], values: Sequence[Any]) -> Q:
+    """
+    Filter for rows after `values` in `ordering`, e.g. for ("-created_at", "-id"):
+    created_at < v0 OR (created_at = v0 AND id < v1)
+    """
+    condition = Q()
+    for i, field in enumerate(ordering):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        term = Q()
+        for previous, value in zip(ordering[:i], values[:i]):
+            term &= Q(**{previous.lstrip("-"): value})
+        condition |= term & Q(**{f"{name}__{lookup}": values[i]})
+    return condition
+
+
+def estimate_count(queryset: QuerySet) -> int:
+    """Row estimate from the query planner. Doesn't scan the table."""
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """
+    Keyset paginated result set.
+
+    Pages are read by filtering on the ordering fields of the last row of the
+    previous page, rather than with OFFSET, so deep pages cost the same as the
+    first. `next_cursor` is passed back to read the following page.
+
+    Attributes:
+        next_cursor (str): Cursor for the next page, if there is one.
+        has_next (bool): Indicates if there is a next page.
+        count (int): Total count of items, if requested.
+        count_is_estimate (bool): Indicates if count is the planner's estimate.
+    """
+
+    next_cursor: Optional[str] = None
+    has_next: bool
+    count: Optional[int] = None
+    count_is_estimate: bool = False
+    objects: List[T]
+
+    @classmethod
+    async def apaginate(
+        cls,
+        output_model: BaseModel,
+        queryset: QuerySet,
+        ordering: Tuple[str, ...] = ("created_at", "id"),
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        count: CountMode = "none",
+    ) -> "CursorPage":
+        """
+        Paginates a queryset with a cursor and returns a CursorPage instance.
+
+        Args:
+            queryset (QuerySet): The original queryset to paginate.
+            ordering (Tuple[str]): Fields to order by. The last field must be
+                unique, e.g. id. Prefix with `-` for descending order.
+            limit (int): The maximum number of items per page.
+            cursor (str): The cursor returned with the previous page. An empty
+                cursor reads the first page.
+            count (str): none, estimate, or exact.
+
+        Raises:
+            InvalidCursor: if the cursor can't be decoded.
+        """
+        limit = limit if limit is not None else 10
+        page_query = queryset.order_by(*ordering)
+        if cursor:
+            values = decode_cursor(cursor, queryset, ordering)
+            page_query = page_query.filter(keyset_filter(ordering, values))
+
+        def fetch():
+            rows = list(page_query[: limit + 1])
+            return (
+                rows[:limit],
+                len(rows) > limit,
+                [output_model.from_orm(obj).dict() for obj in rows[:limit]],
+            )
+
+        rows, has_next, objects = await sync_to_async(fetch)()
+        next_cursor = None
+        if has_next:
+            last = rows[-1]
+            next_cursor = encode_cursor(
+                [getattr(last, field.lstrip("-")) for field in ordering]
+            )
+
+        total = None
+        if count == "exact":
+            total = await queryset.acount()
+        elif count == "estimate":
+            total = await sync_to_async(estimate_count)(queryset)
+
+        return cls(
+            next_cursor=next_cursor,
+            has_next=has_next,
+            count=total,
+            count_is_estimate=count == "estimate",
+            objects=objects,
+        )
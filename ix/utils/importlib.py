@@ -1,15 +1,13 @@
+import functools
 import importlib
 import logging
-from typing import Type
+from typing import Dict, Iterable, Optional, Tuple, Type
 
 
 logger = logging.getLogger(__name__)
 
 
-def _import_class(class_path: str) -> Type:
-    """
-    inner class to facilitate test mocking across all uses of `import_class`
-    """
+def _resolve_class(class_path: str) -> Type:
     try:
         module_path, class_name = class_path.rsplit(".", 1)
     except Exception as e:
@@ -33,6 +31,54 @@ def _import_class(class_path: str) -> Type:
     return getattr(module, class_name)
 
 
+@functools.lru_cache(maxsize=2048)
+def _cached_resolve_class(
+    class_path: str,
+) -> Tuple[Optional[Type], Optional[Tuple[Type[Exception], tuple]]]:
+    """
+    Resolve a class_path once. Failures are cached too so that paths that can't be
+    imported (e.g. optional dependencies) don't retry every fallback on each load.
+    """
+    try:
+        return _resolve_class(class_path), None
+    except (ImportError, AttributeError, ValueError) as e:
+        return None, (type(e), e.args)
+
+
+def _import_class(class_path: str) -> Type:
+    """
+    inner class to facilitate test mocking across all uses of `import_class`
+    """
+    class_, error = _cached_resolve_class(class_path)
+    if error:
+        # raise a new exception each time so tracebacks don't accumulate
+        error_class, args = error
+        raise error_class(*args)
+    return class_
+
+
+def clear_import_cache() -> None:
+    """Clear resolved and failed class paths, e.g. after installing a package."""
+    _cached_resolve_class.cache_clear()
+
+
+def warm_import_cache(class_paths: Iterable[str]) -> Dict[str, str]:
+    """
+    Import class paths ahead of time so the first load doesn't pay for importing
+    heavy modules.
+
+    Returns:
+        dict of class_path to error message for paths that failed to import.
+    """
+    errors = {}
+    for class_path in class_paths:
+        try:
+            _import_class(class_path)
+        except Exception as e:
+            errors[class_path] = str(e)
+    return errors
+
+
 def import_class(class_path: str) -> Type:
     """
     Import a class from a string representation of its fully qualified name.
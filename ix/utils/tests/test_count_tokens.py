@@ -0,0 +1,87 @@
+import pytest
+import tiktoken
+
+from ix.utils import count_tokens as module
+from ix.utils.count_tokens import (
+    BATCH_THREAD_THRESHOLD,
+    count_message_tokens,
+    count_tokens,
+    count_tokens_batch,
+    get_encoding,
+    num_tokens_from_messages,
+)
+
+# one token per byte, so tests don't download tiktoken's encodings
+BYTE_ENCODING = tiktoken.Encoding(
+    name="bytes",
+    pat_str=r"[\s\S]",
+    mergeable_ranks={bytes([i]): i for i in range(256)},
+    special_tokens={},
+)
+
+
+@pytest.fixture
+def encoding(mocker):
+    mocker.patch.object(module, "get_encoding", return_value=BYTE_ENCODING)
+
+
+@pytest.mark.usefixtures("encoding")
+class TestCountTokens:
+    def test_count_tokens(self):
+        assert count_tokens("hello") == 5
+        assert count_tokens("<|endoftext|>") == 13
+
+    def test_count_tokens_batch(self):
+        assert count_tokens_batch(["a", "bc", ""]) == [1, 2, 0]
+
+        # large batches are encoded by tiktoken's thread pool
+        texts = ["x" * i for i in range(BATCH_THREAD_THRESHOLD + 1)]
+        assert count_tokens_batch(texts) == list(range(BATCH_THREAD_THRESHOLD + 1))
+
+    def test_count_message_tokens(self):
+        messages = [
+            {"role": "user", "content": "hello"},
+            {"role": "assistant", "content": "hi", "name": "bot"},
+        ]
+        assert count_message_tokens(messages, "gpt-4") == [3 + 4 + 5, 3 + 9 + 2 + 3 + 1]
+        assert count_message_tokens(messages, "gpt-3.5-turbo-0301") == [
+            4 + 4 + 5,
+            4 + 9 + 2 + 3 - 1,
+        ]
+
+    def test_count_message_tokens_non_string(self):
+        messages = [{"role": "user", "content": {"b": 1, "a": 2}}]
+        assert count_message_tokens(messages, "gpt-4") == [
+            3 + 4 + len('{"a": 2, "b": 1}')
+        ]
+
+    def test_num_tokens_from_messages(self):
+        messages = [{"role": "user", "content": "hello"}] * 2
+        assert num_tokens_from_messages(messages, "gpt-4") == 12 * 2 + 3
+        assert num_tokens_from_messages([], "gpt-4") == 3
+
+    @pytest.mark.parametrize("model", ["gpt-4-1106-preview", "claude-2"])
+    def test_any_model(self, model):
+        assert num_tokens_from_messages([{"role": "user", "content": "a"}], model) > 0
+
+
+class TestGetEncoding:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        get_encoding.cache_clear()
+        yield
+        get_encoding.cache_clear()
+
+    def test_cached(self, mocker):
+        encoding_for_model = mocker.patch.object(
+            tiktoken, "encoding_for_model", return_value=BYTE_ENCODING
+        )
+        assert get_encoding("gpt-4") is BYTE_ENCODING
+        assert get_encoding("gpt-4") is BYTE_ENCODING
+        encoding_for_model.assert_called_once_with("gpt-4")
+
+    def test_unknown_model(self, mocker):
+        mocker.patch.object(tiktoken, "encoding_for_model", side_effect=KeyError())
+        get = mocker.patch.object(tiktoken, "get_encoding", return_value=BYTE_ENCODING)
+        assert get_encoding("unknown") is BYTE_ENCODING
+        get.assert_called_once_with("cl100k_base")
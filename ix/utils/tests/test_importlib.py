@@ -0,0 +1,60 @@
+from collections import OrderedDict
+
+import pytest
+
+from ix.utils import importlib as ix_importlib
+from ix.utils.importlib import (
+    clear_import_cache,
+    import_class,
+    warm_import_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_import_cache():
+    clear_import_cache()
+    yield
+    clear_import_cache()
+
+
+class TestImportClass:
+    def test_import_class(self):
+        assert import_class("collections.OrderedDict") is OrderedDict
+
+    def test_import_attribute(self):
+        """class paths may reference an attribute of a class"""
+        assert import_class("collections.OrderedDict.fromkeys") == OrderedDict.fromkeys
+
+    def test_cached(self, mocker):
+        spy = mocker.spy(ix_importlib, "_resolve_class")
+        import_class("collections.OrderedDict")
+        import_class("collections.OrderedDict")
+        assert spy.call_count == 1
+
+    def test_failure_cached(self, mocker):
+        spy = mocker.spy(ix_importlib, "_resolve_class")
+        for _ in range(2):
+            with pytest.raises(ModuleNotFoundError):
+                import_class("does_not_exist.Foo")
+            with pytest.raises(AttributeError):
+                import_class("collections.DoesNotExist")
+        assert spy.call_count == 2
+
+    def test_clear(self, mocker):
+        spy = mocker.spy(ix_importlib, "_resolve_class")
+        import_class("collections.OrderedDict")
+        clear_import_cache()
+        import_class("collections.OrderedDict")
+        assert spy.call_count == 2
+
+
+class TestWarmImportCache:
+    def test_warm(self, mocker):
+        errors = warm_import_cache(
+            ["collections.OrderedDict", "does_not_exist.Foo", "collections.Missing"]
+        )
+        assert set(errors) == {"does_not_exist.Foo", "collections.Missing"}
+
+        spy = mocker.spy(ix_importlib, "_resolve_class")
+        import_class("collections.OrderedDict")
+        assert spy.call_count == 0
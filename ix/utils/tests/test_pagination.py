@@ -0,0 +1,59 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from django.db.models import Q
+
+from ix.task_log.models import TaskLogMessage
+from ix.utils.graphene.pagination import (
+    InvalidCursor,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+)
+
+ORDERING = ("created_at", "id")
+
+
+class TestCursor:
+    def test_round_trip(self):
+        created_at = datetime(2023, 10, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        id = uuid4()
+        cursor = encode_cursor([created_at, id])
+        assert decode_cursor(cursor, TaskLogMessage.objects.all(), ORDERING) == [
+            created_at,
+            id,
+        ]
+
+    def test_descending_fields(self):
+        id = uuid4()
+        cursor = encode_cursor(["2023-10-01T00:00:00Z", id])
+        values = decode_cursor(
+            cursor, TaskLogMessage.objects.all(), ("-created_at", "-id")
+        )
+        assert values[1] == id
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not base64!",
+            encode_cursor(["2023-10-01T00:00:00Z"]),
+            encode_cursor(["not a date", "e3a3b4a6-8a2e-4c8c-9d65-1b3b6f0c2a10"]),
+            encode_cursor({"created_at": "2023-10-01T00:00:00Z"}),
+        ],
+    )
+    def test_invalid(self, cursor):
+        with pytest.raises(InvalidCursor):
+            decode_cursor(cursor, TaskLogMessage.objects.all(), ORDERING)
+
+
+class TestKeysetFilter:
+    def test_ascending(self):
+        assert keyset_filter(ORDERING, [1, 2]) == Q(created_at__gt=1) | (
+            Q(created_at=1) & Q(id__gt=2)
+        )
+
+    def test_descending(self):
+        assert keyset_filter(("-name", "-id"), ["a", 2]) == Q(name__lt="a") | (
+            Q(name="a") & Q(id__lt=2)
+        )